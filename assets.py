@@ -0,0 +1,314 @@
+"""Pipeline des sprites : versions pré-mises à l'échelle, cachées sur disque.
+
+Les PNG de `images/` font 1 à 2 Mo alors que le jeu les affiche entre 20 et
+400 px. Chaque sprite est déclaré avec sa taille en jeu (`SPRITES`), ainsi
+que ses variantes dérivées (`VARIANTS` : orientations, teinte oxydée…).
+`SpriteAssetCache` les stocke en RGBA brut à leur taille finale : un
+lancement à chaud ne décode plus aucun PNG source, et son coût suit le
+nombre de pixels affichés plutôt que le poids des fichiers d'origine.
+
+Une entrée est valide tant que la source garde le même mtime et la même
+taille ; sinon son empreinte SHA-1 tranche (un `touch` ne force pas de
+reconstruction). `python3 tools/build_sprite_cache.py` pré-construit tout.
+
+Le registre est paresseux : un sprite n'est chargé qu'à son premier `get`.
+`prefetch(noms)` signale ceux dont l'écran suivant aura besoin ; `pump()`
+les charge un par un, entre deux frames, sans provoquer d'à-coup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+from simulation import (
+    ASTRO_SPRITE_SIZE,
+    CROQUETTE_SPRITE_SIZES,
+    HYPER_PICKUP_SIZE,
+    WATER_ITEM_SIZE,
+)
+
+CACHE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+OXIDIZED_TINT = (130, 190, 90, 175)
+DEAD_SPRITE_SIZE = (120, 120)  # taille de la tête d'AstroPaws (écran VS)
+
+# Nom → (fichier source dans images/, taille en jeu).
+SPRITES: dict[str, tuple[str, tuple[int, int]]] = {
+    "astro_right": ("astro_paws.png", (ASTRO_SPRITE_SIZE, ASTRO_SPRITE_SIZE)),
+    "brown_croquette": ("browncroquette.png", CROQUETTE_SPRITE_SIZES["normal"]),
+    "gold_croquette": ("goldcroquette.png", CROQUETTE_SPRITE_SIZES["rare"]),
+    "water": ("water.png", (WATER_ITEM_SIZE, WATER_ITEM_SIZE)),
+    "heart": ("heart.png", (20, 20)),
+    "welcome": ("ecranaccueil.png", (400, 300)),
+    "chat_sleep": ("chatdort.png", (360, 240)),
+    "astro_head": ("astro_paws_head.png", DEAD_SPRITE_SIZE),
+    "mouse": ("badguymouse.png", (20, 20)),
+    "rat": ("badguyrat.png", (30, 30)),
+    "dog": ("badguydog.png", (50, 50)),
+    "mouse_dead": ("badguymouse_dead.png", DEAD_SPRITE_SIZE),
+    "rat_dead": ("badguyrat_dead.png", DEAD_SPRITE_SIZE),
+    "dog_dead": ("badguydog_dog.png", DEAD_SPRITE_SIZE),
+    "gameover": ("gameover.png", (400, 200)),
+    "youwin": ("youwin.png", (400, 200)),
+    "doctor": ("astropaws_doctor.png", (150, 150)),
+    "shield_icon": ("shield_icon.png", (48, 48)),
+    "hyper_icon": ("hyper_icon.png", (48, 48)),
+    "ingredient_icon": ("ingredient_icon.png", (48, 48)),
+    "ingredient_poulet": ("ingredient_poulet.png", (48, 48)),
+    "ingredient_thon": ("ingredient_thon.png", (48, 48)),
+    "ingredient_carotte": ("ingredient_carotte.png", (48, 48)),
+    "ingredient_fragment_croquette": ("ingredient_fragment_croquette.png", (48, 48)),
+}
+
+
+def make_oxidized_variant(sprite: pygame.Surface) -> pygame.Surface:
+    variant = sprite.copy()
+    tint = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
+    tint.fill(OXIDIZED_TINT)
+    variant.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return variant
+
+
+def flip_x(sprite: pygame.Surface) -> pygame.Surface:
+    return pygame.transform.flip(sprite, True, False)
+
+
+def rotate_left(sprite: pygame.Surface) -> pygame.Surface:
+    return pygame.transform.rotate(sprite, 90)
+
+
+def rotate_right(sprite: pygame.Surface) -> pygame.Surface:
+    return pygame.transform.rotate(sprite, -90)
+
+
+def hyper_pickup(sprite: pygame.Surface) -> pygame.Surface:
+    return pygame.transform.scale(sprite, (HYPER_PICKUP_SIZE, HYPER_PICKUP_SIZE))
+
+
+# Nom → (sprite de base, opération). Le nom de l'opération entre dans la clé
+# de cache : le renommer (ou changer son code) impose de changer ce nom.
+VARIANTS: dict[str, tuple[str, str]] = {
+    "astro_left": ("astro_right", "flip_x"),
+    "astro_up": ("astro_right", "rotate_left"),
+    "astro_down": ("astro_right", "rotate_right"),
+    "brown_croquette_oxidized": ("brown_croquette", "oxidized"),
+    "gold_croquette_oxidized": ("gold_croquette", "oxidized"),
+    "hyper_pickup": ("hyper_icon", f"scale{HYPER_PICKUP_SIZE}"),
+}
+
+VARIANT_BUILDERS: dict[str, Callable[[pygame.Surface], pygame.Surface]] = {
+    "flip_x": flip_x,
+    "rotate_left": rotate_left,
+    "rotate_right": rotate_right,
+    "oxidized": make_oxidized_variant,
+    f"scale{HYPER_PICKUP_SIZE}": hyper_pickup,
+}
+
+
+def file_sha1(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    # Écriture atomique : un lancement concurrent ne lit jamais un fichier tronqué.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+class SpriteAssetCache:
+    def __init__(self, image_dir: Path, cache_dir: Path | None = None) -> None:
+        self.image_dir = Path(image_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.hits = 0
+        self.builds = 0
+        self.decoded_bytes = 0
+        self.prefetched = 0
+        self._surfaces: dict[str, pygame.Surface] = {}
+        self._pending: deque[str] = deque()
+        self._manifest: dict[str, dict] = {}
+        self._sources: dict[str, dict] = {}
+        self._dirty = False
+        if self.cache_dir is not None:
+            try:
+                manifest = json.loads((self.cache_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+                if manifest.get("version") == CACHE_FORMAT_VERSION:
+                    self._manifest = manifest.get("entries", {})
+            except (OSError, ValueError):
+                pass  # pas de cache (ou illisible) : tout sera reconstruit
+
+    # --- Validation des sources -------------------------------------------
+
+    def _source_signature(self, filename: str) -> dict:
+        signature = self._sources.get(filename)
+        if signature is None:
+            stat = (self.image_dir / filename).stat()
+            signature = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            self._sources[filename] = signature
+        return signature
+
+    def _source_matches(self, filename: str, recorded: dict) -> bool:
+        current = self._source_signature(filename)
+        if current["mtime_ns"] == recorded.get("mtime_ns") and current["size"] == recorded.get("size"):
+            return True
+        if current["size"] != recorded.get("size"):
+            return False
+        # mtime modifié (copie, checkout) : le contenu décide.
+        sha1 = current.get("sha1") or file_sha1(self.image_dir / filename)
+        current["sha1"] = sha1
+        if sha1 != recorded.get("sha1"):
+            return False
+        recorded["mtime_ns"] = current["mtime_ns"]
+        self._dirty = True
+        return True
+
+    def _source_record(self, filename: str) -> dict:
+        current = self._source_signature(filename)
+        if "sha1" not in current:
+            current["sha1"] = file_sha1(self.image_dir / filename)
+        return dict(current)
+
+    # --- Lecture / écriture des entrées -----------------------------------
+
+    def _entry_key(self, name: str) -> tuple[str, str, str]:
+        """(fichier source, clé d'entrée, nom du fichier de cache)."""
+        if name in VARIANTS:
+            base, operation = VARIANTS[name]
+            filename, _key, base_file = self._entry_key(base)
+            key = f"{base_file[:-5]}_{operation}"
+            return filename, key, f"{key}.rgba"
+        filename, (width, height) = SPRITES[name]
+        key = f"{Path(filename).stem}_{width}x{height}"
+        return filename, key, f"{key}.rgba"
+
+    def _load_entry(self, filename: str, key: str, cache_file: str) -> pygame.Surface | None:
+        if self.cache_dir is None:
+            return None
+        entry = self._manifest.get(key)
+        if entry is None or not self._source_matches(filename, entry["source"]):
+            return None
+        try:
+            data = (self.cache_dir / cache_file).read_bytes()
+        except OSError:
+            return None
+        size = tuple(entry["size"])
+        if len(data) != size[0] * size[1] * 4:
+            return None
+        return pygame.image.frombuffer(data, size, "RGBA")
+
+    def _store_entry(self, filename: str, key: str, cache_file: str, surface: pygame.Surface) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.cache_dir / cache_file, pygame.image.tobytes(surface, "RGBA"))
+        except (OSError, pygame.error):
+            return  # cache en lecture seule : le jeu reste jouable
+        self._manifest[key] = {
+            "size": list(surface.get_size()),
+            "source": self._source_record(filename),
+        }
+        self._dirty = True
+
+    def _build(self, name: str) -> pygame.Surface:
+        if name in VARIANTS:
+            base, operation = VARIANTS[name]
+            return VARIANT_BUILDERS[operation](self.get(base))
+        filename, size = SPRITES[name]
+        path = self.image_dir / filename
+        self.decoded_bytes += path.stat().st_size
+        original = pygame.image.load(str(path))
+        if pygame.display.get_surface() is not None:
+            original = original.convert_alpha()
+        return pygame.transform.scale(original, size)
+
+    @staticmethod
+    def _for_display(surface: pygame.Surface) -> pygame.Surface:
+        # Sans fenêtre (outil de build), la surface reste au format RGBA brut.
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    # --- API publique -----------------------------------------------------
+
+    def __contains__(self, name: str) -> bool:
+        return name in SPRITES or name in VARIANTS
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._surfaces
+
+    def get(self, name: str) -> pygame.Surface:
+        surface = self._surfaces.get(name)
+        if surface is not None:
+            return surface
+        filename, key, cache_file = self._entry_key(name)
+        surface = self._load_entry(filename, key, cache_file)
+        if surface is not None:
+            self.hits += 1
+        else:
+            surface = self._build(name)
+            self.builds += 1
+            self._store_entry(filename, key, cache_file, surface)
+        surface = self._for_display(surface)
+        self._surfaces[name] = surface
+        return surface
+
+    def prefetch(self, names) -> None:
+        """Indice : ces sprites serviront bientôt (chargés par `pump`)."""
+        for name in names:
+            if name not in self._surfaces and name not in self._pending:
+                self._pending.append(name)
+
+    def pump(self, max_items: int = 1) -> int:
+        """Charge au plus `max_items` sprites en attente ; renvoie le nombre chargé."""
+        loaded = 0
+        while self._pending and loaded < max_items:
+            name = self._pending.popleft()
+            if name in self._surfaces:
+                continue
+            self.get(name)
+            self.prefetched += 1
+            loaded += 1
+        if loaded:
+            # Les entrées (re)construites sont enregistrées au fil de l'eau.
+            self.save_manifest()
+        return loaded
+
+    def build_all(self) -> int:
+        for name in list(SPRITES) + list(VARIANTS):
+            self.get(name)
+        return len(self._surfaces)
+
+    def save_manifest(self) -> None:
+        if self.cache_dir is None or not self._dirty:
+            return
+        payload = {"version": CACHE_FORMAT_VERSION, "entries": self._manifest}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.cache_dir / MANIFEST_NAME, json.dumps(payload, indent=1, sort_keys=True).encode("utf-8"))
+        except OSError:
+            return
+        self._dirty = False
+
+    def stats(self) -> dict:
+        return {
+            "name": "sprite_assets",
+            "entries": len(self._surfaces),
+            "cache_hits": self.hits,
+            "builds": self.builds,
+            "decoded_source_bytes": self.decoded_bytes,
+            "prefetched": self.prefetched,
+            "pending": len(self._pending),
+        }
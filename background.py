@@ -0,0 +1,181 @@
+"""Fond spatial en couches de parallaxe pré-dessinées.
+
+Les étoiles sont réparties en quelques couches selon leur vitesse. Chaque
+couche est dessinée une seule fois sur une surface à clé de couleur (RLE) puis
+simplement décalée à chaque frame : le coût de rendu ne dépend plus du nombre
+d'étoiles. Les planètes, peu nombreuses, gardent chacune leur propre vitesse
+(elles portent la gravité) : un sprite pré-dessiné par planète, déplacé seul.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pygame
+
+STAR_COLOR = (255, 255, 255)
+STAR_RADIUS = 1
+STAR_SPEED_RANGE = (0.2, 1.0)
+STAR_LAYER_COUNT = 3
+STAR_DRIFT_Y = 0.5
+PLANET_SIZE_RANGE = (8, 20)
+PLANET_SPEED_RANGE = (0.1, 0.5)
+PLANET_DRIFT_Y = 0.2
+LAYER_COLORKEY = (0, 0, 0)
+
+
+class ScrollLayer:
+    def __init__(self, width: int, height: int, speed_x: float, speed_y: float) -> None:
+        self.width = width
+        self.height = height
+        self.speed_x = speed_x
+        self.speed_y = speed_y
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.surface = pygame.Surface((width, height))
+        self.clear()
+
+    def clear(self) -> None:
+        self.surface.set_colorkey(None)
+        self.surface.fill(LAYER_COLORKEY)
+
+    def finalize(self) -> None:
+        # RLE : les grandes zones vides ne coûtent presque rien au blit.
+        self.surface.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+
+    def draw_circle(self, color: tuple[int, int, int], x: float, y: float, radius: int) -> None:
+        # Dessine aussi les copies qui débordent sur le bord opposé (tuilage).
+        for dx in (-self.width, 0, self.width):
+            if not -radius <= x + dx <= self.width + radius:
+                continue
+            for dy in (-self.height, 0, self.height):
+                if -radius <= y + dy <= self.height + radius:
+                    pygame.draw.circle(self.surface, color, (int(x + dx), int(y + dy)), radius)
+
+    def scroll(self, steps: float = 1.0) -> None:
+        self.offset_x = (self.offset_x + self.speed_x * steps) % self.width
+        self.offset_y = (self.offset_y + self.speed_y * steps) % self.height
+
+    def to_screen(self, x: float, y: float) -> tuple[float, float]:
+        return (x + self.offset_x) % self.width, (y + self.offset_y) % self.height
+
+    def draw(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        # alpha < 1 : décalage interpolé entre le pas précédent et le courant.
+        back = 1.0 - alpha
+        ox = int((self.offset_x - self.speed_x * back) % self.width)
+        oy = int((self.offset_y - self.speed_y * back) % self.height)
+        target.blit(self.surface, (ox, oy))
+        if ox:
+            target.blit(self.surface, (ox - self.width, oy))
+        if oy:
+            target.blit(self.surface, (ox, oy - self.height))
+            if ox:
+                target.blit(self.surface, (ox - self.width, oy - self.height))
+
+
+class ParallaxBackground:
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        num_stars: int = 50,
+        num_planets: int = 3,
+        rng: random.Random | None = None,
+        star_layer_count: int = STAR_LAYER_COUNT,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.num_stars = num_stars
+        self.num_planets = num_planets
+        self.rng = rng if rng is not None else random.Random()
+        low, high = STAR_SPEED_RANGE
+        band = (high - low) / star_layer_count
+        self.star_layers = [
+            ScrollLayer(width, height, speed, speed * STAR_DRIFT_Y)
+            for speed in (low + band * (i + 0.5) for i in range(star_layer_count))
+        ]
+        # Positions dans le repère de chaque couche (avant décalage).
+        self.stars: list[tuple[int, float, float]] = []
+        # Planètes exposées pour la gravité : x/y (centre, écran) avancent à
+        # la vitesse propre de chaque planète.
+        self.planets: list[dict] = []
+        self.regenerate()
+
+    def reset(self) -> None:
+        # Décalages remis à zéro : le fond ne dépend plus que de son générateur.
+        for layer in self.star_layers:
+            layer.offset_x = 0.0
+            layer.offset_y = 0.0
+        self.regenerate()
+
+    def regenerate(self) -> None:
+        self.regenerate_stars()
+        self.regenerate_planets()
+
+    def regenerate_stars(self) -> None:
+        rng = self.rng
+        low, high = STAR_SPEED_RANGE
+        layer_count = len(self.star_layers)
+        self.stars = []
+        for layer in self.star_layers:
+            layer.clear()
+        for _ in range(self.num_stars):
+            x = rng.randint(0, self.width)
+            y = rng.randint(0, self.height)
+            speed = rng.uniform(low, high)
+            layer_idx = min(layer_count - 1, int((speed - low) / (high - low) * layer_count))
+            layer = self.star_layers[layer_idx]
+            # Position relative au décalage courant : l'étoile apparaît en (x, y).
+            local_x = (x - layer.offset_x) % self.width
+            local_y = (y - layer.offset_y) % self.height
+            self.stars.append((layer_idx, local_x, local_y))
+            layer.draw_circle(STAR_COLOR, local_x, local_y, STAR_RADIUS)
+        for layer in self.star_layers:
+            layer.finalize()
+
+    def regenerate_planets(self) -> None:
+        rng = self.rng
+        self.planets = []
+        for _ in range(self.num_planets):
+            x = rng.randint(0, self.width)
+            y = rng.randint(0, self.height)
+            size = rng.randint(*PLANET_SIZE_RANGE)
+            speed = rng.uniform(*PLANET_SPEED_RANGE)
+            color = (rng.randint(50, 255), rng.randint(50, 255), rng.randint(50, 255))
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1))
+            sprite.fill(LAYER_COLORKEY)
+            pygame.draw.circle(sprite, color, (size, size), size)
+            sprite.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            self.planets.append({
+                'x': float(x), 'y': float(y), 'size': size, 'speed': speed,
+                'color': color, 'sprite': sprite,
+            })
+
+    def update(self, steps: float = 1.0) -> None:
+        for layer in self.star_layers:
+            layer.scroll(steps)
+        for planet in self.planets:
+            planet['x'] = (planet['x'] + planet['speed'] * steps) % self.width
+            planet['y'] = (planet['y'] + planet['speed'] * PLANET_DRIFT_Y * steps) % self.height
+
+    def draw_planet(self, target: pygame.Surface, planet: dict, alpha: float = 1.0) -> None:
+        back = 1.0 - alpha
+        size = planet['size']
+        x = (planet['x'] - planet['speed'] * back) % self.width
+        y = (planet['y'] - planet['speed'] * PLANET_DRIFT_Y * back) % self.height
+        # Copies sur le bord opposé pendant que la planète en franchit un.
+        for dx in (-self.width, 0, self.width):
+            if not -size <= x + dx <= self.width + size:
+                continue
+            for dy in (-self.height, 0, self.height):
+                if -size <= y + dy <= self.height + size:
+                    target.blit(planet['sprite'], (int(x + dx) - size, int(y + dy) - size))
+
+    def draw(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        for layer in self.star_layers:
+            layer.draw(target, alpha)
+        for planet in self.planets:
+            self.draw_planet(target, planet, alpha)
+
+    def star_positions(self) -> list[tuple[float, float]]:
+        return [self.star_layers[idx].to_screen(x, y) for idx, x, y in self.stars]
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Benchmark d'AstroPaws : temps de frame, coût par étape et allocations.
+
+Chaque scénario de bench/scenarios.py est joué dans son propre processus par
+le vrai jeu (main.py, pilote vidéo `dummy`, graine fixe, un pas de simulation
+par frame et aucune attente entre frames). Après quelques frames de chauffe,
+le profileur de main.py (profiling.py) enregistre les frames ; le rapport
+JSON donne les percentiles p50/p95/p99 du temps de frame, le temps moyen par
+étape et, dans une seconde passe sous `tracemalloc`, les allocations par
+frame.
+
+    python3 bench/run_bench.py [--scenario NOM ...] [--frames 600] [--no-alloc]
+    python3 bench/run_bench.py --compare bench/results/avant.json
+
+Le rapport (clés triées, valeurs arrondies) se compare d'une version à l'autre
+avec `--compare` ou un simple diff.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from profiling import percentile  # noqa: E402
+
+REPORT_SCHEMA = 1
+DEFAULT_FRAMES = 600
+DEFAULT_ALLOC_FRAMES = 200
+DEFAULT_WARMUP_FRAMES = 120
+BENCH_SEED = "1234"
+# Garde-fou : un scénario qui n'atteint jamais sa charge est abandonné.
+MAX_SETUP_SECONDS = 60
+DEFAULT_OUTPUT = REPO_ROOT / "bench" / "results" / "latest.json"
+
+
+def run_child(name: str, frames: int, warmup: int, alloc: bool, out_path: str) -> int:
+    """Joue un scénario dans ce processus et écrit les frames mesurées dans `out_path`."""
+    from scenarios import SCENARIOS
+
+    scenario = SCENARIOS[name]
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["ASTROPAWS_SEED"] = BENCH_SEED
+    os.environ.pop("ASTROPAWS_REPLAY", None)
+    os.environ.update(scenario.env)
+    os.chdir(REPO_ROOT)
+
+    import tracemalloc
+
+    import pygame
+    import levels
+    from simulation import TICK_MS
+
+    class BenchClock:
+        # Une frame = exactement un pas de simulation, sans attente : chaque
+        # frame mesurée porte la même charge, quelle que soit la machine.
+        def tick(self, _framerate: float = 0) -> float:
+            return TICK_MS
+
+    pygame.time.Clock = BenchClock  # type: ignore[assignment]
+
+    # Objectifs inatteignables : le niveau ne se termine pas pendant la mesure.
+    for conf in levels.levels:
+        conf["target_score"] = 10**9
+
+    setup_deadline = time.monotonic() + MAX_SETUP_SECONDS
+    state = {"setup_done": False, "warmup_left": warmup, "measuring": False, "frames": None}
+    original_get = pygame.event.get
+
+    def scripted_events(*args, **kwargs):
+        original_get(*args, **kwargs)  # vide la file du pilote dummy
+        module = sys.modules.get("main")
+        game_state = getattr(module, "game_state", None)
+        profiler = getattr(module, "frame_profiler", None)
+
+        if state["measuring"]:
+            if profiler.frame_count > frames:
+                state["frames"] = [record.to_dict() for record in profiler.frames]
+                profiler.enabled = False
+                if alloc:
+                    tracemalloc.stop()
+                return [pygame.event.Event(pygame.QUIT)]
+            if scenario.ready(module):
+                return scenario.drive(module)
+
+        if not state["measuring"] and time.monotonic() > setup_deadline:
+            raise RuntimeError(f"scénario {name} : charge jamais atteinte (état {game_state})")
+        # Retour au scénario (fin de la Story, intro…), y compris pendant la mesure
+        if game_state == "MENU":
+            return [pygame.event.Event(pygame.KEYDOWN, key=scenario.entry_key)]
+        if game_state in ("LEVEL_INTRO", "BOSS_INTRO"):
+            return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c)]
+        if state["measuring"]:
+            return []
+        if not state["setup_done"] and (game_state == "PLAYING" or scenario.ready(module)):
+            scenario.setup(module)
+            state["setup_done"] = True
+            return []
+        if state["setup_done"] and scenario.ready(module):
+            events = scenario.drive(module)
+            state["warmup_left"] -= 1
+            if state["warmup_left"] <= 0:
+                # +1 : la frame en cours n'est close qu'à la suivante.
+                profiler.reset(history=frames + 1)
+                profiler.enabled = True
+                if alloc:
+                    tracemalloc.start()
+                state["measuring"] = True
+            return events
+        return []
+
+    pygame.event.get = scripted_events  # type: ignore[assignment]
+    original_exit = sys.exit
+    sys.exit = lambda _code=0: None  # type: ignore[assignment]
+    try:
+        importlib.import_module("main")
+    finally:
+        sys.exit = original_exit
+
+    if state["frames"] is None:
+        raise RuntimeError(f"scénario {name} : le jeu s'est arrêté avant la fin de la mesure")
+    with open(out_path, "w", encoding="utf-8") as handle:
+        json.dump(state["frames"], handle)
+    return 0
+
+
+def summarize(values: list[float]) -> dict:
+    if not values:
+        return {}
+    return {
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "mean": round(sum(values) / len(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def summarize_timing(frames: list[dict]) -> dict:
+    frame_ms = [frame["frame_ms"] for frame in frames]
+    stage_names = sorted({stage for frame in frames for stage in frame["stages"]})
+    stages = {}
+    for stage in stage_names:
+        values = [frame["stages"].get(stage, 0.0) for frame in frames]
+        stages[stage] = {
+            "mean": round(sum(values) / len(values), 3),
+            "p95": round(percentile(values, 95), 3),
+        }
+    mean_ms = sum(frame_ms) / len(frame_ms)
+    return {
+        "frames": len(frames),
+        "frame_ms": summarize(frame_ms),
+        "fps_mean": round(1000.0 / mean_ms, 1) if mean_ms > 0 else None,
+        "stages_ms": stages,
+    }
+
+
+def summarize_alloc(frames: list[dict]) -> dict:
+    peak_kib = [frame["alloc_peak_bytes"] / 1024 for frame in frames if frame["alloc_peak_bytes"] is not None]
+    blocks = [frame["alloc_blocks"] for frame in frames]
+    return {
+        "frames": len(frames),
+        "peak_kib_per_frame": summarize(peak_kib),
+        "net_blocks_per_frame": round(sum(blocks) / len(blocks), 2),
+    }
+
+
+def run_scenario(name: str, frames: int, warmup: int, alloc: bool) -> list[dict]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_path = os.path.join(tmp_dir, "frames.json")
+        command = [
+            sys.executable, __file__, "--child", name,
+            "--frames", str(frames), "--warmup", str(warmup), "--out", out_path,
+        ]
+        if alloc:
+            command.append("--alloc")
+        proc = subprocess.run(command, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"scénario {name} en échec :\n{proc.stderr.strip()}")
+        with open(out_path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+
+def git_revision() -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True,
+        )
+    except OSError:
+        return None
+    return proc.stdout.strip() or None
+
+
+def build_report(names: list[str], frames: int, alloc_frames: int, warmup: int) -> dict:
+    import pygame
+
+    from scenarios import SCENARIOS
+
+    report = {
+        "schema": REPORT_SCHEMA,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "seed": int(BENCH_SEED),
+        "warmup_frames": warmup,
+        "scenarios": {},
+    }
+    for name in names:
+        scenario = SCENARIOS[name]
+        print(f"[bench] {name}: {scenario.description}", flush=True)
+        entry = {"description": scenario.description, "env": scenario.env}
+        entry["timing"] = summarize_timing(run_scenario(name, frames, warmup, alloc=False))
+        if alloc_frames > 0:
+            entry["alloc"] = summarize_alloc(run_scenario(name, alloc_frames, warmup, alloc=True))
+        report["scenarios"][name] = entry
+        timing = entry["timing"]["frame_ms"]
+        print(f"[bench]   frame p50={timing['p50']} p95={timing['p95']} p99={timing['p99']} ms", flush=True)
+    return report
+
+
+def compare_reports(base: dict, current: dict) -> None:
+    print(f"{'scénario':<20} {'pct':<4} {'avant':>9} {'après':>9} {'écart':>8}")
+    for name, entry in current["scenarios"].items():
+        previous = base.get("scenarios", {}).get(name)
+        if previous is None:
+            print(f"{name:<20} (absent du rapport de référence)")
+            continue
+        for pct in ("p50", "p95", "p99"):
+            before = previous["timing"]["frame_ms"][pct]
+            after = entry["timing"]["frame_ms"][pct]
+            delta = (after - before) / before * 100 if before else 0.0
+            print(f"{name:<20} {pct:<4} {before:>9.3f} {after:>9.3f} {delta:>+7.1f}%")
+
+
+def main() -> int:
+    from scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="répétable ; tous par défaut")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--alloc-frames", type=int, default=DEFAULT_ALLOC_FRAMES)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP_FRAMES)
+    parser.add_argument("--no-alloc", action="store_true", help="saute la passe tracemalloc")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path, help="rapport de référence à comparer")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--alloc", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.child, args.frames, args.warmup, args.alloc, args.out)
+
+    names = args.scenario or list(SCENARIOS)
+    alloc_frames = 0 if args.no_alloc else args.alloc_frames
+    report = build_report(names, args.frames, alloc_frames, args.warmup)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True, ensure_ascii=False)
+        handle.write("\n")
+    print(f"[bench] rapport : {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            compare_reports(json.load(handle), report)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
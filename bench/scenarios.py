@@ -0,0 +1,183 @@
+"""Scénarios de charge du benchmark, joués par le vrai chemin de rendu de main.py.
+
+Chaque scénario dit comment y entrer depuis le menu (`entry_key`), quand la
+charge visée est atteinte (`ready`), et ce qu'il faut réimposer à chaque
+frame (`drive`) pour la maintenir : vies et bouclier figés pour que la partie
+ne s'arrête pas, spawns poussés au maximum, rafales du boss, etc. Comme dans
+phase0_smoke_test.py, les événements sont injectés via `pygame.event.get`.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+import pygame
+
+# Vies réimposées à chaque frame : aucune fin de partie pendant la mesure.
+PINNED_LIVES = 9
+
+
+class BenchScenario:
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        entry_key: int = pygame.K_SPACE,
+        env: dict[str, str] | None = None,
+        setup: Callable | None = None,
+        ready: Callable | None = None,
+        drive: Callable | None = None,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.entry_key = entry_key
+        self.env = env or {}
+        self._setup = setup
+        self._ready = ready or is_playing
+        self._drive = drive
+
+    def setup(self, module) -> None:
+        if self._setup is not None:
+            self._setup(module)
+
+    def ready(self, module) -> bool:
+        return self._ready(module)
+
+    def drive(self, module) -> list[pygame.event.Event]:
+        if self._drive is None:
+            return []
+        return self._drive(module) or []
+
+
+def is_playing(module) -> bool:
+    return module.game_state == "PLAYING"
+
+
+def keep_player_alive(module) -> None:
+    game = module.game
+    game.lives = PINNED_LIVES
+    # Bouclier permanent : pas de vie perdue, donc pas de hit-stop pendant la mesure.
+    game.shield_active = True
+    game.shield_start_time = game.now
+    module.hit_stop.clear()
+
+
+def drive_playing(module) -> None:
+    keep_player_alive(module)
+
+
+def setup_max_spawn(module) -> None:
+    game = module.game
+    game.level_idx = 2
+    # Le score pousse la probabilité de spawn à son plafond.
+    game.score = 10_000
+
+
+def setup_boss(module) -> None:
+    game = module.game
+    game.level_idx = len(module.levels.levels) - 1
+    game.start_boss_fight()
+
+
+def is_boss_fight(module) -> bool:
+    return module.game_state == "PLAYING" and module.game.boss_active
+
+
+def drive_boss_storm(module) -> None:
+    keep_player_alive(module)
+    boss = module.game.boss_data
+    # Phase 3 (sous le tiers des PV) et une rafale à chaque pas simulé.
+    boss['health'] = int(boss['max_health'] * 0.3)
+    boss['last_shot'] = module.game.now - 1000
+
+
+# Couronne de projectiles ajoutée à chaque pas du scénario bullet_hell.
+RING_SIZE = 48
+RING_SPEED = 2.2
+
+
+def drive_bullet_hell(module) -> None:
+    drive_boss_storm(module)
+    game = module.game
+    boss = game.boss_data
+    angles = [game.now / 500 + math.tau * idx / RING_SIZE for idx in range(RING_SIZE)]
+    game.boss_projectiles.spawn_many(
+        boss['x'] + boss['width'] // 2,
+        boss['y'] + boss['height'] // 2,
+        [math.cos(angle) * RING_SPEED for angle in angles],
+        [math.sin(angle) * RING_SPEED for angle in angles],
+        5,
+        (255, 60, 120),
+        220,
+    )
+
+
+def drive_hyper_dash(module) -> list[pygame.event.Event]:
+    keep_player_alive(module)
+    game = module.game
+    game.hyper_charges = 3
+    if not game.hyper_active:
+        return [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_j)]
+    return []
+
+
+def is_story(module) -> bool:
+    return module.game_state == "STORY"
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        BenchScenario(
+            "level3_max_spawn",
+            "Niveau 3, probabilité de spawn au plafond",
+            setup=setup_max_spawn,
+            drive=drive_playing,
+        ),
+        BenchScenario(
+            "boss_phase3_storm",
+            "Boss en phase 3, une rafale de projectiles par pas",
+            setup=setup_boss,
+            ready=is_boss_fight,
+            drive=drive_boss_storm,
+        ),
+        BenchScenario(
+            "boss_bullet_hell",
+            "Boss en phase 3 plus une couronne de 48 projectiles par frame (plusieurs milliers à l'écran)",
+            setup=setup_boss,
+            ready=is_boss_fight,
+            drive=drive_bullet_hell,
+        ),
+        BenchScenario(
+            "croquette_rain",
+            "Niveau 3, pluie de croquettes : des centaines de croquettes, oxydées en chute",
+            env={"ASTROPAWS_CROQUETTE_RAIN": "1"},
+            setup=setup_max_spawn,
+            drive=drive_playing,
+        ),
+        BenchScenario(
+            "hyper_dash_trails",
+            "Dash Hyperdrive enchaîné : traînées de particules continues",
+            drive=drive_hyper_dash,
+        ),
+        BenchScenario(
+            "playing_crt_full",
+            "Niveau 1, filtre CRT complet",
+            env={"ASTROPAWS_CRT": "full"},
+            drive=drive_playing,
+        ),
+        BenchScenario(
+            "playing_crt_off",
+            "Niveau 1, filtre CRT désactivé",
+            env={"ASTROPAWS_CRT": "off"},
+            drive=drive_playing,
+        ),
+        BenchScenario(
+            "story_scroll",
+            "Défilement de l'écran Story",
+            entry_key=pygame.K_s,
+            ready=is_story,
+        ),
+    )
+}
@@ -0,0 +1,234 @@
+"""Filtre CRT : calques scanlines + vignette et post-traitement par frame.
+
+Les masques alpha sont calculés d'un bloc avec NumPy via `pygame.surfarray`
+(repli en Python pur si NumPy est absent), puis mis en cache sur disque :
+les lancements suivants se contentent de recharger deux PNG.
+
+`CRTPostProcess` fusionne ces calques en un seul overlay précomposé et
+réutilise un tampon persistant pour l'effet de rémanence, avec trois
+niveaux de qualité : off / cheap (overlay seul) / full (rémanence + overlay).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from pathlib import Path
+
+import pygame
+
+try:
+    import numpy
+except ImportError:  # NumPy reste optionnel.
+    numpy = None
+
+SCANLINE_SPACING = 4
+SCANLINE_ALPHA = 50
+VIGNETTE_MAX_ALPHA = 90
+VIGNETTE_EXPONENT = 2.2
+CACHE_FORMAT_VERSION = 1
+GHOST_ALPHA = 18
+GHOST_OFFSET = (1, 0)
+CRT_TIERS = ("off", "cheap", "full")
+
+
+def build_scanlines_numpy(width: int, height: int, spacing: int, alpha: int) -> pygame.Surface:
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    mask = numpy.zeros((width, height), dtype=numpy.uint8)
+    mask[:, ::spacing] = alpha
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[...] = mask
+    del pixels  # libère le verrou de la surface
+    return surface
+
+
+def build_vignette_numpy(width: int, height: int, max_alpha: int, exponent: float) -> pygame.Surface:
+    center_x, center_y = width / 2, height / 2
+    max_dist = math.hypot(center_x, center_y)
+    xs = numpy.arange(width, dtype=numpy.float64) - center_x
+    ys = numpy.arange(height, dtype=numpy.float64) - center_y
+    dist = numpy.hypot(xs[:, None], ys[None, :])
+    alpha = numpy.clip((dist / max_dist) ** exponent * max_alpha, 0, max_alpha)
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels_alpha(surface)
+    pixels[...] = alpha.astype(numpy.uint8)
+    del pixels
+    return surface
+
+
+def surface_from_alpha_bytes(width: int, height: int, alpha: bytes) -> pygame.Surface:
+    # Pixels noirs dont seul le canal alpha varie (ligne par ligne).
+    rgba = bytearray(width * height * 4)
+    rgba[3::4] = alpha
+    return pygame.image.frombuffer(bytes(rgba), (width, height), "RGBA").convert_alpha()
+
+
+def build_scanlines_python(width: int, height: int, spacing: int, alpha: int) -> pygame.Surface:
+    rows = bytearray(width * height)
+    lit_row = bytes([alpha]) * width
+    for y in range(0, height, spacing):
+        rows[y * width:(y + 1) * width] = lit_row
+    return surface_from_alpha_bytes(width, height, bytes(rows))
+
+
+def build_vignette_python(width: int, height: int, max_alpha: int, exponent: float) -> pygame.Surface:
+    center_x, center_y = width / 2, height / 2
+    max_dist = math.hypot(center_x, center_y)
+    rows_by_dy: dict[float, bytes] = {}
+    alpha = bytearray()
+    for y in range(height):
+        dy = abs(y - center_y)
+        row = rows_by_dy.get(dy)
+        if row is None:
+            # La vignette est symétrique : une ligne sert pour y et son miroir.
+            row = bytes(
+                int(max(0, min(max_alpha, (math.hypot(x - center_x, dy) / max_dist) ** exponent * max_alpha)))
+                for x in range(width)
+            )
+            rows_by_dy[dy] = row
+        alpha += row
+    return surface_from_alpha_bytes(width, height, bytes(alpha))
+
+
+def build_crt_overlays(
+    width: int,
+    height: int,
+    spacing: int = SCANLINE_SPACING,
+    scanline_alpha: int = SCANLINE_ALPHA,
+    vignette_alpha: int = VIGNETTE_MAX_ALPHA,
+    vignette_exponent: float = VIGNETTE_EXPONENT,
+) -> tuple[pygame.Surface, pygame.Surface]:
+    if numpy is not None:
+        return (
+            build_scanlines_numpy(width, height, spacing, scanline_alpha),
+            build_vignette_numpy(width, height, vignette_alpha, vignette_exponent),
+        )
+    return (
+        build_scanlines_python(width, height, spacing, scanline_alpha),
+        build_vignette_python(width, height, vignette_alpha, vignette_exponent),
+    )
+
+
+def overlay_cache_stem(
+    width: int,
+    height: int,
+    spacing: int,
+    scanline_alpha: int,
+    vignette_alpha: int,
+    vignette_exponent: float,
+) -> str:
+    return (
+        f"crt_v{CACHE_FORMAT_VERSION}_{width}x{height}"
+        f"_s{spacing}a{scanline_alpha}_v{vignette_alpha}e{vignette_exponent:g}"
+    )
+
+
+def save_surface(surface: pygame.Surface, path: Path) -> None:
+    # Écriture atomique : un lancement concurrent ne lit jamais un PNG tronqué.
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.png")
+    pygame.image.save(surface, str(tmp_path))
+    os.replace(tmp_path, path)
+
+
+def load_crt_overlays(
+    width: int,
+    height: int,
+    cache_dir: Path | None = None,
+    spacing: int = SCANLINE_SPACING,
+    scanline_alpha: int = SCANLINE_ALPHA,
+    vignette_alpha: int = VIGNETTE_MAX_ALPHA,
+    vignette_exponent: float = VIGNETTE_EXPONENT,
+) -> tuple[pygame.Surface, pygame.Surface]:
+    params = (width, height, spacing, scanline_alpha, vignette_alpha, vignette_exponent)
+    if cache_dir is None:
+        return build_crt_overlays(*params)
+
+    stem = overlay_cache_stem(*params)
+    scanline_path = cache_dir / f"{stem}_scanlines.png"
+    vignette_path = cache_dir / f"{stem}_vignette.png"
+    if scanline_path.exists() and vignette_path.exists():
+        try:
+            return (
+                pygame.image.load(str(scanline_path)).convert_alpha(),
+                pygame.image.load(str(vignette_path)).convert_alpha(),
+            )
+        except pygame.error:
+            pass  # cache corrompu : on reconstruit
+
+    scanlines, vignette = build_crt_overlays(*params)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        save_surface(scanlines, scanline_path)
+        save_surface(vignette, vignette_path)
+    except (OSError, pygame.error):
+        pass  # cache en lecture seule : le jeu reste jouable
+    return scanlines, vignette
+
+
+def precompose_overlay(scanlines: pygame.Surface, vignette: pygame.Surface) -> pygame.Surface:
+    # Noir sur noir : un seul blit de l'overlay fusionné équivaut aux deux blits.
+    overlay = vignette.copy()
+    overlay.blit(scanlines, (0, 0))
+    return overlay
+
+
+class CRTPostProcess:
+    def __init__(
+        self,
+        size: tuple[int, int],
+        scanlines: pygame.Surface,
+        vignette: pygame.Surface,
+        tier: str = "full",
+    ) -> None:
+        self.overlay = precompose_overlay(scanlines, vignette)
+        self.ghost = pygame.Surface(size).convert()
+        self.ghost.set_alpha(GHOST_ALPHA)
+        self.tier = tier if tier in CRT_TIERS else "full"
+        # Coût moyen mesuré en jeu (ms), par niveau de qualité.
+        self.tier_cost_ms = {name: 0.0 for name in CRT_TIERS}
+        self.measured = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.tier != "off"
+
+    def set_tier(self, tier: str) -> None:
+        if tier in CRT_TIERS:
+            self.tier = tier
+
+    def cycle_tier(self) -> str:
+        # full -> cheap -> off -> full
+        index = CRT_TIERS.index(self.tier)
+        self.tier = CRT_TIERS[(index - 1) % len(CRT_TIERS)]
+        return self.tier
+
+    def render(self, target: pygame.Surface, tier: str) -> None:
+        if tier == "off":
+            return
+        if tier == "full":
+            self.ghost.blit(target, (0, 0))
+            target.blit(self.ghost, GHOST_OFFSET)
+        target.blit(self.overlay, (0, 0))
+
+    def apply(self, target: pygame.Surface) -> None:
+        started = time.perf_counter()
+        self.render(target, self.tier)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        previous = self.tier_cost_ms[self.tier]
+        self.tier_cost_ms[self.tier] = elapsed_ms if previous == 0.0 else previous * 0.95 + elapsed_ms * 0.05
+
+    def measure_tier_costs(self, target: pygame.Surface, frames: int = 10) -> dict[str, float]:
+        # Banc d'essai sur une copie de la cible : coût moyen par frame (ms).
+        # Les niveaux pas encore mesurés en jeu partent de cette valeur.
+        scratch = target.copy()
+        costs = {}
+        for tier in CRT_TIERS:
+            started = time.perf_counter()
+            for _ in range(frames):
+                self.render(scratch, tier)
+            costs[tier] = (time.perf_counter() - started) * 1000.0 / max(1, frames)
+            if self.tier_cost_ms[tier] == 0.0:
+                self.tier_cost_ms[tier] = costs[tier]
+        self.measured = True
+        return costs
@@ -0,0 +1,134 @@
+"""Panneau « Hall of Fame » mis en cache, avec pages et défilement.
+
+La surface du panneau n'est recomposée que si son contenu change : nouvelle
+liste de scores, nouvelle partie mise en évidence, ou fenêtre de lignes
+visible différente (défilement). Les lignes sont rendues à la demande,
+uniquement quand elles deviennent visibles, puis gardées jusqu'au prochain
+changement de liste : un classement de plusieurs centaines d'entrées ne
+coûte pas plus qu'un classement de quatre.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pygame
+
+PANEL_WIDTH = 300
+ROW_HEIGHT = 22
+ROWS_TOP = 24
+PANEL_BG = (8, 8, 18, 140)
+BORDER_COLOR = (145, 145, 190, 130)
+TITLE_COLOR = (255, 223, 0)
+TEXT_COLOR = (255, 255, 255)
+HIGHLIGHT_COLOR = (0, 255, 255)
+PAGE_COLOR = (170, 170, 200)
+
+
+def panel_height(max_rows: int) -> int:
+    return 42 + max_rows * ROW_HEIGHT
+
+
+class HighscorePanel:
+    def __init__(self, font: pygame.font.Font, format_row: Callable[[dict], str]) -> None:
+        self.font = font
+        self.format_row = format_row
+        self.first_row = 0
+        self.rebuilds = 0
+        self.row_renders = 0
+        self._entries: list[dict] | None = None
+        self._highlight: str | None = None
+        self._rows: dict[int, tuple[pygame.Surface, pygame.Surface]] = {}
+        # Une surface par hauteur de panneau (le menu et les fins de partie diffèrent).
+        self._panels: dict[int, pygame.Surface] = {}
+        self._keys: dict[int, tuple] = {}
+
+    def invalidate(self) -> None:
+        """À appeler si la liste a été modifiée sur place."""
+        self._rows.clear()
+        self._keys.clear()
+
+    def _sync(self, entries: list[dict], highlight: str | None, max_rows: int) -> None:
+        if entries is self._entries and highlight == self._highlight:
+            return
+        new_highlight = highlight is not None and highlight != self._highlight
+        self._entries = entries
+        self._highlight = highlight
+        self.invalidate()
+        if new_highlight:
+            # La partie qui vient d'être classée est amenée à l'écran.
+            for idx, entry in enumerate(entries):
+                if entry.get("stamp") == highlight:
+                    self.first_row = (idx // max_rows) * max_rows
+                    break
+
+    def scroll(self, rows: int) -> None:
+        self.first_row += rows
+
+    def page(self, pages: int, max_rows: int) -> None:
+        self.first_row = (self.first_row // max_rows + pages) * max_rows
+
+    def _clamp(self, total: int, max_rows: int) -> int:
+        self.first_row = max(0, min(self.first_row, max(0, total - max_rows)))
+        return self.first_row
+
+    def _row_surfaces(self, idx: int, entry: dict) -> tuple[pygame.Surface, pygame.Surface]:
+        surfaces = self._rows.get(idx)
+        if surfaces is None:
+            color = TEXT_COLOR
+            if self._highlight is not None and entry.get("stamp") == self._highlight:
+                color = HIGHLIGHT_COLOR
+            surfaces = (
+                self.font.render(f"{idx + 1}.", True, color),
+                self.font.render(self.format_row(entry), True, color),
+            )
+            self._rows[idx] = surfaces
+            self.row_renders += 1
+        return surfaces
+
+    def _compose(self, panel: pygame.Surface, entries: list[dict], first: int, max_rows: int) -> None:
+        panel.fill(PANEL_BG)
+        pygame.draw.rect(panel, BORDER_COLOR, panel.get_rect(), 1)
+        panel.blit(self.font.render("Hall of Fame", True, TITLE_COLOR), (10, 8))
+        if not entries:
+            panel.blit(self.font.render("Aucun score.", True, TEXT_COLOR), (10, ROWS_TOP))
+            return
+        last = min(len(entries), first + max_rows)
+        if len(entries) > max_rows:
+            # Position dans le classement, alignée à droite du titre.
+            pages = self.font.render(f"{first + 1}-{last}/{len(entries)}", True, PAGE_COLOR)
+            panel.blit(pages, (panel.get_width() - 10 - pages.get_width(), 8))
+        for row, idx in enumerate(range(first, last)):
+            rank, label = self._row_surfaces(idx, entries[idx])
+            row_y = ROWS_TOP + row * ROW_HEIGHT
+            panel.blit(rank, (8, row_y))
+            panel.blit(label, (34, row_y))
+
+    def draw(
+        self,
+        target: pygame.Surface,
+        position: tuple[int, int],
+        entries: list[dict],
+        highlight: str | None,
+        max_rows: int = 5,
+    ) -> None:
+        self._sync(entries, highlight, max_rows)
+        first = self._clamp(len(entries), max_rows)
+        panel = self._panels.get(max_rows)
+        if panel is None:
+            panel = pygame.Surface((PANEL_WIDTH, panel_height(max_rows)), pygame.SRCALPHA)
+            self._panels[max_rows] = panel
+        key = (first, len(entries))
+        if self._keys.get(max_rows) != key:
+            self._compose(panel, entries, first, max_rows)
+            self._keys[max_rows] = key
+            self.rebuilds += 1
+        target.blit(panel, position)
+
+    def stats(self) -> dict:
+        return {
+            "name": "highscore_panel",
+            "rows_cached": len(self._rows),
+            "row_renders": self.row_renders,
+            "rebuilds": self.rebuilds,
+        }
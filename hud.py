@@ -0,0 +1,93 @@
+"""HUD composité : textes mis en cache et redessin piloté par les changements.
+
+`TextCache` mémorise chaque surface de texte par (police, texte, couleur) et
+compte les appels réels à `Font.render`. `HudLayer` ne recompose sa surface
+que lorsque la clé des valeurs affichées change, puis la blitte une fois par
+frame en se limitant aux zones réellement occupées.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+
+class TextCache:
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.frames = 0
+        self.frame_render_calls = 0
+        self.last_frame_render_calls = 0
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        key = (font, text, tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        self.frame_render_calls += 1
+        surface = font.render(text, True, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def end_frame(self) -> None:
+        self.last_frame_render_calls = self.frame_render_calls
+        self.frame_render_calls = 0
+        self.frames += 1
+
+    def stats(self) -> dict:
+        return {
+            "name": "hud_text",
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "render_calls_last_frame": self.last_frame_render_calls,
+            "render_calls_per_frame": (self.misses / self.frames) if self.frames else 0.0,
+        }
+
+
+class HudLayer:
+    def __init__(self, size: tuple[int, int], bands: int = 4) -> None:
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        width, height = size
+        band_height = max(1, height // bands)
+        self.bands = [
+            pygame.Rect(0, top, width, min(band_height, height - top))
+            for top in range(0, height, band_height)
+        ]
+        self.blit_rects: list[pygame.Rect] = []
+        self.rebuilds = 0
+        self._key: Hashable = None
+        self._built = False
+
+    def invalidate(self) -> None:
+        self._built = False
+
+    def update(self, key: Hashable, builder: Callable[[pygame.Surface, Hashable], None]) -> bool:
+        if self._built and key == self._key:
+            return False
+        self.surface.fill((0, 0, 0, 0))
+        builder(self.surface, key)
+        self._key = key
+        self._built = True
+        self.rebuilds += 1
+        # Ne blitter que les zones occupées : l'alpha d'un plein écran coûte cher.
+        self.blit_rects = []
+        for band in self.bands:
+            used = self.surface.subsurface(band).get_bounding_rect()
+            if used.width and used.height:
+                self.blit_rects.append(used.move(band.left, band.top))
+        return True
+
+    def draw(self, target: pygame.Surface) -> None:
+        for rect in self.blit_rects:
+            target.blit(self.surface, rect.topleft, rect)
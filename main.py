@@ -1,16 +1,47 @@
 import pygame
 import sys
-import random
 import math
 import textwrap
+import io
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
+import crt
+from assets import SpriteAssetCache
+from background import ParallaxBackground
+from highscore_panel import HighscorePanel
+from hud import HudLayer, TextCache
+from overlays import HitStop, OverlayQueue
+from particles import create_particle_system
+from perf_overlay import PerfOverlay
+from profiling import FrameProfiler
+from replay import InputRecorder, InputReplay
+from simulation import (
+    ASTRO_SPEED,
+    BOSS_SPRITE_SIZE,
+    HYPER_DASH_DURATION,
+    HYPER_DASH_MULTIPLIER,
+    MAX_FRAME_MS,
+    SHIELD_DURATION,
+    TICK_MS,
+    FixedTimestep,
+    GameState,
+    PlayerInputs,
+    RngStreams,
+    facing_to_vector,
+    interpolate,
+    is_croquette_oxidized,
+    new_seed,
+)
+from sprite_cache import SurfaceCache
+from tracing import TraceRecorder
+from transforms import TransformCache
+from warmup import BackgroundWarmup
+
 # Importer la configuration des niveaux
 import levels
-# Index du niveau courant (initialisé à 0 localement)
-level_idx = 0
 
 # Initialisation de Pygame
 pygame.init()
@@ -22,37 +53,70 @@ screen_height = 600
 screen = pygame.display.set_mode((screen_width, screen_height))
 pygame.display.set_caption("AstroPaws")
 
-crt_filter_enabled = True
-
-def build_crt_overlays(width, height):
-    scanlines = pygame.Surface((width, height), pygame.SRCALPHA)
-    for y in range(0, height, 4):
-        pygame.draw.line(scanlines, (0, 0, 0, 50), (0, y), (width, y))
-    vignette = pygame.Surface((width, height), pygame.SRCALPHA)
-    center_x, center_y = width / 2, height / 2
-    max_dist = math.hypot(center_x, center_y)
-    for y in range(height):
-        for x in range(width):
-            dist = math.hypot(x - center_x, y - center_y)
-            alpha = int(max(0, min(90, (dist / max_dist) ** 2.2 * 90)))
-            if alpha:
-                vignette.set_at((x, y), (0, 0, 0, alpha))
-    return scanlines, vignette
-
-crt_scanline_overlay, crt_vignette_overlay = build_crt_overlays(screen_width, screen_height)
-
-def apply_crt_overlay():
-    if not crt_filter_enabled:
-        return
-    ghost = screen.copy()
-    ghost.set_alpha(18)
-    screen.blit(ghost, (1, 0))
-    screen.blit(crt_scanline_overlay, (0, 0))
-    screen.blit(crt_vignette_overlay, (0, 0))
+ROOT_DIR = Path(__file__).resolve().parent
+SOUND_DIR = ROOT_DIR / "sounds"
+CACHE_DIR = ROOT_DIR / ".cache"
+
+# Parties reproductibles : chaque sous-système tire d'un flux dérivé de la graine
+# de la partie. ASTROPAWS_SEED=n fixe la graine ; ASTROPAWS_REPLAY=fichier rejoue
+# une partie enregistrée (la dernière est conservée dans .cache/replays/).
+FIXED_SEED = os.environ.get("ASTROPAWS_SEED")
+REPLAY_PATH = os.environ.get("ASTROPAWS_REPLAY")
+LAST_RUN_REPLAY_FILE = CACHE_DIR / "replays" / "last_run.json"
+rng_streams = RngStreams(int(FIXED_SEED) if FIXED_SEED else None)
+effects_rng = rng_streams.get("effects")
+active_replay = InputReplay.load(REPLAY_PATH) if REPLAY_PATH else None
+# Mode bonus « pluie de croquettes » (ASTROPAWS_CROQUETTE_RAIN=1) ; un rejeu suit son enregistrement.
+if active_replay is not None:
+    CROQUETTE_RAIN = bool(active_replay.data.get("croquette_rain", False))
+else:
+    CROQUETTE_RAIN = os.environ.get("ASTROPAWS_CROQUETTE_RAIN") == "1"
+input_recorder = InputRecorder()
+
+# Post-traitement CRT : calques calculés une fois (cache disque) puis fusionnés.
+# ASTROPAWS_CRT=off|cheap|full permet de choisir la qualité sur les bornes modestes.
+crt_scanline_overlay, crt_vignette_overlay = crt.load_crt_overlays(
+    screen_width, screen_height, CACHE_DIR / "crt"
+)
+crt_postprocess = crt.CRTPostProcess(
+    (screen_width, screen_height),
+    crt_scanline_overlay,
+    crt_vignette_overlay,
+    tier=os.environ.get("ASTROPAWS_CRT", "full"),
+)
+
+# Chronométrage par étape (bench/, diagnostics) : inactif tant qu'on ne l'active pas.
+frame_profiler = FrameProfiler()
+
+# Timeline Chrome / Perfetto en tampon circulaire. ASTROPAWS_TRACE=1 l'enregistre
+# dès le lancement ; la touche T la démarre, puis écrit les dernières
+# ASTROPAWS_TRACE_SECONDS secondes dans .cache/traces/.
+TRACE_DIR = CACHE_DIR / "traces"
+TRACE_DUMP_SECONDS = float(os.environ.get("ASTROPAWS_TRACE_SECONDS", "60"))
+trace_recorder = TraceRecorder()
+
+def start_tracing():
+    trace_recorder.start()
+    frame_profiler.tracer = trace_recorder
+    frame_profiler.enabled = True
+
+def dump_trace(background=True):
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return trace_recorder.dump(TRACE_DIR / f"trace-{stamp}.json", TRACE_DUMP_SECONDS, background=background)
+
+if os.environ.get("ASTROPAWS_TRACE") == "1":
+    start_tracing()
 
 def present_frame():
-    apply_crt_overlay()
+    frame_profiler.mark("draw")
+    crt_postprocess.apply(screen)
+    frame_profiler.mark("crt")
+    if perf_overlay.visible:
+        perf_overlay.draw(screen, frame_profiler, get_perf_entity_counts())
+        frame_profiler.mark("overlay")
     pygame.display.flip()
+    frame_profiler.mark("flip")
+    hud_text_cache.end_frame()
 
 # Audio optionnel : le jeu reste jouable même sans périphérique audio.
 try:
@@ -60,9 +124,6 @@ try:
 except pygame.error:
     pass
 
-ROOT_DIR = Path(__file__).resolve().parent
-SOUND_DIR = ROOT_DIR / "sounds"
-
 # Définition de quelques couleurs
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -76,35 +137,9 @@ CYAN  = (0, 255, 255)
 
 GAME_VERSION = "2026-02-04.2"
 
-INITIAL_LIVES = 9
-INITIAL_WATER_AMMO = 50
-INITIAL_CROQUETTES = 5
-HYPER_DASH_MULTIPLIER = 3
-HYPER_DASH_DURATION = 450
-HYPER_PICKUP_LIFETIME = 7000
-HYPER_PICKUP_SPAWN_CHANCE = 0.003
-ASTRO_HIT_FLASH_DURATION = 220
-ASTRO_ACCEL = 0.85
-ASTRO_FRICTION = 0.82
-ASTRO_DRAG = 0.98
-
-GRAVITY_RADIUS = 220
-GRAVITY_LEVEL_STRENGTH = {
-    0: 0.0,
-    1: 0.12,
-    2: 0.18,
-}
-
-OXIDIZED_FROM_LEVEL = 1
-OXIDIZED_DELAY_MS = 3200
-OXIDIZED_BONUS_SCORE = 12
-OXIDIZED_WATER_PENALTY = 4
-OXIDIZED_DEBUFF_DURATION = 1800
-
-BOSS_MAX_HEALTH = 72
-
 HIGHSCORE_FILE = ROOT_DIR / "highscores.json"
-MAX_HIGHSCORES = 8
+# Le panneau pagine : le classement peut être bien plus long que l'écran.
+MAX_HIGHSCORES = 100
 
 CONTROLLER_DEADZONE = 0.28
 CONTROLLER_CONFIRM_BUTTONS = {0, 7}
@@ -115,31 +150,12 @@ CONTROLLER_HYPER_BUTTONS = {3}
 CONTROLLER_PAUSE_BUTTONS = {7}
 CONTROLLER_CRT_TOGGLE_BUTTONS = {4}
 
-BALANCE_BASE_SPAWN = {0: 0.018, 1: 0.022, 2: 0.027}
-BALANCE_WATER_PICKUP_BASE = {0: 0.0055, 1: 0.0062, 2: 0.0068}
-BALANCE_COOLDOWN_BASE = {0: 290, 1: 270, 2: 250}
-
-# Le cooldown est récupéré depuis la config de niveau si disponible.
-hyper_level_cfg = next(
-    (cfg for cfg in levels.levels if cfg.get("item", {}).get("type") == "hyperdrive"),
-    None
-)
-HYPER_COOLDOWN = (
-    hyper_level_cfg.get("item", {}).get("cooldown", 60000) if hyper_level_cfg else 60000
-)
-
-# Ajout des listes pour les ennemis et explosions
-enemy_list = []
-explosion_list = []
+# Les explosions passent par le moteur de particules (rendu uniquement)
+PARTICLE_CAPACITY = 16384
+particles = create_particle_system(PARTICLE_CAPACITY, rng_streams.derive_seed("particles"))
 
 def create_explosion(x, y, color=YELLOW, num_particles=20):
-    for i in range(num_particles):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1, 3)
-        dx = math.cos(angle) * speed
-        dy = math.sin(angle) * speed
-        lifetime = random.randint(20, 40)
-        explosion_list.append({'x': x, 'y': y, 'dx': dx, 'dy': dy, 'lifetime': lifetime, 'color': color})
+    particles.emit(x, y, color, num_particles)
 
 def get_enemy_base_sprite(enemy_type):
     if enemy_type == "mouse":
@@ -163,7 +179,7 @@ def draw_thruster(center_x, center_y, facing, thrust_power, hyper_on):
     layers = 4 if hyper_on else 3
     for i in range(layers):
         spread = (i - 1.5) * (3 + 2 * thrust_power)
-        jitter = random.uniform(-2.0, 2.0)
+        jitter = effects_rng.uniform(-2.0, 2.0)
         distance = 28 + i * 7 + 10 * thrust_power
         px = center_x + back_x * distance + side_x * spread
         py = center_y + back_y * distance + side_y * spread + jitter
@@ -171,65 +187,180 @@ def draw_thruster(center_x, center_y, facing, thrust_power, hyper_on):
         color = YELLOW if i == 0 else ORANGE if i == 1 else (255, 120, 0)
         pygame.draw.circle(screen, color, (int(px), int(py)), radius)
 
-def draw_enemy_animated(enemy, now_ms):
-    base_sprite = get_enemy_base_sprite(enemy['type'])
+# Profils d'animation des ennemis : (période, amplitude) des sinusoïdes de bob,
+# étirement et inclinaison. Ils bornent les poses atteignables par chaque type.
+ENEMY_ANIM_PROFILES = {
+    "mouse": {
+        "bob": ((130, 8), (45, 3)),
+        "stretch_period": 85, "stretch_x": 0.12, "stretch_y": -0.10,
+        "angle_period": 90, "angle_amp": 8,
+    },
+    "rat": {
+        "bob": ((170, 10),),
+        "stretch_period": 120, "stretch_x": 0.08, "stretch_y": -0.05,
+        "angle_period": 150, "angle_amp": 5,
+    },
+    "dog": {
+        "bob": ((220, 12),),
+        "stretch_period": 180, "stretch_x": 0.04, "stretch_y": 0.05,
+        "angle_period": 200, "angle_amp": 3,
+    },
+}
+ENEMY_APPEAR_DURATION = 260
+
+# Cache de poses : écart maximal toléré (en pixels) par rapport au rendu exact.
+ENEMY_POSE_TOLERANCE_PX = 0.5
+ENEMY_POSE_ALPHA_BUCKETS = 8
+ENEMY_POSE_CACHE_BYTES = 4 * 1024 * 1024
+ENEMY_POSE_WARM_SAMPLES = 48
+
+enemy_pose_cache = SurfaceCache(ENEMY_POSE_CACHE_BYTES, name="enemy_poses")
+enemy_pose_steps = {}
+
+def get_enemy_anim_profile(enemy_type):
+    return ENEMY_ANIM_PROFILES.get(enemy_type, ENEMY_ANIM_PROFILES["dog"])
+
+def get_enemy_pose_steps(enemy_type):
+    # Pas de quantification dérivés de la tolérance et de la taille du sprite.
+    steps = enemy_pose_steps.get(enemy_type)
+    if steps is None:
+        width, height = get_enemy_base_sprite(enemy_type).get_size()
+        radius = max(1.0, math.hypot(width, height) / 2)
+        angle_step = math.degrees(2 * ENEMY_POSE_TOLERANCE_PX / radius)
+        scale_step = 2 * ENEMY_POSE_TOLERANCE_PX / max(1, width, height)
+        steps = (angle_step, scale_step)
+        enemy_pose_steps[enemy_type] = steps
+    return steps
+
+def get_enemy_pose_key(enemy_type, angle, scale_x, scale_y, appear_ratio):
+    angle_step, scale_step = get_enemy_pose_steps(enemy_type)
+    return (
+        enemy_type,
+        round(angle / angle_step),
+        round(scale_x / scale_step),
+        round(scale_y / scale_step),
+        round(appear_ratio * ENEMY_POSE_ALPHA_BUCKETS),
+    )
+
+def build_enemy_pose(key, source=None):
+    enemy_type, angle_idx, scale_x_idx, scale_y_idx, alpha_bucket = key
+    angle_step, scale_step = get_enemy_pose_steps(enemy_type)
+    if source is None:
+        source = get_enemy_base_sprite(enemy_type)
+    animated = pygame.transform.rotozoom(source, angle_idx * angle_step, 1.0)
+    w = max(1, int(animated.get_width() * scale_x_idx * scale_step))
+    h = max(1, int(animated.get_height() * scale_y_idx * scale_step))
+    animated = pygame.transform.smoothscale(animated, (w, h))
+    animated.set_alpha(int(255 * alpha_bucket / ENEMY_POSE_ALPHA_BUCKETS))
+    return animated
+
+def get_enemy_pose(enemy_type, angle, scale_x, scale_y, appear_ratio):
+    key = get_enemy_pose_key(enemy_type, angle, scale_x, scale_y, appear_ratio)
+    pose = enemy_pose_cache.get(key)
+    if pose is None:
+        pose = enemy_pose_cache.put(key, build_enemy_pose(key))
+    return pose
+
+def iter_enemy_steady_pose_keys(enemy_type):
+    # Poses atteignables une fois l'apparition terminée : l'inclinaison et
+    # l'étirement sont bornés par les amplitudes du profil.
+    profile = get_enemy_anim_profile(enemy_type)
+    angle_step, _scale_step = get_enemy_pose_steps(enemy_type)
+    angle_limit = round(profile['angle_amp'] / angle_step)
+    keys = set()
+    for i in range(ENEMY_POSE_WARM_SAMPLES + 1):
+        stretch = -1.0 + 2.0 * i / ENEMY_POSE_WARM_SAMPLES
+        scale_x = 1.0 + profile['stretch_x'] * stretch
+        scale_y = 1.0 + profile['stretch_y'] * stretch
+        for angle_idx in range(-angle_limit, angle_limit + 1):
+            keys.add(get_enemy_pose_key(enemy_type, angle_idx * angle_step, scale_x, scale_y, 1.0))
+    return keys
+
+def iter_enemy_warmup_tasks(enemy_types=("mouse", "rat", "dog")):
+    # Tâches (construction, publication) pour les poses pas encore en cache.
+    # Les threads travaillent sur une copie du sprite : l'original reste
+    # blitté par la boucle principale (écran LEVEL_INTRO).
+    for enemy_type in enemy_types:
+        missing = [key for key in sorted(iter_enemy_steady_pose_keys(enemy_type)) if key not in enemy_pose_cache]
+        if not missing:
+            continue
+        source = get_enemy_base_sprite(enemy_type).copy()
+        for key in missing:
+            yield (
+                lambda key=key, source=source: build_enemy_pose(key, source),
+                lambda pose, key=key: enemy_pose_cache.warm(key, lambda: pose),
+            )
+
+def warm_enemy_pose_cache(enemy_types=("mouse", "rat", "dog")):
+    built = 0
+    for build, commit in list(iter_enemy_warmup_tasks(enemy_types)):
+        commit(build())
+        built += 1
+    return built
+
+def draw_enemy_animated(enemy, now_ms, alpha=1.0):
+    profile = get_enemy_anim_profile(enemy['type'])
     phase = enemy.get('anim_phase', enemy.get('bob_phase', 0.0))
 
-    if enemy['type'] == "mouse":
-        bob = math.sin(now_ms / 130 + phase) * 8 + math.sin(now_ms / 45 + phase) * 3
-        stretch = math.sin(now_ms / 85 + phase)
-        scale_x = 1.0 + 0.12 * stretch
-        scale_y = 1.0 - 0.10 * stretch
-        angle = 8 * math.sin(now_ms / 90 + phase)
-    elif enemy['type'] == "rat":
-        bob = math.sin(now_ms / 170 + phase) * 10
-        stretch = math.sin(now_ms / 120 + phase)
-        scale_x = 1.0 + 0.08 * stretch
-        scale_y = 1.0 - 0.05 * stretch
-        angle = 5 * math.sin(now_ms / 150 + phase)
-    else:  # dog
-        bob = math.sin(now_ms / 220 + phase) * 12
-        stretch = math.sin(now_ms / 180 + phase)
-        scale_x = 1.0 + 0.04 * stretch
-        scale_y = 1.0 + 0.05 * stretch
-        angle = 3 * math.sin(now_ms / 200 + phase)
+    bob = sum(math.sin(now_ms / period + phase) * amp for period, amp in profile['bob'])
+    stretch = math.sin(now_ms / profile['stretch_period'] + phase)
+    scale_x = 1.0 + profile['stretch_x'] * stretch
+    scale_y = 1.0 + profile['stretch_y'] * stretch
+    angle = profile['angle_amp'] * math.sin(now_ms / profile['angle_period'] + phase)
 
     spawn_time = enemy.get('spawn_time', now_ms)
-    appear_ratio = min(1.0, max(0.0, (now_ms - spawn_time) / 260))
+    appear_ratio = min(1.0, max(0.0, (now_ms - spawn_time) / ENEMY_APPEAR_DURATION))
     appear_scale = 0.75 + 0.25 * appear_ratio
     scale_x *= appear_scale
     scale_y *= appear_scale
 
-    animated = pygame.transform.rotozoom(base_sprite, angle, 1.0)
-    w = max(1, int(animated.get_width() * scale_x))
-    h = max(1, int(animated.get_height() * scale_y))
-    animated = pygame.transform.smoothscale(animated, (w, h))
-    animated.set_alpha(int(255 * appear_ratio))
+    animated = get_enemy_pose(enemy['type'], angle, scale_x, scale_y, appear_ratio)
+    enemy_x = interpolate(enemy.get('px', enemy['x']), enemy['x'], alpha)
+    enemy_y = interpolate(enemy.get('py', enemy['y']), enemy['y'], alpha)
 
     shadow_w = max(6, int(enemy['width'] * (0.85 + 0.08 * math.sin(now_ms / 160 + phase))))
     shadow_h = 8 if enemy['type'] == "dog" else 6
     shadow_rect = pygame.Rect(0, 0, shadow_w, shadow_h)
     shadow_rect.center = (
-        int(enemy['x'] + enemy['width'] / 2),
-        int(enemy['y'] + enemy['height'] + 10),
+        int(enemy_x + enemy['width'] / 2),
+        int(enemy_y + enemy['height'] + 10),
     )
     pygame.draw.ellipse(screen, (18, 18, 26), shadow_rect)
 
     rect = animated.get_rect(
-        center=(enemy['x'] + enemy['width'] / 2, enemy['y'] + enemy['height'] / 2 + bob)
+        center=(enemy_x + enemy['width'] / 2, enemy_y + enemy['height'] / 2 + bob)
     )
     screen.blit(animated, rect)
 
-def draw_astro_animated(now_ms, astro_pos_x, astro_pos_y, facing, move_dx, move_dy, hyper_on, hit_flash_until):
-    base = {
-        "left": astro_sprite_left,
-        "right": astro_sprite_right,
-        "up": astro_sprite_up,
-        "down": astro_sprite_down,
-    }.get(facing, astro_sprite_right)
+# Atlas de poses d'AstroPaws : inclinaison et échelle quantifiées par orientation,
+# avec variantes pré-teintées pour le flash de dégâts.
+ASTRO_POSE_TOLERANCE_PX = 1.0
+ASTRO_POSE_CACHE_BYTES = 12 * 1024 * 1024
+ASTRO_HIT_FLASH_COLOR = (255, 50, 50, 90)
+
+astro_pose_cache = SurfaceCache(ASTRO_POSE_CACHE_BYTES, name="astro_poses")
+
+# Rotations et mises à l'échelle des écrans animés (INFO, intros, récompense,
+# zoom d'ingrédient, sprite du boss) : un budget commun, réglable par
+# ASTROPAWS_TRANSFORM_CACHE_MB selon la mémoire de la machine.
+TRANSFORM_CACHE_BYTES = int(float(os.environ.get("ASTROPAWS_TRANSFORM_CACHE_MB", "8")) * 1024 * 1024)
+transform_cache = TransformCache(TRANSFORM_CACHE_BYTES)
+astro_pose_steps = None
+
+def get_astro_pose_steps():
+    global astro_pose_steps
+    if astro_pose_steps is None:
+        width, height = astro_sprite_right.get_size()
+        radius = max(1.0, math.hypot(width, height) / 2)
+        astro_pose_steps = (
+            math.degrees(2 * ASTRO_POSE_TOLERANCE_PX / radius),
+            2 * ASTRO_POSE_TOLERANCE_PX / max(1, width, height),
+        )
+    return astro_pose_steps
 
+def compute_astro_pose(now_ms, facing, move_dx, move_dy, hyper_on):
     move_speed = math.hypot(move_dx, move_dy)
-    max_speed = speed * HYPER_DASH_MULTIPLIER
+    max_speed = ASTRO_SPEED * HYPER_DASH_MULTIPLIER
     speed_ratio = min(1.0, move_speed / max(1.0, max_speed))
     moving = move_speed > 0.1
 
@@ -242,15 +373,83 @@ def draw_astro_animated(now_ms, astro_pos_x, astro_pos_y, facing, move_dx, move_
         scale_y += 0.04
 
     if facing in ("left", "right"):
-        angle = -7.0 * (move_dy / max(1.0, speed))
+        angle = -7.0 * (move_dy / max(1.0, ASTRO_SPEED))
     else:
-        angle = 7.0 * (move_dx / max(1.0, speed))
+        angle = 7.0 * (move_dx / max(1.0, ASTRO_SPEED))
     angle += 2.5 * math.sin(now_ms / 180) * speed_ratio
+    return angle, scale_x, scale_y, speed_ratio, moving
+
+def get_astro_pose_key(facing, angle, scale_x, scale_y, flash):
+    angle_step, scale_step = get_astro_pose_steps()
+    if facing not in astro_facing_sprites:
+        facing = "right"
+    return (
+        facing,
+        round(angle / angle_step),
+        round(scale_x / scale_step),
+        round(scale_y / scale_step),
+        flash,
+    )
 
-    animated = pygame.transform.rotozoom(base, angle, 1.0)
-    w = max(1, int(animated.get_width() * scale_x))
-    h = max(1, int(animated.get_height() * scale_y))
+def build_astro_pose(key, source=None):
+    facing, angle_idx, scale_x_idx, scale_y_idx, flash = key
+    angle_step, scale_step = get_astro_pose_steps()
+    if source is None:
+        source = astro_facing_sprites[facing]
+    animated = pygame.transform.rotozoom(source, angle_idx * angle_step, 1.0)
+    w = max(1, int(animated.get_width() * scale_x_idx * scale_step))
+    h = max(1, int(animated.get_height() * scale_y_idx * scale_step))
     animated = pygame.transform.smoothscale(animated, (w, h))
+    if flash:
+        tint = pygame.Surface((w, h), pygame.SRCALPHA)
+        tint.fill(ASTRO_HIT_FLASH_COLOR)
+        animated.blit(tint, (0, 0))
+    return animated
+
+def iter_astro_warm_keys():
+    # Parcourt un cycle de respiration au repos et en vol rectiligne
+    # (normal et hyper-dash) pour chaque orientation.
+    keys = set()
+    for facing in astro_facing_sprites:
+        dir_x, dir_y = facing_to_vector(facing)
+        for hyper_on in (False, True):
+            cruise = ASTRO_SPEED * (HYPER_DASH_MULTIPLIER if hyper_on else 1)
+            for move_speed in (0.0, cruise):
+                for now_ms in range(0, 1760, 8):
+                    angle, scale_x, scale_y, _ratio, _moving = compute_astro_pose(
+                        now_ms, facing, dir_x * move_speed, dir_y * move_speed, hyper_on
+                    )
+                    keys.add(get_astro_pose_key(facing, angle, scale_x, scale_y, False))
+    return sorted(keys)
+
+def iter_astro_warmup_tasks():
+    # Une copie par orientation, comme pour les ennemis.
+    sources = {}
+    for key in iter_astro_warm_keys():
+        if key not in astro_pose_cache:
+            facing = key[0]
+            if facing not in sources:
+                sources[facing] = astro_facing_sprites[facing].copy()
+            yield (
+                lambda key=key, source=sources[facing]: build_astro_pose(key, source),
+                lambda pose, key=key: astro_pose_cache.warm(key, lambda: pose),
+            )
+
+def warm_astro_pose_cache():
+    built = 0
+    for build, commit in list(iter_astro_warmup_tasks()):
+        commit(build())
+        built += 1
+    return built
+
+def draw_astro_animated(now_ms, astro_pos_x, astro_pos_y, facing, move_dx, move_dy, hyper_on, hit_flash_until):
+    angle, scale_x, scale_y, speed_ratio, moving = compute_astro_pose(
+        now_ms, facing, move_dx, move_dy, hyper_on
+    )
+    key = get_astro_pose_key(facing, angle, scale_x, scale_y, now_ms < hit_flash_until)
+    animated = astro_pose_cache.get(key)
+    if animated is None:
+        animated = astro_pose_cache.put(key, build_astro_pose(key))
 
     center_x = astro_pos_x + astro_sprite_right.get_width() // 2
     center_y = astro_pos_y + astro_sprite_right.get_height() // 2
@@ -265,124 +464,90 @@ def draw_astro_animated(now_ms, astro_pos_x, astro_pos_y, facing, move_dx, move_
         draw_thruster(center_x, center_y, facing, thrust_power, hyper_on)
 
     screen.blit(animated, rect)
-
-    if now_ms < hit_flash_until:
-        flash = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        flash.fill((255, 50, 50, 90))
-        screen.blit(flash, rect.topleft)
-
     return rect
 
-def make_oxidized_variant(sprite):
-    variant = sprite.copy()
-    tint = pygame.Surface(sprite.get_size(), pygame.SRCALPHA)
-    tint.fill((130, 190, 90, 175))
-    variant.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-    return variant
-
-def get_level_gravity_strength(level_index):
-    return GRAVITY_LEVEL_STRENGTH.get(level_index, 0.0)
-
-def compute_planet_gravity_pull(player_cx, player_cy, level_index):
-    gravity_strength = get_level_gravity_strength(level_index)
-    if gravity_strength <= 0:
-        return 0.0, 0.0, None, 0.0
-
-    best_dx = 0.0
-    best_dy = 0.0
-    best_planet = None
-    best_pull = 0.0
-    for planet in planet_list:
-        dx = planet['x'] - player_cx
-        dy = planet['y'] - player_cy
-        dist = math.hypot(dx, dy)
-        if dist <= 2 or dist >= GRAVITY_RADIUS:
+def render_cache_stats():
+    return [cache.stats() for cache in (sprite_assets, enemy_pose_cache, astro_pose_cache, boss_anim_cache, transform_cache, hud_text_cache, highscore_panel, intro_warmup, trace_recorder)]
+
+def get_boss_base_sprite(width, height):
+    # Mise à l'échelle du sprite de l'Impératrice, faite une fois par taille.
+    return transform_cache.smoothscale(dog_sprite, (width, height))
+
+# Animation du boss : balancement et pulsation bouclés sur BOSS_ANIM_LOOP_MS
+# (2 balancements, 3 pulsations), pré-calculés en BOSS_ANIM_FRAMES images par
+# phase. Phases 2 et 3 : sprite teinté, de plus en plus rouge.
+BOSS_ANIM_LOOP_MS = 3150
+BOSS_ANIM_FRAMES = 48
+BOSS_ANGLE_AMPLITUDE = 3.0
+BOSS_PULSE_AMPLITUDE = 0.03
+BOSS_PHASE_TINTS = {1: None, 2: (255, 170, 150, 255), 3: (255, 110, 150, 255)}
+BOSS_ANIM_CACHE_BYTES = 24 * 1024 * 1024
+
+boss_anim_cache = SurfaceCache(BOSS_ANIM_CACHE_BYTES, name="boss_anim")
+
+def build_boss_phase_base(phase, width, height):
+    base = get_boss_base_sprite(width, height)
+    tint_color = BOSS_PHASE_TINTS[phase]
+    if tint_color is None:
+        return base
+    tinted = base.copy()
+    tint = pygame.Surface(tinted.get_size(), pygame.SRCALPHA)
+    tint.fill(tint_color)
+    tinted.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return tinted
+
+def build_boss_anim_frame(base, frame_idx):
+    loop_pos = 2 * math.pi * frame_idx / BOSS_ANIM_FRAMES
+    angle = BOSS_ANGLE_AMPLITUDE * math.sin(2 * loop_pos)
+    pulse = 1.0 + BOSS_PULSE_AMPLITUDE * math.sin(3 * loop_pos)
+    return pygame.transform.rotozoom(base, angle, pulse)
+
+def iter_boss_anim_warmup_tasks(width, height):
+    # Bases teintées faites ici (boucle principale), rotozooms en tâche de fond.
+    for phase, tint_color in BOSS_PHASE_TINTS.items():
+        keys = [(phase, width, height, idx) for idx in range(BOSS_ANIM_FRAMES)]
+        missing = [key for key in keys if key not in boss_anim_cache]
+        if not missing:
             continue
-        influence = 1.0 - (dist / GRAVITY_RADIUS)
-        pull_strength = gravity_strength * influence * (0.8 + planet['size'] / 22)
-        if pull_strength > best_pull:
-            best_pull = pull_strength
-            best_dx = (dx / dist) * pull_strength
-            best_dy = (dy / dist) * pull_strength
-            best_planet = planet
-
-    return best_dx, best_dy, best_planet, best_pull
-
-def is_croquette_oxidized(croquette, level_index, now_ms):
-    if level_index < OXIDIZED_FROM_LEVEL:
-        return False
-    return (now_ms - croquette['spawn_time']) >= OXIDIZED_DELAY_MS
-
-def spawn_boss_projectiles(now_ms, player_center):
-    global boss_data, boss_projectiles
-
-    if not boss_active or not boss_data:
-        return
-
-    phase = boss_data['phase']
-    base_x = boss_data['x'] + boss_data['width'] // 2
-    base_y = boss_data['y'] + boss_data['height'] - 8
-    target_angle = math.atan2(player_center[1] - base_y, player_center[0] - base_x)
-
-    spread_by_phase = {
-        1: [0.0],
-        2: [-0.20, 0.0, 0.20],
-        3: [-0.40, -0.20, 0.0, 0.20, 0.40],
-    }
-    speed_by_phase = {1: 4.2, 2: 4.8, 3: 5.4}
-    radius_by_phase = {1: 5, 2: 6, 3: 7}
-    color_by_phase = {1: ORANGE, 2: RED, 3: (255, 60, 120)}
-
-    for spread in spread_by_phase[phase]:
-        angle = target_angle + spread
-        speed = speed_by_phase[phase]
-        boss_projectiles.append({
-            'x': base_x,
-            'y': base_y,
-            'dx': math.cos(angle) * speed,
-            'dy': math.sin(angle) * speed,
-            'radius': radius_by_phase[phase],
-            'color': color_by_phase[phase],
-            'lifetime': 220,
-        })
+        base = build_boss_phase_base(phase, width, height)
+        if tint_color is None:
+            # Phase 1 : la base est l'aperçu de BOSS_INTRO, blitté à chaque
+            # frame ; les threads travaillent sur une copie privée.
+            base = base.copy()
+        for key in missing:
+            yield (
+                lambda base=base, key=key: build_boss_anim_frame(base, key[3]),
+                lambda frame, key=key: boss_anim_cache.warm(key, lambda: frame),
+            )
 
-    if phase == 3:
-        # Rafale latérale pour mettre la pression en phase finale.
-        for side_x, drift in ((40, 1.6), (screen_width - 40, -1.6)):
-            boss_projectiles.append({
-                'x': side_x,
-                'y': boss_data['y'] + boss_data['height'] // 2,
-                'dx': drift,
-                'dy': 4.4,
-                'radius': 6,
-                'color': (255, 80, 140),
-                'lifetime': 190,
-            })
-
-    boss_data['last_shot'] = now_ms
-
-def draw_boss(now_ms):
-    if not boss_active or not boss_data:
+def get_boss_anim_frame(phase, width, height, now_ms):
+    frame_idx = int((now_ms % BOSS_ANIM_LOOP_MS) * BOSS_ANIM_FRAMES // BOSS_ANIM_LOOP_MS)
+    key = (phase, width, height, frame_idx)
+    frame = boss_anim_cache.get(key)
+    if frame is None:
+        # Pré-chauffage absent ou évincé : construit à la volée, une seule fois.
+        frame = boss_anim_cache.put(key, build_boss_anim_frame(build_boss_phase_base(phase, width, height), frame_idx))
+    return frame
+
+def draw_boss(now_ms, alpha=1.0):
+    boss_data = game.boss_data
+    if not game.boss_active or not boss_data:
         return None
+    boss_x = interpolate(boss_data.get('px', boss_data['x']), boss_data['x'], alpha)
+    boss_y = interpolate(boss_data.get('py', boss_data['y']), boss_data['y'], alpha)
 
-    pulse = 1.0 + 0.03 * math.sin(now_ms / 160)
-    angle = 3.0 * math.sin(now_ms / 250)
-
-    base_sprite = pygame.transform.smoothscale(
-        dog_sprite, (boss_data['width'], boss_data['height'])
-    )
-    animated = pygame.transform.rotozoom(base_sprite, angle, pulse)
+    animated = get_boss_anim_frame(boss_data['phase'], boss_data['width'], boss_data['height'], now_ms)
     boss_rect = animated.get_rect(
         center=(
-            boss_data['x'] + boss_data['width'] // 2,
-            boss_data['y'] + boss_data['height'] // 2,
+            boss_x + boss_data['width'] // 2,
+            boss_y + boss_data['height'] // 2,
         )
     )
 
     shadow_rect = pygame.Rect(0, 0, int(boss_data['width'] * 0.8), 16)
     shadow_rect.center = (
-        boss_data['x'] + boss_data['width'] // 2,
-        boss_data['y'] + boss_data['height'] + 14,
+        boss_x + boss_data['width'] // 2,
+        boss_y + boss_data['height'] + 14,
     )
     pygame.draw.ellipse(screen, (20, 10, 20), shadow_rect)
     screen.blit(animated, boss_rect)
@@ -406,27 +571,6 @@ def draw_boss(now_ms):
 
     return pygame.Rect(boss_data['x'], boss_data['y'], boss_data['width'], boss_data['height'])
 
-def start_boss_fight(now_ms):
-    global boss_active, boss_data, boss_projectiles, boss_contact_cooldown_until, game_state
-
-    boss_active = True
-    boss_data = {
-        'name': "Imperatrice Zibeline",
-        'x': screen_width // 2 - 90,
-        'y': 90,
-        'width': 180,
-        'height': 120,
-        'health': BOSS_MAX_HEALTH,
-        'max_health': BOSS_MAX_HEALTH,
-        'phase': 1,
-        'vx': 1,
-        'last_shot': now_ms,
-        'seed': random.uniform(0, math.pi * 2),
-    }
-    boss_projectiles = []
-    boss_contact_cooldown_until = 0
-    game_state = "BOSS_INTRO"
-
 def load_highscores():
     if not HIGHSCORE_FILE.exists():
         return []
@@ -449,6 +593,7 @@ def load_highscores():
     return cleaned[:MAX_HIGHSCORES]
 
 def save_highscores(entries):
+    trace_recorder.instant("save_highscores", args={"entries": min(len(entries), MAX_HIGHSCORES)})
     try:
         HIGHSCORE_FILE.write_text(
             json.dumps(entries[:MAX_HIGHSCORES], ensure_ascii=False, indent=2),
@@ -457,26 +602,6 @@ def save_highscores(entries):
     except OSError:
         pass
 
-def get_level_spawn_chance(level_index, score_value, lives_value, boss_on):
-    if boss_on:
-        return 0.0
-    base = BALANCE_BASE_SPAWN.get(level_index, 0.03)
-    score_pressure = min(0.018, max(0, score_value) * 0.00009)
-    survival_relief = -0.006 if lives_value <= 2 else 0.0
-    return max(0.010, min(0.055, base + score_pressure + survival_relief))
-
-def get_water_pickup_spawn_chance(level_index, boss_on, water_value):
-    if boss_on:
-        return 0.011
-    base = BALANCE_WATER_PICKUP_BASE.get(level_index, 0.0065)
-    low_water_bonus = 0.0035 if water_value <= 20 else 0.0
-    return min(0.018, base + low_water_bonus)
-
-def get_shot_cooldown(level_index, boss_on):
-    if boss_on:
-        return 220
-    return BALANCE_COOLDOWN_BASE.get(level_index, 250)
-
 def normalize_axis(value):
     return 0.0 if abs(value) < CONTROLLER_DEADZONE else float(value)
 
@@ -506,45 +631,19 @@ def get_controller_move_vector():
     return axis_x, axis_y
 
 def handle_global_event(event):
-    global crt_filter_enabled
     if event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED):
         refresh_controller()
     if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
-        crt_filter_enabled = not crt_filter_enabled
+        crt_postprocess.cycle_tier()
+    elif event.type == pygame.KEYDOWN and event.key == pygame.K_g:
+        perf_overlay.toggle(frame_profiler)
+    elif event.type == pygame.KEYDOWN and event.key == pygame.K_t:
+        if trace_recorder.active:
+            dump_trace()
+        else:
+            start_tracing()
     elif event.type == pygame.JOYBUTTONDOWN and event.button in CONTROLLER_CRT_TOGGLE_BUTTONS:
-        crt_filter_enabled = not crt_filter_enabled
-
-def facing_to_vector(facing_value):
-    if facing_value == "left":
-        return -1.0, 0.0
-    if facing_value == "right":
-        return 1.0, 0.0
-    if facing_value == "up":
-        return 0.0, -1.0
-    return 0.0, 1.0
-
-def fire_player_bullet(direction_x, direction_y, current_time):
-    global next_shot_allowed_time, water_ammo
-    if current_time < next_shot_allowed_time or water_ammo <= 0:
-        return False
-    magnitude = math.hypot(direction_x, direction_y)
-    if magnitude <= 0:
-        direction_x, direction_y = facing_to_vector(astro_facing)
-        magnitude = math.hypot(direction_x, direction_y)
-    direction_x = direction_x / magnitude * bullet_speed
-    direction_y = direction_y / magnitude * bullet_speed
-    bullet_rect = pygame.Rect(
-        astro_x + 25 - bullet_width // 2,
-        astro_y + 25 - bullet_height // 2,
-        bullet_width,
-        bullet_height,
-    )
-    bullet = {'rect': bullet_rect, 'dx': direction_x, 'dy': direction_y}
-    bullet_list.append(bullet)
-    next_shot_allowed_time = current_time + cooldown_time
-    water_ammo -= 1
-    play_sound(shoot_sound)
-    return True
+        crt_postprocess.cycle_tier()
 
 refresh_controller()
 
@@ -574,12 +673,28 @@ music_tracks = {
     "gameplay": SOUND_DIR / "music_gameplay_loop.wav",
 }
 current_music_key = None
+# Pistes lues en mémoire pendant les intros (pré-chauffage) : le premier
+# set_music("gameplay") charge depuis la RAM plutôt que depuis le disque.
+music_buffers = {}
+current_music_buffer = None
+
+def read_music_track(music_key):
+    return music_tracks[music_key].read_bytes()
+
+def iter_music_warmup_tasks(music_keys=("gameplay",)):
+    for music_key in music_keys:
+        if music_key not in music_buffers and music_tracks[music_key].exists():
+            yield (
+                lambda music_key=music_key: read_music_track(music_key),
+                lambda data, music_key=music_key: music_buffers.__setitem__(music_key, data),
+            )
 
 def set_music(music_key):
-    global current_music_key
+    global current_music_key, current_music_buffer
     if current_music_key == music_key:
         return
     current_music_key = music_key
+    trace_recorder.instant("music", args={"track": music_key})
     if not pygame.mixer.get_init():
         return
     if music_key is None:
@@ -592,7 +707,13 @@ def set_music(music_key):
     if music_path is None or not music_path.exists():
         return
     try:
-        pygame.mixer.music.load(str(music_path))
+        data = music_buffers.get(music_key)
+        if data is not None:
+            # Le tampon doit rester vivant tant que la piste est jouée.
+            current_music_buffer = io.BytesIO(data)
+            pygame.mixer.music.load(current_music_buffer, music_path.suffix.lstrip("."))
+        else:
+            pygame.mixer.music.load(str(music_path))
         pygame.mixer.music.set_volume(0.35 if music_key == "menu" else 0.45)
         pygame.mixer.music.play(-1)
     except pygame.error:
@@ -601,7 +722,7 @@ def set_music(music_key):
 def music_for_state(state):
     if state in ("MENU", "STORY", "INFO", "FINAL_WIN", "GAME_OVER"):
         return "menu"
-    if state in ("PLAYING", "PAUSE", "LEVEL_INTRO", "BOSS_INTRO", "REWARD"):
+    if state in ("PLAYING", "PAUSE", "LEVEL_INTRO", "BOSS_INTRO", "REWARD", "LEVEL_COMPLETE", "WARP"):
         return "gameplay"
     return None
 
@@ -612,87 +733,95 @@ pickup_sound = load_sound("sfx_pickup.wav", 0.45)
 hyper_pickup_sound = load_sound("sfx_pickup.wav", 0.55)
 hyper_dash_sound = load_sound("sfx_dash.wav", 0.60)
 warp_sound = load_sound("sfx_warp.wav", 0.55)
+# Sons publiés par la simulation, par nom d'événement
+sim_sounds = {
+    "shoot": shoot_sound,
+    "explosion": explosion_sound,
+    "pickup": pickup_sound,
+    "hyper_pickup": hyper_pickup_sound,
+    "hyper_dash": hyper_dash_sound,
+}
 
 # Effet de warp d'étoiles suivi d'un flash blanc
-def warp_effect():
-    # Tunnel d'étoiles puis flash blanc
+# Warp spatial : état WARP piloté par la boucle principale (tunnel d'étoiles
+# puis flash blanc), sans bloquer les événements.
+WARP_STEPS = 30
+WARP_STEP_MS = 70  # durée d'une étape, un peu longue pour percevoir l'effet
+WARP_FLASH_MS = 100
+WARP_ZOOM = 1.15
+WARP_NOISE_STARS = 200
+WARP_NOISE_LAYERS = 4
+warp_noise_layers = []
+warp_anim = {'start': 0, 'next_state': "PLAYING", 'stars': []}
+
+def build_warp_noise_layers():
+    # Étoiles supplémentaires qui saturent l'effet : quelques calques tirés une
+    # fois puis alternés à chaque étape, au lieu de 200 tirages par frame.
+    center_x, center_y = screen_width // 2, screen_height // 2
+    layers = []
+    for _ in range(WARP_NOISE_LAYERS):
+        layer = pygame.Surface((screen_width, screen_height))
+        layer.fill(BLACK)
+        for _ in range(WARP_NOISE_STARS):
+            rx = effects_rng.randint(0, screen_width)
+            ry = effects_rng.randint(0, screen_height)
+            x2 = center_x + (rx - center_x) * WARP_ZOOM
+            y2 = center_y + (ry - center_y) * WARP_ZOOM
+            pygame.draw.circle(layer, WHITE, (int(x2), int(y2)), 1)
+        layer.set_colorkey(BLACK, pygame.RLEACCEL)
+        layers.append(layer)
+    return layers
+
+def start_warp(next_state="PLAYING"):
+    global game_state, warp_noise_layers
+    if not warp_noise_layers:
+        warp_noise_layers = build_warp_noise_layers()
     play_sound(warp_sound)
+    warp_anim['start'] = pygame.time.get_ticks()
+    warp_anim['next_state'] = next_state
+    warp_anim['stars'] = background.star_positions()
+    game_state = "WARP"
+
+def draw_warp_frame(elapsed_ms):
+    # Renvoie True une fois l'effet (tunnel + flash) terminé.
+    tunnel_ms = WARP_STEPS * WARP_STEP_MS
+    if elapsed_ms >= tunnel_ms:
+        screen.fill(WHITE)
+        return elapsed_ms >= tunnel_ms + WARP_FLASH_MS
+    step = int(elapsed_ms // WARP_STEP_MS)
+    zoom = WARP_ZOOM ** (step + 1)
     center_x, center_y = screen_width // 2, screen_height // 2
-    # Effet warp encore plus dense et plus lent
-    for _ in range(30):  # plus d'étapes pour densifier
-        screen.fill(BLACK)
-        # Déplacer et dessiner les étoiles principales
-        for star in star_list:
-            dx = star['x'] - center_x
-            dy = star['y'] - center_y
-            star['x'] = center_x + dx * 1.15
-            star['y'] = center_y + dy * 1.15
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        # Ajouter des étoiles supplémentaires pour saturer l'effet
-        for _ in range(200):  # étoile bonus
-            rx = random.randint(0, screen_width)
-            ry = random.randint(0, screen_height)
-            ddx = rx - center_x
-            ddy = ry - center_y
-            x2 = center_x + ddx * 1.15
-            y2 = center_y + ddy * 1.15
-            pygame.draw.circle(screen, WHITE, (int(x2), int(y2)), 1)
-        present_frame()
-        pygame.time.delay(70)  # délai encore un peu plus long pour percevoir l'effet
-    # Flash blanc
-    screen.fill(WHITE)
-    present_frame()
-    pygame.time.delay(100)
-    # Régénérer les étoiles pour le prochain level
-    for star in star_list:
-        star['x'] = random.randint(0, screen_width)
-        star['y'] = random.randint(0, screen_height)
-
-croquette_size = 10
-croquette_lifetime = 5000  # Durée de vie en millisecondes (5 secondes)
-
-def spawn_croquette():
-    x = random.randint(0, screen_width - croquette_size)
-    y = random.randint(0, screen_height - croquette_size)
-    spawn_time = pygame.time.get_ticks()
-    croquette_type = "rare" if random.random() < 0.1 else "normal"
-    return {'x': x, 'y': y, 'spawn_time': spawn_time, 'type': croquette_type}
-
-croquette_list = [spawn_croquette() for _ in range(INITIAL_CROQUETTES)]
-
-# Création des réserves d'eau (objets à collecter pour augmenter l'eau)
-water_item_list = []
-hyper_item_list = []
-
-# Génération d'un fond spatial procédural
+    screen.fill(BLACK)
+    for star_x, star_y in warp_anim['stars']:
+        x = center_x + (star_x - center_x) * zoom
+        y = center_y + (star_y - center_y) * zoom
+        pygame.draw.circle(screen, WHITE, (int(x), int(y)), 1)
+    screen.blit(warp_noise_layers[step % len(warp_noise_layers)], (0, 0))
+    return False
+
+# Génération d'un fond spatial procédural : étoiles et planètes pré-dessinées
+# dans des couches de parallaxe que l'on fait défiler.
 num_stars = 50
-star_list = []
-for i in range(num_stars):
-    x = random.randint(0, screen_width)
-    y = random.randint(0, screen_height)
-    speed = random.uniform(0.2, 1.0)
-    star_list.append({'x': x, 'y': y, 'speed': speed})
-
-# Modification pour générer des planètes avec des couleurs aléatoires
-
 num_planets = 3
-planet_list = []
-for i in range(num_planets):
-    x = random.randint(0, screen_width)
-    y = random.randint(0, screen_height)
-    size = random.randint(8, 20)
-    speed = random.uniform(0.1, 0.5)
-    color = (random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
-    planet_list.append({'x': x, 'y': y, 'size': size, 'speed': speed, 'color': color})
+background = ParallaxBackground(screen_width, screen_height, num_stars, num_planets, rng=rng_streams.get("background"))
+
+# État de la partie : simulation sans affichage, avancée à chaque frame de jeu.
+# Le fond lui est confié car les planètes qui défilent exercent leur gravité.
+game = GameState(
+    screen_width, screen_height, background=background, streams=rng_streams,
+    profiler=frame_profiler, croquette_rain=CROQUETTE_RAIN,
+)
 
 # ==== OVNIs décoratifs ====
+ufo_rng = rng_streams.get("ufo")
+
 class UFO:
     def __init__(self, x, y, scale=1.0, speed=0.5, color=(150, 200, 255)):
         self.x = x
         self.y = y
         self.scale = scale
         self.speed = speed
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = ufo_rng.uniform(0, 2 * math.pi)
         # Contour vectoriel d'un saucer (disque + dôme)
         self.pointlist = [(-9,0),(-3,-3),(-2,-6),(2,-6),(3,-3),(9,0),(-9,0),(-3,4),(3,4),(9,0)]
         self.color = color
@@ -700,7 +829,7 @@ class UFO:
         # Avance et oscille légèrement
         self.x += math.cos(self.angle) * self.speed
         self.y += math.sin(self.angle) * self.speed
-        self.angle += random.uniform(-0.05, 0.05)
+        self.angle += ufo_rng.uniform(-0.05, 0.05)
         # Wrap-around de l'UFO
         if self.x < 0: self.x = screen_width
         elif self.x > screen_width: self.x = 0
@@ -722,131 +851,181 @@ ufo_list = []
 for _ in range(2):
     ufo_list.append(
         UFO(
-            random.uniform(0, screen_width),
-            random.uniform(0, screen_height),
-            scale=random.uniform(0.5, 1.0),
-            speed=random.uniform(0.2, 0.7),
-            color=(random.randint(100,255), random.randint(100,255), random.randint(100,255))
+            ufo_rng.uniform(0, screen_width),
+            ufo_rng.uniform(0, screen_height),
+            scale=ufo_rng.uniform(0.5, 1.0),
+            speed=ufo_rng.uniform(0.2, 0.7),
+            color=(ufo_rng.randint(100,255), ufo_rng.randint(100,255), ufo_rng.randint(100,255))
         )
     )
 
 
-# Charger le sprite d'AstroPaws et ses versions gauche/droite/haut/bas
-astro_sprite_right = pygame.image.load("images/astro_paws.png").convert_alpha()
-astro_sprite_right = pygame.transform.scale(astro_sprite_right, (80, 80))
-astro_sprite_left = pygame.transform.flip(astro_sprite_right, True, False)
-# Créer les versions pour haut et bas en pivotant la version droite
-astro_sprite_up = pygame.transform.rotate(astro_sprite_right, 90)
-astro_sprite_down = pygame.transform.rotate(astro_sprite_right, -90)
-# Direction initiale
-astro_facing = "right"
-
-# Charger les sprites des croquettes et de l'eau
-# Agrandir les sprites de croquettes et d'eau
-# Agrandir les sprites de croquettes
-brown_croquette_sprite = pygame.image.load("images/browncroquette.png").convert_alpha()
-brown_croquette_sprite = pygame.transform.scale(brown_croquette_sprite, (30, 30))  # croquette normale agrandie
-# Agrandir la croquette dorée
-gold_croquette_sprite  = pygame.image.load("images/goldcroquette.png").convert_alpha()
-gold_croquette_sprite  = pygame.transform.scale(gold_croquette_sprite,  (40, 40))  # croquette rare encore plus grande
-brown_croquette_oxidized_sprite = make_oxidized_variant(brown_croquette_sprite)
-gold_croquette_oxidized_sprite = make_oxidized_variant(gold_croquette_sprite)
-# Agrandir la réserve d'eau
-water_sprite           = pygame.image.load("images/water.png").convert_alpha()
-water_sprite           = pygame.transform.scale(water_sprite,           (30, 30))
-
-
-# Charger l'image du coeur pour les vies
-heart_sprite = pygame.image.load("images/heart.png").convert_alpha()
-heart_sprite = pygame.transform.scale(heart_sprite, (20, 20))
-
-# Charger l'image de l'écran d'accueil
-welcome_image = pygame.image.load("images/ecranaccueil.png").convert_alpha()
-welcome_image = pygame.transform.scale(welcome_image, (400, 300))  # taille réduite
-
-chat_sleep_image = pygame.image.load("images/chatdort.png").convert_alpha()
-chat_sleep_image = pygame.transform.scale(chat_sleep_image, (360, 240))
-
-# Charger la tête d’AstroPaws pour l’écran VS
-astro_head = pygame.image.load("images/astro_paws_head.png").convert_alpha()
-astro_head = pygame.transform.scale(astro_head, (120, 120))
-
-# Charger les sprites des ennemis
-mouse_sprite = pygame.image.load("images/badguymouse.png").convert_alpha()
-mouse_sprite = pygame.transform.scale(mouse_sprite, (20, 20))
-rat_sprite   = pygame.image.load("images/badguyrat.png").convert_alpha()
-rat_sprite   = pygame.transform.scale(rat_sprite,   (30, 30))
-dog_sprite   = pygame.image.load("images/badguydog.png").convert_alpha()
-dog_sprite   = pygame.transform.scale(dog_sprite,   (50, 50))
-
-# Charger les sprites morts pour la transition de niveau
-# Mettre les sprites morts à la taille d'AstroPaws (astro_head)
-mouse_dead_sprite = pygame.image.load("images/badguymouse_dead.png").convert_alpha()
-rat_dead_sprite   = pygame.image.load("images/badguyrat_dead.png").convert_alpha()
-dog_dead_sprite   = pygame.image.load("images/badguydog_dog.png").convert_alpha()
-dead_size = astro_head.get_size()
-mouse_dead_sprite = pygame.transform.scale(mouse_dead_sprite, dead_size)
-rat_dead_sprite   = pygame.transform.scale(rat_dead_sprite,   dead_size)
-dog_dead_sprite   = pygame.transform.scale(dog_dead_sprite,   dead_size)
-
-# Charger l'image de Game Over
-gameover_image = pygame.image.load("images/gameover.png").convert_alpha()
-gameover_image = pygame.transform.scale(gameover_image, (400, 200))
- # Charger l'image de victoire de niveau
-youwin_image = pygame.image.load("images/youwin.png").convert_alpha()
-youwin_image = pygame.transform.scale(youwin_image, (400, 200))
-
-# Charger l'image du guide (doc)
-doctor_image = pygame.image.load("images/astropaws_doctor.png").convert_alpha()
-doctor_image = pygame.transform.scale(doctor_image, (150, 150))
-
-# Charger les icônes d'inventaire
-# Agrandissement des icônes d'inventaire
-shield_icon = pygame.image.load("images/shield_icon.png").convert_alpha()
-shield_icon = pygame.transform.scale(shield_icon, (48, 48))
-hyper_icon  = pygame.image.load("images/hyper_icon.png").convert_alpha()
-hyper_icon  = pygame.transform.scale(hyper_icon,  (48, 48))
-hyper_pickup_sprite = pygame.transform.scale(hyper_icon, (30, 30))
-
-ingredient_icon = pygame.image.load("images/ingredient_icon.png").convert_alpha()
-ingredient_icon = pygame.transform.scale(ingredient_icon, (48, 48))
-
-# Sprites spécifiques des ingrédients
-poulet_sprite   = pygame.image.load("images/ingredient_poulet.png").convert_alpha()
-poulet_sprite   = pygame.transform.scale(poulet_sprite, (48, 48))
-thon_sprite     = pygame.image.load("images/ingredient_thon.png").convert_alpha()
-thon_sprite     = pygame.transform.scale(thon_sprite, (48, 48))
-carotte_sprite  = pygame.image.load("images/ingredient_carotte.png").convert_alpha()
-carotte_sprite  = pygame.transform.scale(carotte_sprite, (48, 48))
-fragment_sprite = pygame.image.load("images/ingredient_fragment_croquette.png").convert_alpha()
-fragment_sprite = pygame.transform.scale(fragment_sprite, (48, 48))
-
-# Mapping clé → sprite pour l’inventaire
-ingredient_sprites = {
-    'ingredient_poulet': poulet_sprite,
-    'ingredient_thon': thon_sprite,
-    'ingredient_carotte': carotte_sprite,
-    'ingredient_fragment_croquette': fragment_sprite,
+# Sprites à leur taille en jeu : cache disque pré-mis à l'échelle (voir assets.py),
+# les PNG sources ne sont décodés qu'au premier lancement ou après modification.
+# Les images propres à un écran (accueil, VS, pause, fin…) sont chargées à la
+# demande via sprite_assets.get(nom) ; seuls les sprites de jeu le sont ici.
+sprite_assets = SpriteAssetCache(ROOT_DIR / "images", CACHE_DIR / "sprites")
+
+# Sprite d'AstroPaws et ses versions gauche/droite/haut/bas
+astro_sprite_right = sprite_assets.get("astro_right")
+astro_sprite_left = sprite_assets.get("astro_left")
+astro_sprite_up = sprite_assets.get("astro_up")
+astro_sprite_down = sprite_assets.get("astro_down")
+astro_facing_sprites = {
+    "left": astro_sprite_left,
+    "right": astro_sprite_right,
+    "up": astro_sprite_up,
+    "down": astro_sprite_down,
 }
+# Croquettes (normale, rare et variantes oxydées) et réserve d'eau
+brown_croquette_sprite = sprite_assets.get("brown_croquette")
+gold_croquette_sprite = sprite_assets.get("gold_croquette")
+brown_croquette_oxidized_sprite = sprite_assets.get("brown_croquette_oxidized")
+gold_croquette_oxidized_sprite = sprite_assets.get("gold_croquette_oxidized")
+water_sprite = sprite_assets.get("water")
+
+# Coeur pour les vies
+heart_sprite = sprite_assets.get("heart")
+
+# Sprites des ennemis
+mouse_sprite = sprite_assets.get("mouse")
+rat_sprite = sprite_assets.get("rat")
+dog_sprite = sprite_assets.get("dog")
+
+# Icônes d'inventaire
+shield_icon = sprite_assets.get("shield_icon")
+hyper_icon = sprite_assets.get("hyper_icon")
+hyper_pickup_sprite = sprite_assets.get("hyper_pickup")
+ingredient_icon = sprite_assets.get("ingredient_icon")
+sprite_assets.save_manifest()
+
+# Pulsation des croquettes oxydées et des pickups Hyperdrive : un cycle de
+# PULSE_FRAMES images par sprite, calculé une fois ; chaque item choisit son
+# image d'après sa phase au lieu d'être ré-échantillonné à chaque frame.
+PULSE_FRAMES = 24
+OXIDIZED_PULSE_AMPLITUDE = 0.08
+OXIDIZED_RING_COLOR = (150, 220, 80)
+HYPER_PULSE_AMPLITUDE = 0.12
+
+def build_pulse_frames(sprite, amplitude, smooth=False, ring_color=None):
+    # Chaque image : (surface, décalage x, décalage y) par rapport au coin du
+    # sprite de base, l'image restant centrée sur lui.
+    base_w, base_h = sprite.get_size()
+    frames = []
+    for idx in range(PULSE_FRAMES):
+        pulse = 1.0 + amplitude * math.sin(2 * math.pi * idx / PULSE_FRAMES)
+        w = max(1, int(base_w * pulse))
+        h = max(1, int(base_h * pulse))
+        scaled = pygame.transform.smoothscale(sprite, (w, h)) if smooth else pygame.transform.scale(sprite, (w, h))
+        if ring_color is not None:
+            # Anneau intégré à l'image (même tracé que pygame.draw.circle sur l'écran)
+            ring_radius = max(w, h) // 2 + 3
+            size = ring_radius * 2 + 2
+            frame = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = size // 2
+            frame.blit(scaled, (center - w // 2, center - h // 2))
+            pygame.draw.circle(frame, ring_color, (center, center), ring_radius, 1)
+            offset = (base_w // 2 - center, base_h // 2 - center)
+        else:
+            frame = scaled
+            offset = (base_w // 2 - w // 2, base_h // 2 - h // 2)
+        frames.append((frame, offset[0], offset[1]))
+    return frames
+
+def pulse_frame_index(phase):
+    # phase en radians, comme l'argument du sinus de la pulsation
+    return int(phase * PULSE_FRAMES / (2 * math.pi)) % PULSE_FRAMES
+
+oxidized_pulse_frames = {
+    rare: build_pulse_frames(sprite, OXIDIZED_PULSE_AMPLITUDE, smooth=True, ring_color=OXIDIZED_RING_COLOR)
+    for rare, sprite in ((False, brown_croquette_oxidized_sprite), (True, gold_croquette_oxidized_sprite))
+}
+hyper_pulse_frames = build_pulse_frames(hyper_pickup_sprite, HYPER_PULSE_AMPLITUDE)
+
+# Sprite spécifique d'un ingrédient (clé = nom d'asset), chargé au premier affichage
+def get_ingredient_sprite(ingredient_key):
+    if ingredient_key in sprite_assets:
+        return sprite_assets.get(ingredient_key)
+    return ingredient_icon
+
+# Sprite « vaincu » de l'ennemi du niveau, pour l'animation de fin de niveau
+LEVEL_DEAD_SPRITES = ("mouse_dead", "rat_dead", "dog_dead")
+
+def get_level_dead_sprite_name(level_index):
+    return LEVEL_DEAD_SPRITES[min(level_index, len(LEVEL_DEAD_SPRITES) - 1)]
+
+# Indices de préchargement : images dont les écrans suivants auront besoin.
+def get_state_prefetch_hint(state):
+    if state == "MENU":
+        return ("astro_head", "doctor")
+    if state == "LEVEL_INTRO":
+        return (get_level_dead_sprite_name(game.level_idx), "chat_sleep", get_level_end_item())
+    if state == "BOSS_INTRO":
+        return ("youwin", "ingredient_fragment_croquette", "gameover")
+    if state == "PLAYING":
+        # Ingrédient de fin de niveau : affiché par le HUD dès qu'il est gagné.
+        if game.lives <= 2:
+            return (get_level_end_item(), "gameover")
+        return (get_level_end_item(),)
+    return ()
+
+def get_level_end_item():
+    return levels.levels[min(game.level_idx, len(levels.levels) - 1)]['end_item']
+
+# Les poses d'AstroPaws et des ennemis sont pré-calculées en tâche de fond
+# pendant les écrans d'intro : le MENU s'affiche sans attendre.
+intro_warmup = BackgroundWarmup()
+
+def start_intro_warmup(state):
+    # Appelée à chaque frame d'intro : le nom du travail est vérifié avant de
+    # parcourir les poses, un même travail (niveau ou boss) n'est lancé qu'une fois.
+    if state == "MENU":
+        # La musique de jeu démarre dès LEVEL_INTRO : elle est lue depuis le menu.
+        if intro_warmup.job_name == "menu" or "gameplay" in music_buffers:
+            return False
+        return intro_warmup.start("menu", iter_music_warmup_tasks())
+    level_index = game.level_idx
+    job_name = "boss" if state == "BOSS_INTRO" else f"level{level_index}"
+    if job_name == intro_warmup.job_name:
+        return False
+    tasks = list(iter_music_warmup_tasks()) + list(iter_astro_warmup_tasks())
+    if state == "BOSS_INTRO":
+        width, height = BOSS_SPRITE_SIZE
+        tasks.extend(iter_boss_anim_warmup_tasks(width, height))
+    else:
+        spawn_weights = levels.levels[level_index]['spawn_weights']
+        enemy_types = [enemy_type for enemy_type, weight in spawn_weights.items() if weight > 0]
+        tasks.extend(iter_enemy_warmup_tasks(enemy_types))
+    return intro_warmup.start(job_name, tasks)
+
+def draw_warmup_progress(center_y):
+    # Barre discrète : les caches du niveau se remplissent pendant l'intro.
+    if intro_warmup.finished:
+        return
+    bw, bh = 240, 6
+    bx = screen_width // 2 - bw // 2
+    pygame.draw.rect(screen, (60, 60, 90), (bx, center_y, bw, bh), 1)
+    pygame.draw.rect(screen, CYAN, (bx, center_y, int(bw * intro_warmup.progress), bh))
+
+def await_intro_warmup():
+    # Le joueur a confirmé avant la fin : on termine le travail avant de jouer.
+    if not intro_warmup.finished:
+        intro_warmup.wait()
 
-# Position initiale d'AstroPaws
-astro_x = screen_width // 2
-astro_y = screen_height // 2
-speed = 5  # Vitesse de déplacement
-
-# Gestion des tirs
-bullet_list = []
-bullet_speed = 10
-bullet_width = 10
-bullet_height = 4
-
-# Initialiser le score, les vies et le font
-score = 0
-lives = INITIAL_LIVES
-water_ammo = INITIAL_WATER_AMMO
+# Initialiser les polices
 pygame.font.init()
 # Augmentation de la taille de la police pour une meilleure lisibilité
 score_font = pygame.font.SysFont(None, 48)
+# Overlay de performances (touche G) : FPS, temps par étape, nombre d'entités
+perf_overlay = PerfOverlay(pygame.font.SysFont(None, 20))
+
+def get_perf_entity_counts():
+    return {
+        "ennemis": len(game.enemy_list),
+        "tirs": len(game.bullet_list),
+        "particules": len(particles),
+        "proj. boss": len(game.boss_projectiles),
+    }
 # Police plus petite pour les sous-titres et les blagues
 subtitle_font = pygame.font.SysFont(None, 32)
 highscore_font = pygame.font.SysFont(None, 24)
@@ -869,16 +1048,18 @@ def format_duration(seconds):
     mins, secs = divmod(seconds, 60)
     return f"{mins:02d}:{secs:02d}"
 
-def record_run_result(result_label, now_ms):
+def record_run_result(result_label):
     global highscores, run_recorded, latest_highscore_stamp
     if run_recorded:
         return
+    trace_recorder.instant("run_result", args={"result": result_label, "score": int(game.score)})
     elapsed_seconds = -1
-    if game_start_time is not None:
-        elapsed_seconds = max(0, (now_ms - game_start_time - paused_time_accum) // 1000)
+    elapsed_ms = game.elapsed_ms()
+    if elapsed_ms is not None:
+        elapsed_seconds = max(0, int(elapsed_ms) // 1000)
     stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     entry = {
-        "score": int(score),
+        "score": int(game.score),
         "result": result_label,
         "duration": int(elapsed_seconds),
         "stamp": stamp,
@@ -890,40 +1071,38 @@ def record_run_result(result_label, now_ms):
     save_highscores(highscores)
     run_recorded = True
 
-def draw_highscore_panel(pos_x, pos_y, max_rows=5):
-    panel_width = 300
-    row_height = 22
-    panel_height = 42 + max_rows * row_height
-    panel_rect = pygame.Rect(pos_x, pos_y, panel_width, panel_height)
-    panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    panel.fill((8, 8, 18, 140))
-    pygame.draw.rect(panel, (145, 145, 190, 130), panel.get_rect(), 1)
-    title = highscore_font.render("Hall of Fame", True, GOLD)
-    panel.blit(title, (10, 8))
-    if not highscores:
-        empty = highscore_font.render("Aucun score.", True, WHITE)
-        panel.blit(empty, (10, 24))
-    else:
-        for idx, entry in enumerate(highscores[:max_rows]):
-            row_y = 24 + idx * row_height
-            row_color = WHITE
-            if latest_highscore_stamp is not None and entry.get("stamp") == latest_highscore_stamp:
-                row_color = CYAN
-            rank = highscore_font.render(f"{idx+1}.", True, row_color)
-            label = highscore_font.render(
-                f"{entry.get('score', 0):>4}  {entry.get('result', 'Run')[:3].upper()}  {format_duration(entry.get('duration', -1))}",
-                True,
-                row_color,
-            )
-            panel.blit(rank, (8, row_y))
-            panel.blit(label, (34, row_y))
-    screen.blit(panel, panel_rect.topleft)
+def format_highscore_row(entry):
+    return f"{entry.get('score', 0):>4}  {entry.get('result', 'Run')[:3].upper()}  {format_duration(entry.get('duration', -1))}"
 
-next_shot_allowed_time = 0
-cooldown_time = 300
+# Panneau recomposé seulement quand la liste, la ligne en évidence ou le défilement change
+highscore_panel = HighscorePanel(highscore_font, format_highscore_row)
 
-# Horloge pour contrôler le taux de rafraîchissement (60 FPS)
+def draw_highscore_panel(pos_x, pos_y, max_rows=5):
+    highscore_panel.draw(screen, (pos_x, pos_y), highscores, latest_highscore_stamp, max_rows)
+
+def handle_highscore_event(event, max_rows):
+    # Flèches / croix : une ligne ; Page préc./suiv. : une page ; molette : une ligne
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_UP:
+            highscore_panel.scroll(-1)
+        elif event.key == pygame.K_DOWN:
+            highscore_panel.scroll(1)
+        elif event.key == pygame.K_PAGEUP:
+            highscore_panel.page(-1, max_rows)
+        elif event.key == pygame.K_PAGEDOWN:
+            highscore_panel.page(1, max_rows)
+    elif event.type == pygame.MOUSEWHEEL:
+        highscore_panel.scroll(-event.y)
+    elif event.type == pygame.JOYHATMOTION and event.value[1] != 0:
+        highscore_panel.scroll(-event.value[1])
+
+# Horloge pour contrôler le taux de rafraîchissement (60 FPS par défaut).
+# ASTROPAWS_FPS=120|144|0 (0 = sans limite) : la simulation reste à pas fixe.
 clock = pygame.time.Clock()
+FRAME_RATE_CAP = int(os.environ.get("ASTROPAWS_FPS", "60"))
+# Accumulateur de pas fixes de la simulation (TICK_MS) et actions en attente de pas.
+sim_timestep = FixedTimestep()
+pending_inputs = PlayerInputs()
 
 #
 #
@@ -973,145 +1152,341 @@ story_lines = [
     "Mais parfois… c’est tout ce dont l’univers a besoin."
 ]
 story_scroll_y = float(screen_height)
-story_speed = 0.5  # pixels par frame
+story_speed = 0.5  # pixels par pas de simulation (TICK_MS)
+STORY_LINE_HEIGHT = 36
+STORY_WRAP_WIDTH = 40
+story_line_surfaces = []
+
+def build_story_surfaces():
+    # Texte wrapé et rendu une seule fois ; None pour les lignes vides.
+    surfaces = []
+    for idx, line in enumerate(story_lines):
+        color = GOLD if idx == 0 else WHITE
+        if line == "":
+            surfaces.append(None)
+            continue
+        for sub in textwrap.wrap(line, width=STORY_WRAP_WIDTH):
+            surfaces.append(score_font.render(sub, True, color))
+    return surfaces
+
+def draw_story_lines(scroll_y):
+    # Seules les lignes qui croisent l'écran sont blittées : coût constant,
+    # quelle que soit la longueur du texte (traductions comprises).
+    half_height = STORY_LINE_HEIGHT // 2
+    first = max(0, math.floor((-scroll_y - half_height) / STORY_LINE_HEIGHT))
+    last = min(len(story_line_surfaces), math.ceil((screen_height + half_height - scroll_y) / STORY_LINE_HEIGHT) + 1)
+    for i in range(first, last):
+        surf = story_line_surfaces[i]
+        if surf is not None:
+            rect = surf.get_rect(center=(screen_width//2, int(scroll_y + i*STORY_LINE_HEIGHT)))
+            screen.blit(surf, rect)
 
 running = True
-# --- Variables pour le chronomètre, bouclier, récompense ---
-game_start_time = None
-reward_shown = False
-shield_charges = 0
-shield_active = False
-shield_start_time = None
-shield_duration = 5000  # 5 secondes en ms
-shield_last_granted_time = None  # timestamp de dernière attribution de charge
-shield_cooldown = 30000         # 30 secondes de recharge
+# --- Animations d'interface (l'état de la partie vit dans `game`) ---
 # Animation clignotante pour bouclier dans l'inventaire
 shield_inv_anim = {'active': False, 'start': 0, 'duration': 1000}  # 1 seconde
-hyper_charges = 0               # charges d'hyperespace
-hyper_active = False
-hyper_start_time = None
-hyper_last_granted_time = None
-hyper_unlocked = False
 hyper_inv_anim = {'active': False, 'start': 0, 'duration': 1000}
-hyper_last_fx_time = 0
-astro_vx = 0.0
-astro_vy = 0.0
-astro_move_dx = 0.0
-astro_move_dy = 0.0
-astro_hit_flash_until = 0
-oxidized_debuff_until = 0
-gravity_pull_strength = 0.0
-gravity_pull_planet = None
-boss_active = False
-boss_defeated = False
-boss_data = {}
-boss_projectiles = []
-boss_contact_cooldown_until = 0
-ingredients_collected = []      # liste des ingrédients collectés
 ing_anim_active = False  # indique qu'un nouvel ingrédient doit être animé
 ing_anim_start = 0       # timestamp du début de l'animation
 ing_anim_duration = 1500  # durée de l'animation en ms
-paused_time_accum = 0       # temps total passé en pause (ms)
-pause_start_time = None     # timestamp du début de la pause
+
+def save_run_recording():
+    # La dernière partie jouée reste rejouable (ASTROPAWS_REPLAY=.cache/replays/last_run.json)
+    if active_replay is not None or input_recorder.ticks == 0:
+        return
+    try:
+        input_recorder.save(LAST_RUN_REPLAY_FILE)
+    except OSError:
+        pass
 
 def reset_run_state(start_state="LEVEL_INTRO"):
-    global astro_x, astro_y, astro_facing, astro_vx, astro_vy, astro_move_dx, astro_move_dy, astro_hit_flash_until
-    global score, lives, water_ammo
-    global game_start_time, reward_shown
-    global shield_charges, shield_active, shield_start_time, shield_last_granted_time
-    global hyper_charges, hyper_active, hyper_start_time, hyper_last_granted_time
-    global hyper_unlocked, hyper_inv_anim, hyper_last_fx_time, oxidized_debuff_until
-    global gravity_pull_strength, gravity_pull_planet
-    global boss_active, boss_defeated, boss_data, boss_projectiles, boss_contact_cooldown_until
-    global run_recorded, latest_highscore_stamp
-    global ingredients_collected, ing_anim_active, ing_anim_start
-    global paused_time_accum, pause_start_time, level_idx, game_state, next_shot_allowed_time
-    global enemy_list, explosion_list, bullet_list, water_item_list, hyper_item_list, croquette_list
-
-    astro_x = screen_width // 2
-    astro_y = screen_height // 2
-    astro_facing = "right"
-    astro_vx = 0.0
-    astro_vy = 0.0
-    astro_move_dx = 0.0
-    astro_move_dy = 0.0
-    astro_hit_flash_until = 0
-
-    score = 0
-    lives = INITIAL_LIVES
-    water_ammo = INITIAL_WATER_AMMO
-    level_idx = 0
-    next_shot_allowed_time = 0
-
-    game_start_time = None
-    reward_shown = False
-    shield_charges = 0
-    shield_active = False
-    shield_start_time = None
-    shield_last_granted_time = None
-    hyper_charges = 0
-    hyper_active = False
-    hyper_start_time = None
-    hyper_last_granted_time = None
-    hyper_unlocked = False
+    global hyper_inv_anim, run_recorded, latest_highscore_stamp, score_blink_time
+    global ing_anim_active, ing_anim_start, game_state, pending_inputs
+
+    save_run_recording()
+    if active_replay is not None:
+        run_seed = active_replay.seed
+        active_replay.rewind()
+    else:
+        run_seed = int(FIXED_SEED) if FIXED_SEED else new_seed()
+    # Nouvelle graine : horloge logique, flux aléatoires et fond repartent de zéro
+    game.reset(run_seed)
+    particles.reseed(rng_streams.derive_seed("particles"))
+    input_recorder.start(game, stars=num_stars, planets=num_planets)
+    sim_timestep.reset()
+    timed_overlays.clear()
+    hit_stop.clear()
+    # Publie ce qui est déjà prêt (piste lue depuis le menu) avant d'annuler le reste
+    intro_warmup.pump()
+    intro_warmup.cancel()
+    pending_inputs = PlayerInputs()
     hyper_inv_anim = {'active': False, 'start': 0, 'duration': 1000}
-    hyper_last_fx_time = 0
-    oxidized_debuff_until = 0
-    gravity_pull_strength = 0.0
-    gravity_pull_planet = None
-    boss_active = False
-    boss_defeated = False
-    boss_data = {}
-    boss_projectiles = []
-    boss_contact_cooldown_until = 0
+    # Les animations datées sur l'horloge de jeu repartent avec elle
+    life_anim['active'] = False
+    water_anim['active'] = False
+    shield_inv_anim['active'] = False
+    score_blink_time = 0
     run_recorded = False
     latest_highscore_stamp = None
-    ingredients_collected = []
     ing_anim_active = False
     ing_anim_start = 0
-    paused_time_accum = 0
-    pause_start_time = None
-
-    enemy_list.clear()
-    explosion_list.clear()
-    bullet_list.clear()
-    water_item_list.clear()
-    hyper_item_list.clear()
-    croquette_list = [spawn_croquette() for _ in range(INITIAL_CROQUETTES)]
+    particles.clear()
 
     game_state = start_state
 
+# HUD de jeu : surfaces de texte en cache et calque recomposé à la demande.
+hud_text_cache = TextCache()
+hud_layer = HudLayer((screen_width, screen_height))
+
+def get_playing_hud_key(now_ms):
+    timer_text = None
+    elapsed_ms = game.elapsed_ms()
+    if elapsed_ms is not None:
+        mins, secs = divmod(int(elapsed_ms) // 1000, 60)
+        timer_text = f"{mins:02d}:{secs:02d}"
+    grav_text = None
+    if game.gravity_pull_strength > 0:
+        grav_text = f"Gravite locale: {int(min(99, game.gravity_pull_strength * 550))}%"
+    corrosion_text = None
+    if now_ms < game.oxidized_debuff_until:
+        corrosion_remaining = max(0.0, (game.oxidized_debuff_until - now_ms) / 1000.0)
+        corrosion_text = f"Corrosion: commandes perturbees ({corrosion_remaining:.1f}s)"
+    boss_key = None
+    boss_data = game.boss_data
+    if game.boss_active and boss_data:
+        boss_key = (boss_data['name'], boss_data['phase'], boss_data['health'], boss_data['max_health'])
+    shield_blink = shield_inv_anim['active'] and ((now_ms - shield_inv_anim['start']) // 250) % 2 == 0
+    hyper_blink = game.hyper_active or (hyper_inv_anim['active'] and ((now_ms - hyper_inv_anim['start']) // 250) % 2 == 0)
+    # L'ingrédient en cours de zoom est dessiné hors HUD.
+    ingredients = game.ingredients_collected
+    static_ingredients = tuple(ingredients[:-1] if ing_anim_active else ingredients)
+    return (
+        timer_text,
+        game.score, game.score < 0 and score_blink,
+        game.water_ammo, water_anim['active'],
+        grav_text, corrosion_text, game.lives, boss_key,
+        game.shield_charges, shield_blink, game.hyper_charges, hyper_blink,
+        static_ingredients, game.boss_active, game.level_idx,
+    )
+
+def draw_playing_hud(surface, hud_key):
+    render = hud_text_cache.render
+    (timer_text, score_value, score_alert, water_value, water_flash, grav_text, corrosion_text,
+     lives_value, boss_key, shield_value, shield_blink, hyper_value, hyper_blink,
+     static_ingredients, boss_on, level_index) = hud_key
+    # Chronomètre mm:ss en haut-centre
+    if timer_text is not None:
+        timer_surf = render(score_font, timer_text, WHITE)
+        surface.blit(timer_surf, timer_surf.get_rect(midtop=(screen_width//2, 10)))
+    # Afficher Score (clignote en rouge si score négatif)
+    surface.blit(render(score_font, f"Score: {score_value}", RED if score_alert else WHITE), (10, 10))
+    # Afficher eau (clignote en bleu lors de collecte)
+    surface.blit(render(score_font, f"Water: {water_value}", BLUE if water_flash else WHITE), (10, 50))
+    if grav_text is not None:
+        surface.blit(render(subtitle_font, grav_text, CYAN), (10, 92))
+    if corrosion_text is not None:
+        surface.blit(render(subtitle_font, corrosion_text, (170, 230, 90)), (10, 124))
+    # Afficher les vies sous forme de cœurs en haut à droite
+    for i in range(lives_value):
+        x = screen_width - (heart_sprite.get_width() + 10) * (i + 1)
+        surface.blit(heart_sprite, (x, 10))
+    if boss_key is not None:
+        boss_name, boss_phase, boss_health, boss_max_health = boss_key
+        bw, bh = 320, 14
+        bx, by = screen_width//2 - bw//2, 36
+        ratio = max(0.0, boss_health) / max(1, boss_max_health)
+        pygame.draw.rect(surface, WHITE, (bx, by, bw, bh), 2)
+        pygame.draw.rect(surface, RED, (bx, by, int(bw * ratio), bh))
+        boss_label = render(subtitle_font, f"{boss_name} - Phase {boss_phase}", WHITE)
+        surface.blit(boss_label, boss_label.get_rect(midbottom=(screen_width//2, by - 4)))
+
+    # Affichage de l'inventaire en bas à gauche (icônes + compteurs)
+    x0 = 10
+    # Positionner l'inventaire 10px au-dessus du bord inférieur, en fonction de la hauteur de l'icône
+    y0 = screen_height - shield_icon.get_height() - 10
+    # Bouclier (compteur clignotant)
+    surface.blit(shield_icon, (x0, y0))
+    shield_count = render(score_font, f"x{shield_value}", CYAN if shield_blink else WHITE)
+    surface.blit(shield_count, (x0 + shield_icon.get_width() + 10, y0 + 4))
+    # Hyperdrive
+    surface.blit(hyper_icon, (x0 + 100, y0))
+    hyper_count = render(score_font, f"x{hyper_value}", YELLOW if hyper_blink else WHITE)
+    surface.blit(hyper_count, (x0 + 100 + hyper_icon.get_width() + 10, y0 + 4))
+    # Icône générique d'ingrédient (toujours présente) puis ingrédients collectés
+    inv_base_x = x0 + 200
+    surface.blit(ingredient_icon, (inv_base_x, y0))
+    offset_x = inv_base_x + ingredient_icon.get_width() + 10
+    for idx, ing_key in enumerate(static_ingredients):
+        ing_sprite = get_ingredient_sprite(ing_key)
+        surface.blit(ing_sprite, (offset_x + idx * (ing_sprite.get_width() + 10), y0))
+
+    # Afficher le numéro de niveau en bas à droite
+    level_label = "BOSS FINAL" if boss_on else f"Level {level_index+1}"
+    lvl_surf = render(score_font, level_label, WHITE)
+    surface.blit(lvl_surf, lvl_surf.get_rect(bottomright=(screen_width - 10, screen_height - 10)))
+
+# Fin de niveau : état LEVEL_COMPLETE (sprite vaincu qui rétrécit et s'efface),
+# piloté par la boucle principale.
+LEVEL_COMPLETE_DURATION = 2000  # ms
+# Réduction et fondu du sprite « vaincu » : images pré-calculées une fois par
+# sprite (comme les tables de pulsation), choisies d'après la progression.
+LEVEL_COMPLETE_FRAMES = 60
+level_complete_frames = {}
+
+def build_level_complete_frames(sprite):
+    frames = []
+    for idx in range(LEVEL_COMPLETE_FRAMES + 1):
+        progress = idx / LEVEL_COMPLETE_FRAMES
+        scale = 1.0 - 0.5 * progress
+        w = max(1, int(sprite.get_width() * scale))
+        h = max(1, int(sprite.get_height() * scale))
+        frame = pygame.transform.scale(sprite, (w, h))
+        frame.set_alpha(int(255 * (1 - progress)))
+        frames.append(frame)
+    return frames
+
+def get_level_complete_frames(level_index):
+    name = get_level_dead_sprite_name(level_index)
+    frames = level_complete_frames.get(name)
+    if frames is None:
+        frames = level_complete_frames[name] = build_level_complete_frames(sprite_assets.get(name))
+    return frames
+level_complete_anim = {'start': 0, 'level': 0, 'message': None}
+
+def start_level_complete(finished_level):
+    global game_state
+    level_complete_anim['start'] = pygame.time.get_ticks()
+    level_complete_anim['level'] = finished_level
+    get_level_complete_frames(finished_level)
+    level_complete_anim['message'] = score_font.render(
+        f"{levels.levels[finished_level]['name']} terminé !", True, WHITE
+    )
+    game_state = "LEVEL_COMPLETE"
+
+def draw_level_complete_frame(elapsed_ms):
+    # Renvoie True une fois l'animation terminée.
+    progress = min(1.0, elapsed_ms / LEVEL_COMPLETE_DURATION)
+    anim_img = get_level_complete_frames(level_complete_anim['level'])[int(progress * LEVEL_COMPLETE_FRAMES)]
+    screen.fill(BLACK)
+    background.draw(screen)
+    rect = anim_img.get_rect(center=(screen_width//2, screen_height//2 - 50))
+    screen.blit(anim_img, rect)
+    msg = level_complete_anim['message']
+    screen.blit(msg, msg.get_rect(center=(screen_width//2, screen_height//2 + 50)))
+    return progress >= 1.0
+
+# Messages temporisés et gel de la simulation (hit-stop), en ms d'horloge murale
+timed_overlays = OverlayQueue()
+hit_stop = HitStop()
+LIFE_LOST_MESSAGE_MS = 1000
+LIFE_LOST_HIT_STOP_MS = 1000
+REWARD_SCREEN_MS = 2000
+reward_screen_start = 0
+
+def apply_sim_events(events):
+    # Effets visuels/sonores et transitions d'écran publiés par la simulation.
+    global game_state, ing_anim_active, ing_anim_start, reward_screen_start
+    for event in events:
+        kind = event[0]
+        if kind == "explosion":
+            create_explosion(*event[1:])
+        elif kind == "sound":
+            play_sound(sim_sounds.get(event[1]))
+        elif kind == "water_pickup":
+            # Déclencher clignotement du compteur d'eau
+            water_anim['active'] = True
+            water_anim['start'] = game.now
+        elif kind == "shield_inventory":
+            # Animer l'icône de bouclier dans l'inventaire
+            shield_inv_anim['active'] = True
+            shield_inv_anim['start'] = game.now
+        elif kind == "hyper_inventory":
+            hyper_inv_anim['active'] = True
+            hyper_inv_anim['start'] = game.now
+        elif kind == "ingredient":
+            # Animer l'ajout de l'ingrédient
+            ing_anim_active = True
+            ing_anim_start = game.now
+        elif kind == "life_lost":
+            # Déclencher explosion du cœur retiré
+            life_anim['active'] = True
+            life_anim['index'] = event[1]  # index du cœur supprimé
+            life_anim['start'] = game.now
+            heart_x = screen_width - (heart_sprite.get_width() + 10) * (life_anim['index'] + 1) + heart_sprite.get_width()//2
+            heart_y = 10 + heart_sprite.get_height()//2
+            create_explosion(heart_x, heart_y, color=RED, num_particles=30)
+            # Message temporisé et simulation figée, sans bloquer la boucle
+            wall_ms = pygame.time.get_ticks()
+            lost_life_surface = score_font.render("Vous avez perdu une vie!", True, WHITE)
+            timed_overlays.show(lost_life_surface, (screen_width//2, screen_height//2), wall_ms, LIFE_LOST_MESSAGE_MS)
+            hit_stop.trigger(wall_ms, LIFE_LOST_HIT_STOP_MS)
+        elif kind == "reward":
+            reward_screen_start = pygame.time.get_ticks()
+            game_state = "REWARD"
+        elif kind == "boss_phase":
+            trace_recorder.instant("boss_phase", args={"phase": event[1]})
+        elif kind == "boss_intro":
+            particles.clear()
+            game_state = "BOSS_INTRO"
+        elif kind == "level_complete":
+            particles.clear()
+            # Animation de fin de niveau, puis intro du niveau suivant.
+            start_level_complete(event[1])
+        elif kind == "final_win":
+            record_run_result("WIN")
+            save_run_recording()
+            game_state = "FINAL_WIN"
+        elif kind == "game_over":
+            # Passer en écran de Game Over
+            record_run_result("KO")
+            save_run_recording()
+            game_state = "GAME_OVER"
+
 now = 0
 while running:
-    # Limiter le jeu à 60 images par seconde
-    clock.tick(60)
+    frame_profiler.next_frame(game_state)
+    # Limiter le rendu (60 images par seconde par défaut)
+    frame_ms = clock.tick(FRAME_RATE_CAP)
+    # Défilements hors simulation (MENU, STORY) : en pas de TICK_MS, quelle que
+    # soit la cadence d'affichage ; une frame bloquée ne fait pas sauter le fond.
+    scroll_steps = min(frame_ms, MAX_FRAME_MS) / TICK_MS
+    frame_profiler.mark("wait")
     # Temps courant
     now = pygame.time.get_ticks()
     set_music(music_for_state(game_state))
-    cooldown_time = get_shot_cooldown(level_idx, boss_active)
-    # Initialiser le chronomètre au début du jeu
-    if game_state == "PLAYING" and game_start_time is None:
-        game_start_time = now
-    # Déclencher la récompense à 30 secondes
-    if game_state == "PLAYING" and not boss_active and not reward_shown and game_start_time is not None and now - game_start_time >= 30000:
-        game_state = "REWARD"
+    # Préchargement des images des écrans suivants : au plus une par frame
+    sprite_assets.prefetch(get_state_prefetch_hint(game_state))
+    sprite_assets.pump()
+    frame_profiler.mark("assets")
+
+    # === Transition WARP (tunnel d'étoiles vers l'état suivant) ===
+    if game_state == "WARP":
+        for event in pygame.event.get():
+            handle_global_event(event)
+            if event.type == pygame.QUIT:
+                running = False
+        if draw_warp_frame(now - warp_anim['start']):
+            # Régénérer les étoiles pour le prochain level
+            background.regenerate_stars()
+            game_state = warp_anim['next_state']
+        present_frame()
+        continue
+
+    # === Transition LEVEL_COMPLETE (passable avec C / A) ===
+    if game_state == "LEVEL_COMPLETE":
+        skip = False
+        for event in pygame.event.get():
+            handle_global_event(event)
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_c, pygame.K_SPACE):
+                skip = True
+            elif event.type == pygame.JOYBUTTONDOWN and event.button in CONTROLLER_CONFIRM_BUTTONS:
+                skip = True
+        if draw_level_complete_frame(now - level_complete_anim['start']) or skip:
+            game_state = "LEVEL_INTRO"
+        present_frame()
         continue
-    # Recharge automatique du bouclier toutes les shield_cooldown ms
-    if game_state == "PLAYING" and reward_shown and shield_last_granted_time is not None and now - shield_last_granted_time >= shield_cooldown:
-        shield_charges += 1
-        shield_last_granted_time = now
-        # Animer l'icône de bouclier dans l'inventaire
-        shield_inv_anim['active'] = True
-        shield_inv_anim['start'] = now
-    # Fin du dash Hyperdrive
-    if game_state == "PLAYING" and hyper_active and hyper_start_time is not None and now - hyper_start_time >= HYPER_DASH_DURATION:
-        hyper_active = False
-    # Recharge automatique de l'Hyperdrive après déblocage
-    if game_state == "PLAYING" and hyper_unlocked and hyper_last_granted_time is not None and now - hyper_last_granted_time >= HYPER_COOLDOWN:
-        hyper_charges += 1
-        hyper_last_granted_time = now
-        hyper_inv_anim['active'] = True
-        hyper_inv_anim['start'] = now
 
     # === Écran INFO ===
     if game_state == "INFO":
@@ -1132,7 +1507,7 @@ while running:
         now = pygame.time.get_ticks()
         angle = 5 * math.sin(now / 500)           # amplitude 5° en 1s
         y_bob = 10 + 10 * math.sin(now / 400)     # amplitude 10px en 0.8s
-        rotated_doc = pygame.transform.rotate(doctor_image, angle)
+        rotated_doc = transform_cache.rotate(sprite_assets.get("doctor"), angle)
         doc_rect = rotated_doc.get_rect(topright=(screen_width - 10, y_bob))
         screen.blit(rotated_doc, doc_rect)
         # Liste des entrées
@@ -1163,9 +1538,9 @@ while running:
                 else:
                     # cœur plus grand et ennemis à taille du chien
                     if icon == heart_sprite:
-                        display_icon = pygame.transform.scale(icon, (40, 40))
+                        display_icon = transform_cache.scale(icon, (40, 40))
                     elif icon in (mouse_sprite, rat_sprite):
-                        display_icon = pygame.transform.scale(icon, dog_sprite.get_size())
+                        display_icon = transform_cache.scale(icon, dog_sprite.get_size())
                     else:
                         display_icon = icon
                     screen.blit(display_icon, (50, y))
@@ -1199,42 +1574,17 @@ while running:
                 if event.button in CONTROLLER_CONFIRM_BUTTONS or event.button in CONTROLLER_BACK_BUTTONS:
                     story_scroll_y = float(screen_height)
                     game_state = "MENU"
-        # Animer fond (étoiles+planètes)
-        for star in star_list:
-            star['x'] += star['speed']
-            star['y'] += star['speed'] * 0.5
-            if star['x'] > screen_width:
-                star['x'] = 0
-                star['y'] = random.randint(0, screen_height)
-        for planet in planet_list:
-            planet['x'] += planet['speed']
-            planet['y'] += planet['speed'] * 0.2
-            if planet['x'] > screen_width:
-                planet['x'] = 0
-                planet['y'] = random.randint(0, screen_height)
+        # Défilement du fond (couches de parallaxe)
+        background.update(scroll_steps)
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
-        # Préparer le texte wrapé
-        display_lines = []
-        for idx, line in enumerate(story_lines):
-            color = GOLD if idx == 0 else WHITE
-            if line == "":
-                display_lines.append(("", color))
-            else:
-                for sub in textwrap.wrap(line, width=40):
-                    display_lines.append((sub, color))
+        background.draw(screen)
+        if not story_line_surfaces:
+            story_line_surfaces = build_story_surfaces()
         # Afficher lignes défilantes
-        line_height = 36
-        for i, (text, color) in enumerate(display_lines):
-            surf = score_font.render(text, True, color)
-            rect = surf.get_rect(center=(screen_width//2, int(story_scroll_y + i*line_height)))
-            screen.blit(surf, rect)
-        story_scroll_y -= story_speed
+        draw_story_lines(story_scroll_y)
+        story_scroll_y -= story_speed * scroll_steps
         # Retour menu quand fini
-        if story_scroll_y + len(display_lines)*line_height < 0:
+        if story_scroll_y + len(story_line_surfaces)*STORY_LINE_HEIGHT < 0:
             story_scroll_y = float(screen_height)
             game_state = "MENU"
         present_frame()
@@ -1242,9 +1592,12 @@ while running:
 
     # === Écran MENU ===
     if game_state == "MENU":
+        start_intro_warmup(game_state)
+        intro_warmup.pump()
         # Gestion des événements pour quitter, démarrer ou story/info
         for event in pygame.event.get():
             handle_global_event(event)
+            handle_highscore_event(event, 4)
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -1267,26 +1620,13 @@ while running:
                     game_state = "INFO"
                 elif event.button in CONTROLLER_BACK_BUTTONS:
                     running = False
-        # Animation de fond (étoiles et planètes)
-        for star in star_list:
-            star['x'] += star['speed']
-            star['y'] += star['speed'] * 0.5
-            if star['x'] > screen_width:
-                star['x'] = 0
-                star['y'] = random.randint(0, screen_height)
-        for planet in planet_list:
-            planet['x'] += planet['speed']
-            planet['y'] += planet['speed'] * 0.2
-            if planet['x'] > screen_width:
-                planet['x'] = 0
-                planet['y'] = random.randint(0, screen_height)
+        # Défilement du fond (couches de parallaxe)
+        background.update(scroll_steps)
         # Affichage du fond étoilé
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
+        background.draw(screen)
         # Afficher l'image d'accueil
+        welcome_image = sprite_assets.get("welcome")
         image_rect = welcome_image.get_rect(midtop=(screen_width//2, 50))
         screen.blit(welcome_image, image_rect)
         # Clignotement du texte
@@ -1312,8 +1652,17 @@ while running:
         controller_surf = subtitle_font.render(controller_label, True, CYAN if active_controller else WHITE)
         controller_rect = controller_surf.get_rect(center=(screen_width//2, prompt_y_base + 160))
         screen.blit(controller_surf, controller_rect)
-        crt_state = "ON" if crt_filter_enabled else "OFF"
-        crt_surf = subtitle_font.render(f"Filtre CRT (F/LB): {crt_state}", True, WHITE)
+        if not crt_postprocess.measured:
+            # Mesure unique des trois niveaux, au premier affichage du menu.
+            crt_postprocess.measure_tier_costs(screen)
+        # Coût de chaque niveau ; le niveau actif est entre crochets.
+        crt_costs = []
+        for tier in reversed(crt.CRT_TIERS):
+            label = tier.upper()
+            if tier != "off":
+                label += f" {crt_postprocess.tier_cost_ms[tier]:.1f}"
+            crt_costs.append(f"[{label}]" if tier == crt_postprocess.tier else label)
+        crt_surf = subtitle_font.render(f"Filtre CRT (F/LB, ms): {'  '.join(crt_costs)}", True, WHITE)
         crt_rect = crt_surf.get_rect(center=(screen_width//2, prompt_y_base + 192))
         screen.blit(crt_surf, crt_rect)
         draw_highscore_panel(screen_width - 316, 16, max_rows=4)
@@ -1325,6 +1674,9 @@ while running:
         continue
     # === Écran LEVEL_INTRO ===
     if game_state == "LEVEL_INTRO":
+        # Pré-chauffage des caches du niveau pendant que le joueur lit l'intro
+        start_intro_warmup(game_state)
+        intro_warmup.pump()
         # Gérer la sortie ou continuer
         for event in pygame.event.get():
             handle_global_event(event)
@@ -1333,23 +1685,21 @@ while running:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_c:
                     # Warp spatial avant de démarrer le niveau
-                    warp_effect()
-                    game_state = "PLAYING"
+                    await_intro_warmup()
+                    start_warp("PLAYING")
                 elif event.key == pygame.K_q:
                     running = False
             elif event.type == pygame.JOYBUTTONDOWN:
                 if event.button in CONTROLLER_CONFIRM_BUTTONS:
-                    warp_effect()
-                    game_state = "PLAYING"
+                    await_intro_warmup()
+                    start_warp("PLAYING")
                 elif event.button in CONTROLLER_BACK_BUTTONS:
                     running = False
         # Fond étoilé
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
+        background.draw(screen)
         # Numérotation du niveau
+        level_idx = game.level_idx
         level_str = f"Niveau {level_idx+1}"
         level_surf = score_font.render(level_str, True, WHITE)
         level_rect = level_surf.get_rect(center=(screen_width//2, 30))
@@ -1360,7 +1710,8 @@ while running:
         # VS layout sous le titre
         # Animation de hochement de tête d'AstroPaws
         head_angle = 10 * math.sin(now / 300)  # amplitude 10°, période ~600ms
-        rotated_head = pygame.transform.rotate(astro_head, head_angle)
+        astro_head = sprite_assets.get("astro_head")
+        rotated_head = transform_cache.rotate(astro_head, head_angle)
         ah_rect = rotated_head.get_rect(center=(screen_width//4, y_offset + 80))
         screen.blit(rotated_head, ah_rect)
         vs_surf = score_font.render("VS.", True, YELLOW)
@@ -1372,7 +1723,7 @@ while running:
         pulse = 1 + 0.1 * math.sin(now / 200)
         base_w, base_h = astro_head.get_size()
         anim_size = (int(base_w * pulse), int(base_h * pulse))
-        animated_enemy = pygame.transform.scale(enemy_sprite, anim_size)
+        animated_enemy = transform_cache.scale(enemy_sprite, anim_size)
         eh_rect = animated_enemy.get_rect(center=(3 * screen_width // 4, y_offset + 80))
         screen.blit(animated_enemy, eh_rect)
 
@@ -1398,6 +1749,7 @@ while running:
             screen.blit(surf, rect)
 
         # Poursuivre
+        draw_warmup_progress(screen_height - 84)
         cont_surf = score_font.render("Press C / A to continue", True, GREEN)
         cont_rect = cont_surf.get_rect(center=(screen_width//2, screen_height - 50))
         screen.blit(cont_surf, cont_rect)
@@ -1406,28 +1758,27 @@ while running:
 
     # === Écran BOSS_INTRO ===
     if game_state == "BOSS_INTRO":
+        start_intro_warmup(game_state)
+        intro_warmup.pump()
         for event in pygame.event.get():
             handle_global_event(event)
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_c:
-                    warp_effect()
-                    game_state = "PLAYING"
+                    await_intro_warmup()
+                    start_warp("PLAYING")
                 elif event.key == pygame.K_q:
                     running = False
             elif event.type == pygame.JOYBUTTONDOWN:
                 if event.button in CONTROLLER_CONFIRM_BUTTONS:
-                    warp_effect()
-                    game_state = "PLAYING"
+                    await_intro_warmup()
+                    start_warp("PLAYING")
                 elif event.button in CONTROLLER_BACK_BUTTONS:
                     running = False
 
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
+        background.draw(screen)
 
         title = score_font.render("ALERTE BOSS FINAL", True, RED)
         title_rect = title.get_rect(center=(screen_width // 2, 60))
@@ -1437,7 +1788,7 @@ while running:
         boss_name_rect = boss_name.get_rect(center=(screen_width // 2, 110))
         screen.blit(boss_name, boss_name_rect)
 
-        boss_preview = pygame.transform.smoothscale(dog_sprite, (180, 120))
+        boss_preview = get_boss_base_sprite(BOSS_SPRITE_SIZE[0], BOSS_SPRITE_SIZE[1])
         preview_rect = boss_preview.get_rect(center=(screen_width // 2, 240))
         screen.blit(boss_preview, preview_rect)
         pygame.draw.circle(screen, GOLD, (preview_rect.centerx, preview_rect.top - 8), 6)
@@ -1449,6 +1800,7 @@ while running:
         screen.blit(line2, line2.get_rect(center=(screen_width // 2, 394)))
         screen.blit(line3, line3.get_rect(center=(screen_width // 2, 428)))
 
+        draw_warmup_progress(screen_height - 84)
         cont_surf = score_font.render("Press C / A to engage", True, GREEN)
         cont_rect = cont_surf.get_rect(center=(screen_width//2, screen_height - 50))
         screen.blit(cont_surf, cont_rect)
@@ -1459,10 +1811,7 @@ while running:
     if game_state == "REWARD":
         # Fond étoilé
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
+        background.draw(screen)
         # Texte de récompense
         text = score_font.render("Bouclier acquis !", True, CYAN)
         rect = text.get_rect(center=(screen_width//2, screen_height//2 - 50))
@@ -1470,25 +1819,27 @@ while running:
         # Cercle bouclier
         pygame.draw.circle(screen, CYAN, (screen_width//2, screen_height//2 + 10), 50, 4)
         # Petite tête d'AstroPaws
-        small = pygame.transform.scale(astro_sprite_right, (40, 40))
+        small = transform_cache.scale(astro_sprite_right, (40, 40))
         srect = small.get_rect(center=(screen_width//2, screen_height//2 + 10))
         screen.blit(small, srect)
         # Informations sur le bouclier
         info1 = score_font.render("H / X pour activer le bouclier", True, WHITE)
         info1_rect = info1.get_rect(center=(screen_width//2, screen_height//2 + 80))
         screen.blit(info1, info1_rect)
-        info2 = score_font.render(f"Durée: {shield_duration//1000}s   Utilisations: 1", True, WHITE)
+        info2 = score_font.render(f"Durée: {SHIELD_DURATION//1000}s   Utilisations: 1", True, WHITE)
         info2_rect = info2.get_rect(center=(screen_width//2, screen_height//2 + 120))
         screen.blit(info2, info2_rect)
         present_frame()
-        pygame.time.delay(2000)
-        # Octroi de la charge de bouclier
-        shield_charges = 1
-        shield_last_granted_time = now
-        reward_shown = True
-        shield_inv_anim['active'] = True
-        shield_inv_anim['start'] = now
-        game_state = "PLAYING"
+        # Écran affiché REWARD_SCREEN_MS sans bloquer les événements
+        for event in pygame.event.get():
+            handle_global_event(event)
+            if event.type == pygame.QUIT:
+                running = False
+        if now - reward_screen_start >= REWARD_SCREEN_MS:
+            # La charge de bouclier est déjà octroyée par la simulation
+            shield_inv_anim['active'] = True
+            shield_inv_anim['start'] = game.now
+            game_state = "PLAYING"
         continue
     # === Écran PAUSE ===
     if game_state == "PAUSE":
@@ -1499,15 +1850,12 @@ while running:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:
-                    paused_time_accum += now - pause_start_time
-                    pause_start_time = None
+                    # La simulation n'avance pas en pause : rien à décompter
                     game_state = "PLAYING"
                 elif event.key == pygame.K_q:
                     running = False
             elif event.type == pygame.JOYBUTTONDOWN:
                 if event.button in CONTROLLER_CONFIRM_BUTTONS or event.button in CONTROLLER_PAUSE_BUTTONS:
-                    paused_time_accum += now - pause_start_time
-                    pause_start_time = None
                     game_state = "PLAYING"
                 elif event.button in CONTROLLER_BACK_BUTTONS:
                     running = False
@@ -1519,14 +1867,14 @@ while running:
             pause_blink = not pause_blink
             pause_blink_time = now
         # Stats en pause
-        score_surface = score_font.render(f"Score: {score}", True, WHITE)
+        score_surface = score_font.render(f"Score: {game.score}", True, WHITE)
         screen.blit(score_surface, (10, 10))
         # Afficher la quantité d'eau avec icône
         screen.blit(water_sprite, (10, 50))
-        water_count = score_font.render(f"x{water_ammo}", True, WHITE)
+        water_count = score_font.render(f"x{game.water_ammo}", True, WHITE)
         screen.blit(water_count, (10 + water_sprite.get_width() + 10, 50 + (water_sprite.get_height() - water_count.get_height())//2))
         # Afficher les vies sous forme de cœurs
-        for i in range(lives):
+        for i in range(game.lives):
             hx = 10 + i * (heart_sprite.get_width() + 5)
             hy = 50 + water_sprite.get_height() + 10
             screen.blit(heart_sprite, (hx, hy))
@@ -1535,12 +1883,12 @@ while running:
         inv_y = 130
         # Bouclier
         screen.blit(shield_icon, (inv_x, inv_y))
-        shield_count = score_font.render(f"x{shield_charges}", True, WHITE)
+        shield_count = score_font.render(f"x{game.shield_charges}", True, WHITE)
         screen.blit(shield_count, (inv_x + shield_icon.get_width() + 10, inv_y + 12))
         # Hyperdrive
         screen.blit(hyper_icon, (inv_x + 120, inv_y))
-        hyper_color = YELLOW if hyper_active or (hyper_inv_anim['active'] and ((now - hyper_inv_anim['start']) // 250) % 2 == 0) else WHITE
-        hyper_count = score_font.render(f"x{hyper_charges}", True, hyper_color)
+        hyper_color = YELLOW if game.hyper_active or (hyper_inv_anim['active'] and ((game.now - hyper_inv_anim['start']) // 250) % 2 == 0) else WHITE
+        hyper_count = score_font.render(f"x{game.hyper_charges}", True, hyper_color)
         screen.blit(hyper_count, (inv_x + 120 + hyper_icon.get_width() + 10, inv_y + 12))
         # Ingrédients collectés : icône générique + sprites spécifiques clignotants
         base_x = inv_x + 240
@@ -1548,10 +1896,10 @@ while running:
         offset_x = base_x + ingredient_icon.get_width() + 10
         # Clignotement à 500ms
         blink_on = ((now // 500) % 2) == 0
-        for idx, ing_key in enumerate(ingredients_collected):
+        for idx, ing_key in enumerate(game.ingredients_collected):
             if not blink_on:
                 break  # tout clignote ensemble, on peut stopper si off
-            ing_sprite = ingredient_sprites.get(ing_key, ingredient_icon)
+            ing_sprite = get_ingredient_sprite(ing_key)
             x = offset_x + idx * (ing_sprite.get_width() + 10)
             screen.blit(ing_sprite, (x, inv_y))
         # Titre PAUSE clignotant
@@ -1568,6 +1916,7 @@ while running:
         quit_rect = quit_surf.get_rect(center=(screen_width//2, screen_height//2 + 60))
         screen.blit(quit_surf, quit_rect)
         # Afficher le chat endormi en bas de l'écran de pause
+        chat_sleep_image = sprite_assets.get("chat_sleep")
         chat_rect = chat_sleep_image.get_rect(midbottom=(screen_width//2, screen_height - 10))
         screen.blit(chat_sleep_image, chat_rect)
         present_frame()
@@ -1576,10 +1925,11 @@ while running:
     # === Écran GAME_OVER ===
     if game_state == "GAME_OVER":
         if not run_recorded:
-            record_run_result("KO", now)
+            record_run_result("KO")
         # Gestion des événements
         for event in pygame.event.get():
             handle_global_event(event)
+            handle_highscore_event(event, 4)
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -1594,17 +1944,15 @@ while running:
                     running = False
         # Affichage du fond spatial
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
+        background.draw(screen)
         # Afficher l'image Game Over
+        gameover_image = sprite_assets.get("gameover")
         go_rect = gameover_image.get_rect(center=(screen_width//2, screen_height//2 - 50))
         screen.blit(gameover_image, go_rect)
         # Afficher les stats
-        screen.blit(score_font.render(f"Score: {score}", True, WHITE), (10, 10))
-        screen.blit(score_font.render(f"Water: {water_ammo}", True, WHITE), (10, 50))
-        screen.blit(score_font.render(f"Lives: {lives}", True, WHITE), (10, 90))
+        screen.blit(score_font.render(f"Score: {game.score}", True, WHITE), (10, 10))
+        screen.blit(score_font.render(f"Water: {game.water_ammo}", True, WHITE), (10, 50))
+        screen.blit(score_font.render(f"Lives: {game.lives}", True, WHITE), (10, 90))
         # Afficher les options
         r_surf = score_font.render("Press R / A to return to menu", True, GREEN)
         q_surf = score_font.render("Press Q / B to quit", True, RED)
@@ -1617,9 +1965,10 @@ while running:
     # === Écran victoire finale ===
     if game_state == "FINAL_WIN":
         if not run_recorded:
-            record_run_result("WIN", now)
+            record_run_result("WIN")
         for event in pygame.event.get():
             handle_global_event(event)
+            handle_highscore_event(event, 6)
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
@@ -1638,21 +1987,19 @@ while running:
                     running = False
 
         screen.fill(BLACK)
-        for star in star_list:
-            pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-        for planet in planet_list:
-            pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
+        background.draw(screen)
 
         title = score_font.render("MISSION ACCOMPLIE !", True, GOLD)
         title_rect = title.get_rect(center=(screen_width//2, 70))
         screen.blit(title, title_rect)
 
+        youwin_image = sprite_assets.get("youwin")
         yw_rect = youwin_image.get_rect(center=(screen_width//2, screen_height//2 - 10))
         screen.blit(youwin_image, yw_rect)
 
-        elapsed_seconds = max(0, (now - game_start_time - paused_time_accum) // 1000) if game_start_time else 0
+        elapsed_seconds = max(0, int(game.elapsed_ms() or 0) // 1000)
         summary = subtitle_font.render(
-            f"Score final: {score} | Ingredients: {len(ingredients_collected)} | Temps: {format_duration(elapsed_seconds)}",
+            f"Score final: {game.score} | Ingredients: {len(game.ingredients_collected)} | Temps: {format_duration(elapsed_seconds)}",
             True,
             WHITE,
         )
@@ -1678,676 +2025,80 @@ while running:
         continue
 
     # === Écran JEU (PLAYING) ===
-    # Gestion des événements
+    # Gestion des événements : actions gardées jusqu'au prochain pas de simulation
+    inputs = pending_inputs
     for event in pygame.event.get():
         handle_global_event(event)
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_p:
-                pause_start_time = now
                 game_state = "PAUSE"
                 break
-            if event.key == pygame.K_h and shield_charges > 0 and not shield_active:
-                shield_active = True
-                shield_start_time = now
-                shield_charges -= 1
-                create_explosion(astro_x + 40, astro_y + 40, color=BLUE, num_particles=20)
-            if event.key == pygame.K_j and hyper_charges > 0 and not hyper_active:
-                hyper_active = True
-                hyper_start_time = now
-                hyper_last_fx_time = now
-                hyper_charges -= 1
-                hyper_last_granted_time = now
-                hyper_inv_anim['active'] = True
-                hyper_inv_anim['start'] = now
-                create_explosion(astro_x + 40, astro_y + 40, color=YELLOW, num_particles=35)
-                dash_impulse = speed * 1.8
-                if astro_facing == "left":
-                    astro_vx -= dash_impulse
-                elif astro_facing == "right":
-                    astro_vx += dash_impulse
-                elif astro_facing == "up":
-                    astro_vy -= dash_impulse
-                else:
-                    astro_vy += dash_impulse
-                play_sound(hyper_dash_sound)
+            if event.key == pygame.K_h:
+                inputs.shield = True
+            if event.key == pygame.K_j:
+                inputs.hyper = True
             if event.key == pygame.K_SPACE:
-                current_time = pygame.time.get_ticks()
                 keys = pygame.key.get_pressed()
-                shot_x = 0.0
-                shot_y = 0.0
-                if keys[pygame.K_LEFT]:
-                    shot_x -= 1.0
-                if keys[pygame.K_RIGHT]:
-                    shot_x += 1.0
-                if keys[pygame.K_UP]:
-                    shot_y -= 1.0
-                if keys[pygame.K_DOWN]:
-                    shot_y += 1.0
-                if shot_x == 0.0 and shot_y == 0.0:
-                    shot_x, shot_y = facing_to_vector(astro_facing)
-                fire_player_bullet(shot_x, shot_y, current_time)
+                inputs.fire = True
+                inputs.fire_x = float(keys[pygame.K_RIGHT]) - float(keys[pygame.K_LEFT])
+                inputs.fire_y = float(keys[pygame.K_DOWN]) - float(keys[pygame.K_UP])
         elif event.type == pygame.JOYBUTTONDOWN:
             if event.button in CONTROLLER_PAUSE_BUTTONS:
-                pause_start_time = now
                 game_state = "PAUSE"
                 break
-            if event.button in CONTROLLER_SHIELD_BUTTONS and shield_charges > 0 and not shield_active:
-                shield_active = True
-                shield_start_time = now
-                shield_charges -= 1
-                create_explosion(astro_x + 40, astro_y + 40, color=BLUE, num_particles=20)
-            if event.button in CONTROLLER_HYPER_BUTTONS and hyper_charges > 0 and not hyper_active:
-                hyper_active = True
-                hyper_start_time = now
-                hyper_last_fx_time = now
-                hyper_charges -= 1
-                hyper_last_granted_time = now
-                hyper_inv_anim['active'] = True
-                hyper_inv_anim['start'] = now
-                create_explosion(astro_x + 40, astro_y + 40, color=YELLOW, num_particles=35)
-                dash_impulse = speed * 1.8
-                if astro_facing == "left":
-                    astro_vx -= dash_impulse
-                elif astro_facing == "right":
-                    astro_vx += dash_impulse
-                elif astro_facing == "up":
-                    astro_vy -= dash_impulse
-                else:
-                    astro_vy += dash_impulse
-                play_sound(hyper_dash_sound)
+            if event.button in CONTROLLER_SHIELD_BUTTONS:
+                inputs.shield = True
+            if event.button in CONTROLLER_HYPER_BUTTONS:
+                inputs.hyper = True
             if event.button in CONTROLLER_SHOOT_BUTTONS:
-                current_time = pygame.time.get_ticks()
-                shot_x, shot_y = get_controller_move_vector()
-                if shot_x == 0.0 and shot_y == 0.0:
-                    shot_x, shot_y = facing_to_vector(astro_facing)
-                fire_player_bullet(shot_x, shot_y, current_time)
+                inputs.fire = True
+                inputs.fire_x, inputs.fire_y = get_controller_move_vector()
+    if game_state != "PLAYING":
+        continue
 
     # Gestion continue des touches (pour détecter plusieurs touches en même temps)
     keys = pygame.key.get_pressed()
-    # Déplacement inertiel : accélération, friction, glisse spatiale.
-    input_x = 0.0
-    input_y = 0.0
-    if keys[pygame.K_LEFT]:
-        input_x -= 1.0
-    if keys[pygame.K_RIGHT]:
-        input_x += 1.0
-    if keys[pygame.K_UP]:
-        input_y -= 1.0
-    if keys[pygame.K_DOWN]:
-        input_y += 1.0
     pad_x, pad_y = get_controller_move_vector()
-    input_x += pad_x
-    input_y += pad_y
-    input_x = max(-1.0, min(1.0, input_x))
-    input_y = max(-1.0, min(1.0, input_y))
-    if input_x != 0 and input_y != 0:
-        input_x *= 0.7071
-        input_y *= 0.7071
-
-    if input_x < 0:
-        astro_facing = "left"
-    elif input_x > 0:
-        astro_facing = "right"
-    elif input_y < 0:
-        astro_facing = "up"
-    elif input_y > 0:
-        astro_facing = "down"
-    elif abs(astro_vx) + abs(astro_vy) > 0.35:
-        if abs(astro_vx) >= abs(astro_vy):
-            astro_facing = "right" if astro_vx > 0 else "left"
-        else:
-            astro_facing = "down" if astro_vy > 0 else "up"
-
-    max_speed = speed * (HYPER_DASH_MULTIPLIER if hyper_active else 1)
-    accel = ASTRO_ACCEL * (1.35 if hyper_active else 1.0)
-    if now < oxidized_debuff_until:
-        accel *= 0.72
-        max_speed *= 0.82
-
-    if input_x != 0:
-        astro_vx += input_x * accel
-    else:
-        astro_vx *= ASTRO_FRICTION
-
-    if input_y != 0:
-        astro_vy += input_y * accel
-    else:
-        astro_vy *= ASTRO_FRICTION
-
-    center_x = astro_x + astro_sprite_right.get_width() // 2
-    center_y = astro_y + astro_sprite_right.get_height() // 2
-    grav_dx, grav_dy, gravity_pull_planet, gravity_pull_strength = compute_planet_gravity_pull(
-        center_x, center_y, level_idx
-    )
-    astro_vx += grav_dx
-    astro_vy += grav_dy
-
-    astro_vx *= ASTRO_DRAG
-    astro_vy *= ASTRO_DRAG
-    velocity_mag = math.hypot(astro_vx, astro_vy)
-    if velocity_mag > max_speed:
-        scale = max_speed / velocity_mag
-        astro_vx *= scale
-        astro_vy *= scale
-    if abs(astro_vx) < 0.01:
-        astro_vx = 0.0
-    if abs(astro_vy) < 0.01:
-        astro_vy = 0.0
-
-    astro_move_dx = astro_vx
-    astro_move_dy = astro_vy
-    astro_x += astro_vx
-    astro_y += astro_vy
-
-    if hyper_active and now - hyper_last_fx_time >= 40:
-        create_explosion(astro_x + 40, astro_y + 40, color=YELLOW, num_particles=8)
-        hyper_last_fx_time = now
-
-    # Wrap-around : traverser d'un bord à l'autre
-    sprite_w = astro_sprite_right.get_width()
-    sprite_h = astro_sprite_right.get_height()
-    if astro_x > screen_width:
-        astro_x = -sprite_w
-    elif astro_x < -sprite_w:
-        astro_x = screen_width
-    if astro_y > screen_height:
-        astro_y = -sprite_h
-    elif astro_y < -sprite_h:
-        astro_y = screen_height
-
-    # Mise à jour de la position des tirs
-    for bullet in bullet_list:
-        bullet['rect'].x += bullet['dx']
-        bullet['rect'].y += bullet['dy']
-    bullet_list = [bullet for bullet in bullet_list if bullet['rect'].right > 0 and bullet['rect'].left < screen_width and bullet['rect'].bottom > 0 and bullet['rect'].top < screen_height]
-
-    # Mise à jour des positions des étoiles pour effet parallaxe
-    for star in star_list:
-        star['x'] += star['speed']
-        star['y'] += star['speed'] * 0.5
-        if star['x'] > screen_width:
-            star['x'] = 0
-            star['y'] = random.randint(0, screen_height)
-
-    # Mise à jour des positions des planètes
-    for planet in planet_list:
-        planet['x'] += planet['speed']
-        planet['y'] += planet['speed'] * 0.2
-        if planet['x'] > screen_width:
-            planet['x'] = 0
-            planet['y'] = random.randint(0, screen_height)
-
-    # Spawn d'ennemis selon configuration du niveau
-    level_conf = levels.levels[level_idx]
-    spawn_chance = get_level_spawn_chance(level_idx, score, lives, boss_active)
-    if not boss_active and random.random() < spawn_chance:
-        # Choisir le type en fonction des poids du niveau
-        spawn_weights = level_conf['spawn_weights']
-        enemy_type = random.choices(
-            population=list(spawn_weights.keys()),
-            weights=list(spawn_weights.values())
-        )[0]
-        # Propriétés selon le type
-        if enemy_type == 'dog':
-            enemy_width, enemy_height, enemy_speed, enemy_health = 50, 50, 2, 3
-        elif enemy_type == 'rat':
-            enemy_width, enemy_height, enemy_speed, enemy_health = 30, 30, 3, 1  # rat tué en 1 jet
-        else:  # 'mouse'
-            enemy_width, enemy_height, enemy_speed, enemy_health = 20, 20, 4, 1
-        # Déterminer le côté d'apparition
-        side = random.choice(['left', 'right', 'top', 'bottom'])
-        if side == 'left':
-            x, y, dx, dy = -enemy_width, random.randint(0, screen_height - enemy_height), enemy_speed, 0
-        elif side == 'right':
-            x, y, dx, dy = screen_width, random.randint(0, screen_height - enemy_height), -enemy_speed, 0
-        elif side == 'top':
-            x, y, dx, dy = random.randint(0, screen_width - enemy_width), -enemy_height, 0, enemy_speed
-        else:  # 'bottom'
-            x, y, dx, dy = random.randint(0, screen_width - enemy_width), screen_height, 0, -enemy_speed
-        # Ajouter l'ennemi
-        enemy_list.append({
-            'x': x, 'y': y, 'width': enemy_width, 'height': enemy_height,
-            'type': enemy_type, 'dx': dx, 'dy': dy,
-            'speed': enemy_speed, 'health': enemy_health,
-            'bob_phase': random.uniform(0, 2 * math.pi),
-            'anim_phase': random.uniform(0, 2 * math.pi),
-            'spawn_time': now
-        })
-    # Mise à jour des ennemis
-    new_enemy_list = []
-    for enemy in enemy_list:
-        enemy['x'] += enemy['dx']
-        enemy['y'] += enemy['dy']
-        if enemy['x'] + enemy['width'] > 0 and enemy['x'] < screen_width and enemy['y'] + enemy['height'] > 0 and enemy['y'] < screen_height:
-            new_enemy_list.append(enemy)
-    enemy_list = new_enemy_list
-
-    # Mise à jour du boss final (mouvement, phases, tirs).
-    if boss_active and boss_data:
-        health_ratio = boss_data['health'] / max(1, boss_data['max_health'])
-        if health_ratio > 0.66:
-            boss_data['phase'] = 1
-        elif health_ratio > 0.33:
-            boss_data['phase'] = 2
-        else:
-            boss_data['phase'] = 3
-
-        phase_speed = {1: 1.8, 2: 2.7, 3: 3.6}[boss_data['phase']]
-        boss_data['x'] += boss_data['vx'] * phase_speed
-        if boss_data['x'] <= 40:
-            boss_data['x'] = 40
-            boss_data['vx'] = 1
-        elif boss_data['x'] + boss_data['width'] >= screen_width - 40:
-            boss_data['x'] = screen_width - 40 - boss_data['width']
-            boss_data['vx'] = -1
-        boss_data['y'] = 90 + int(24 * math.sin(now / 380 + boss_data.get('seed', 0.0)))
-
-        shot_cooldown = {1: 1200, 2: 850, 3: 620}[boss_data['phase']]
-        if now - boss_data['last_shot'] >= shot_cooldown:
-            spawn_boss_projectiles(now, (astro_x + 25, astro_y + 25))
-
-        updated_boss_projectiles = []
-        for projectile in boss_projectiles:
-            projectile['x'] += projectile['dx']
-            projectile['y'] += projectile['dy']
-            projectile['lifetime'] -= 1
-            if (
-                projectile['lifetime'] > 0
-                and -30 <= projectile['x'] <= screen_width + 30
-                and -30 <= projectile['y'] <= screen_height + 30
-            ):
-                updated_boss_projectiles.append(projectile)
-        boss_projectiles = updated_boss_projectiles
-
-    # Collision entre les tirs (jet d'eau) et les ennemis
-    new_bullet_list = []
-    boss_defeated_this_frame = False
-    for bullet in bullet_list:
-        bullet_rect = bullet['rect']  # Le tir est maintenant dans bullet['rect']
-        hit_enemy = False
-        for enemy in enemy_list[:]:
-            enemy_rect = pygame.Rect(enemy['x'], enemy['y'], enemy['width'], enemy['height'])
-            if bullet_rect.colliderect(enemy_rect):
-                # Décrémenter la santé de l'ennemi à chaque tir
-                enemy['health'] -= 1
-                # Si la santé tombe à zéro, l'ennemi est détruit
-                if enemy['health'] <= 0:
-                    if enemy['type'] == "rat":
-                        enemy_color = (200, 0, 0)  # rouge foncé pour les rats
-                        score += 20
-                    elif enemy['type'] == "mouse":
-                        enemy_color = (255, 100, 100)  # rouge clair pour les souris
-                        score += 10
-                    elif enemy['type'] == "dog":
-                        enemy_color = (255, 0, 0)  # rouge pour les chiens
-                        score += 30
-                    create_explosion(enemy['x'] + enemy['width'] // 2, enemy['y'] + enemy['height'] // 2, color=enemy_color)
-                    play_sound(explosion_sound)
-                    enemy_list.remove(enemy)
-                hit_enemy = True
+    inputs.move_x = float(keys[pygame.K_RIGHT]) - float(keys[pygame.K_LEFT]) + pad_x
+    inputs.move_y = float(keys[pygame.K_DOWN]) - float(keys[pygame.K_UP]) + pad_y
+    frame_profiler.mark("events")
+
+    # Simulation à pas fixe (déplacements, spawns, collisions, boss, bonus, score) :
+    # 0, 1 ou plusieurs pas selon le temps réel écoulé depuis la frame précédente.
+    # Hit-stop : la simulation est figée (ou ralentie), le rendu continue
+    for _ in range(sim_timestep.advance(frame_ms * hit_stop.scale(pygame.time.get_ticks()))):
+        if active_replay is not None:
+            # Rejeu : les commandes enregistrées remplacent celles du joueur
+            inputs = active_replay.next_inputs()
+            if inputs is None:
+                game_state = "MENU"
                 break
-        if not hit_enemy and boss_active and boss_data:
-            boss_rect = pygame.Rect(
-                boss_data['x'], boss_data['y'], boss_data['width'], boss_data['height']
-            )
-            if bullet_rect.colliderect(boss_rect):
-                boss_data['health'] -= 1
-                create_explosion(
-                    bullet_rect.centerx,
-                    bullet_rect.centery,
-                    color=(255, 110, 140),
-                    num_particles=10,
-                )
-                if boss_data['health'] <= 0:
-                    boss_defeated_this_frame = True
-                hit_enemy = True
-        if not hit_enemy:
-            new_bullet_list.append(bullet)
-    bullet_list = new_bullet_list
-
-    if boss_defeated_this_frame:
-        boss_active = False
-        boss_defeated = True
-        boss_projectiles.clear()
-        create_explosion(
-            boss_data['x'] + boss_data['width'] // 2,
-            boss_data['y'] + boss_data['height'] // 2,
-            color=RED,
-            num_particles=120,
-        )
-        play_sound(explosion_sound)
-        if "ingredient_fragment_croquette" not in ingredients_collected:
-            ingredients_collected.append("ingredient_fragment_croquette")
-            ing_anim_active = True
-            ing_anim_start = now
-        enemy_list.clear()
-        croquette_list.clear()
-        water_item_list.clear()
-        hyper_item_list.clear()
-        astro_vx = 0.0
-        astro_vy = 0.0
-        astro_move_dx = 0.0
-        astro_move_dy = 0.0
-        record_run_result("WIN", now)
-        game_state = "FINAL_WIN"
-        continue
-
-    player_rect = pygame.Rect(astro_x, astro_y, 50, 50)
-
-    # Collision entre AstroPaws et les ennemis
-    for enemy in enemy_list[:]:
-        enemy_rect = pygame.Rect(enemy['x'], enemy['y'], enemy['width'], enemy['height'])
-        if player_rect.colliderect(enemy_rect):
-            # Bouclier ou Hyperdrive actif : invincibilité temporaire
-            if shield_active or hyper_active:
-                fx_color = CYAN if shield_active else YELLOW
-                fx_particles = 20 if shield_active else 30
-                create_explosion(
-                    enemy['x'] + enemy['width']//2,
-                    enemy['y'] + enemy['height']//2,
-                    color=fx_color,
-                    num_particles=fx_particles
-                )
-                play_sound(explosion_sound)
-                enemy_list.remove(enemy)
-                continue
-            astro_hit_flash_until = now + ASTRO_HIT_FLASH_DURATION
-            if enemy['type'] == "dog":
-                lives -= 1
-                # Déclencher explosion du cœur retiré
-                life_anim['active'] = True
-                life_anim['index'] = lives  # index du cœur supprimé
-                life_anim['start'] = pygame.time.get_ticks()
-                # Explosion visuelle sur le cœur
-                heart_x = screen_width - (heart_sprite.get_width() + 10) * (life_anim['index'] + 1) + heart_sprite.get_width()//2
-                heart_y = 10 + heart_sprite.get_height()//2
-                create_explosion(heart_x, heart_y, color=RED, num_particles=30)
-                create_explosion(astro_x + 25, astro_y + 25, color=(255, 0, 0), num_particles=50)
-                play_sound(explosion_sound)
-                lost_life_surface = score_font.render("Vous avez perdu une vie!", True, WHITE)
-                screen.blit(lost_life_surface, (screen_width//2 - 100, screen_height//2))
-                present_frame()
-                pygame.time.delay(1000)
-            elif enemy['type'] == "rat":
-                score -= 10
-                create_explosion(astro_x + 25, astro_y + 25)
-                play_sound(explosion_sound)
-            else:  # mouse
-                score -= 5
-                create_explosion(astro_x + 25, astro_y + 25)
-                play_sound(explosion_sound)
-            enemy_list.remove(enemy)
-
-    # Collision entre AstroPaws et les attaques du boss final.
-    if boss_active and boss_data:
-        boss_rect = pygame.Rect(
-            boss_data['x'], boss_data['y'], boss_data['width'], boss_data['height']
-        )
-        if player_rect.colliderect(boss_rect):
-            if shield_active or hyper_active:
-                create_explosion(
-                    boss_rect.centerx,
-                    boss_rect.centery,
-                    color=YELLOW if hyper_active else CYAN,
-                    num_particles=20,
-                )
-            elif now >= boss_contact_cooldown_until:
-                lives -= 1
-                boss_contact_cooldown_until = now + 900
-                astro_hit_flash_until = now + ASTRO_HIT_FLASH_DURATION
-                create_explosion(astro_x + 25, astro_y + 25, color=RED, num_particles=45)
-                play_sound(explosion_sound)
-
-        for projectile in boss_projectiles[:]:
-            radius = projectile['radius']
-            proj_rect = pygame.Rect(
-                projectile['x'] - radius,
-                projectile['y'] - radius,
-                radius * 2,
-                radius * 2,
-            )
-            if player_rect.colliderect(proj_rect):
-                if shield_active or hyper_active:
-                    create_explosion(
-                        projectile['x'],
-                        projectile['y'],
-                        color=CYAN if shield_active else YELLOW,
-                        num_particles=12,
-                    )
-                elif now >= boss_contact_cooldown_until:
-                    lives -= 1
-                    boss_contact_cooldown_until = now + 900
-                    astro_hit_flash_until = now + ASTRO_HIT_FLASH_DURATION
-                    create_explosion(astro_x + 25, astro_y + 25, color=(255, 70, 90), num_particles=30)
-                    play_sound(explosion_sound)
-                boss_projectiles.remove(projectile)
-
-    # Vérifier Game Over: si les vies tombent à 0
-    if lives <= 0:
-        # Passer en écran de Game Over
-        record_run_result("KO", now)
-        game_state = "GAME_OVER"
-        continue
-
-    # Mise à jour de la liste des croquettes
-    current_time = pygame.time.get_ticks()
-    if not boss_active:
-        croquette_list = [
-            croquette
-            for croquette in croquette_list
-            if current_time - croquette['spawn_time'] < croquette_lifetime
-        ]
-
-        # Apparition de nouvelles croquettes
-        if random.random() < 0.01:  # environ 1% de chance par frame
-            croquette_list.append(spawn_croquette())
-
-        # Collision entre AstroPaws et les croquettes
-        new_croquette_list = []
-        for croquette in croquette_list:
-            base_sprite = gold_croquette_sprite if croquette.get('type') == "rare" else brown_croquette_sprite
-            croq_w, croq_h = base_sprite.get_size()
-            croquette_rect = pygame.Rect(croquette['x'], croquette['y'], croq_w, croq_h)
-            oxidized = is_croquette_oxidized(croquette, level_idx, current_time)
-            if player_rect.colliderect(croquette_rect):
-                play_sound(pickup_sound)
-                if oxidized:
-                    score += OXIDIZED_BONUS_SCORE
-                    water_ammo = max(0, water_ammo - OXIDIZED_WATER_PENALTY)
-                    oxidized_debuff_until = current_time + OXIDIZED_DEBUFF_DURATION
-                    create_explosion(
-                        croquette_rect.centerx,
-                        croquette_rect.centery,
-                        color=(160, 220, 90),
-                        num_particles=18,
-                    )
-                elif croquette.get('type') == "rare":
-                    score += 10  # croquette rare désormais 10 points
-                else:
-                    score += 3   # croquette normale désormais 3 points
-            else:
-                new_croquette_list.append(croquette)
-        croquette_list = new_croquette_list
-    else:
-        croquette_list.clear()
-
-    # Vérifier si on atteint le score cible du niveau
-    target = levels.levels[level_idx]['target_score']
-    if score >= target and not boss_active:
-        is_last_level = level_idx == len(levels.levels) - 1
-        if is_last_level and not boss_defeated:
-            final_level_item = levels.levels[level_idx]['end_item']
-            if final_level_item not in ingredients_collected:
-                ingredients_collected.append(final_level_item)
-                ing_anim_active = True
-                ing_anim_start = now
-
-            enemy_list.clear()
-            bullet_list.clear()
-            explosion_list.clear()
-            croquette_list.clear()
-            water_item_list.clear()
-            hyper_item_list.clear()
-            astro_vx = 0.0
-            astro_vy = 0.0
-            astro_move_dx = 0.0
-            astro_move_dy = 0.0
-            astro_hit_flash_until = 0
-            start_boss_fight(now)
-            continue
-
-        # Animation de disparition du sprite mort sur 2 secondes
-        # Préparez le message statique
-        msg = score_font.render(f"{levels.levels[level_idx]['name']} terminé !", True, WHITE)
-        msg_rect = msg.get_rect(center=(screen_width//2, screen_height//2 + 50))
-        # Choisir le sprite mort
-        if level_idx == 0:
-            dead = mouse_dead_sprite
-        elif level_idx == 1:
-            dead = rat_dead_sprite
         else:
-            dead = dog_dead_sprite
-        # Animation
-        anim_start = pygame.time.get_ticks()
-        anim_duration = 2000  # ms
-        while True:
-            t = pygame.time.get_ticks() - anim_start
-            if t >= anim_duration:
-                break
-            progress = t / anim_duration
-            # Calculer la taille et l'alpha
-            scale = 1.0 - 0.5 * progress
-            w = max(1, int(dead.get_width() * scale))
-            h = max(1, int(dead.get_height() * scale))
-            anim_img = pygame.transform.scale(dead, (w, h))
-            anim_img.set_alpha(int(255 * (1 - progress)))
-            # Dessiner fond et sprite animé
-            screen.fill(BLACK)
-            # étoiles de fond
-            for star in star_list:
-                pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-            for planet in planet_list:
-                pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
-            # sprite mort animé
-            rect = anim_img.get_rect(center=(screen_width//2, screen_height//2 - 50))
-            screen.blit(anim_img, rect)
-            # message
-            screen.blit(msg, msg_rect)
-            present_frame()
-            clock.tick(60)
-        # Animer l'ajout de l'ingrédient
-        ingredients_collected.append(levels.levels[level_idx]['end_item'])
-        ing_anim_active = True
-        ing_anim_start = now
-        # Passer au niveau suivant.
-        level_idx += 1
-        game_state = "LEVEL_INTRO"
-
-        enemy_list.clear()
-        bullet_list.clear()
-        explosion_list.clear()
-        croquette_list.clear()
-        water_item_list.clear()
-        hyper_item_list.clear()
-        croquette_list = [spawn_croquette() for _ in range(INITIAL_CROQUETTES)]
-        game_start_time = None
-        paused_time_accum = 0
-        hyper_active = False
-        hyper_start_time = None
-        astro_vx = 0.0
-        astro_vy = 0.0
-        astro_move_dx = 0.0
-        astro_move_dy = 0.0
-        astro_hit_flash_until = 0
+            input_recorder.record(inputs)
+        game.step(inputs, TICK_MS)
+        # Les actions ponctuelles ne valent que pour un pas ; le déplacement est conservé.
+        inputs = PlayerInputs(move_x=inputs.move_x, move_y=inputs.move_y)
+        apply_sim_events(game.drain_events())
+        if game_state != "PLAYING":
+            break
+        # Particules d'explosion et OVNIs décoratifs avancent au même pas
+        particles.update()
+        for ufo in ufo_list:
+            ufo.update()
+        frame_profiler.mark("effects")
+    pending_inputs = inputs
+    frame_profiler.mark("effects")
+    if game_state != "PLAYING":
         continue
 
-    # Mise à jour des réserves d'eau (water items)
-    current_time = pygame.time.get_ticks()
-    water_item_lifetime = 9000 if boss_active else 7000
-    water_item_list = [
-        item for item in water_item_list
-        if current_time - item['spawn_time'] < water_item_lifetime
-    ]
-    if boss_active:
-        hyper_item_list.clear()
-    else:
-        hyper_item_list = [
-            item for item in hyper_item_list
-            if current_time - item['spawn_time'] < HYPER_PICKUP_LIFETIME
-        ]
-    
-    # Collision entre AstroPaws et les réserves d'eau
-    for item in water_item_list[:]:
-        # Utiliser la taille réelle du sprite pour la collision
-        width = water_sprite.get_width()
-        height = water_sprite.get_height()
-        water_rect = pygame.Rect(item['x'], item['y'], width, height)
-        if player_rect.colliderect(water_rect):
-            water_ammo += 10
-            # Déclencher clignotement du compteur d'eau
-            water_anim['active'] = True
-            water_anim['start'] = pygame.time.get_ticks()
-            play_sound(pickup_sound)
-            water_item_list.remove(item)
-    
-    # Apparition de nouvelles réserves d'eau
-    water_spawn_chance = get_water_pickup_spawn_chance(level_idx, boss_active, water_ammo)
-    if random.random() < water_spawn_chance:
-        x = random.randint(0, screen_width - 10)
-        y = random.randint(0, screen_height - 10)
-        spawn_time = pygame.time.get_ticks()
-        water_item_list.append({'x': x, 'y': y, 'spawn_time': spawn_time})
-
-    # Collision entre AstroPaws et les pickups Hyperdrive
-    for item in hyper_item_list[:]:
-        width = hyper_pickup_sprite.get_width()
-        height = hyper_pickup_sprite.get_height()
-        hyper_rect = pygame.Rect(item['x'], item['y'], width, height)
-        if player_rect.colliderect(hyper_rect):
-            hyper_charges += 1
-            hyper_unlocked = True
-            hyper_last_granted_time = current_time
-            hyper_inv_anim['active'] = True
-            hyper_inv_anim['start'] = current_time
-            create_explosion(
-                item['x'] + width // 2,
-                item['y'] + height // 2,
-                color=YELLOW,
-                num_particles=25
-            )
-            play_sound(hyper_pickup_sound)
-            hyper_item_list.remove(item)
-
-    # Apparition des pickups Hyperdrive (niveau qui porte l'item Hyperdrive)
-    level_conf = levels.levels[level_idx]
-    if (
-        not boss_active
-        and level_conf.get('item', {}).get('type') == 'hyperdrive'
-        and len(hyper_item_list) < 1
-        and random.random() < HYPER_PICKUP_SPAWN_CHANCE
-    ):
-        hw = hyper_pickup_sprite.get_width()
-        hh = hyper_pickup_sprite.get_height()
-        x = random.randint(0, screen_width - hw)
-        y = random.randint(0, screen_height - hh)
-        hyper_item_list.append({'x': x, 'y': y, 'spawn_time': current_time})
-
-    # Mise à jour des particules d'explosion
-    new_explosion_list = []
-    for particle in explosion_list:
-        particle['x'] += particle['dx']
-        particle['y'] += particle['dy']
-        particle['lifetime'] -= 1
-        if particle['lifetime'] > 0:
-            new_explosion_list.append(particle)
-    explosion_list = new_explosion_list
-
-    # Mettre à jour animations de score et d'eau
-    now = pygame.time.get_ticks()
+    # Rendu interpolé entre les deux derniers pas (alpha dans [0, 1[)
+    alpha = sim_timestep.alpha
+    # Mettre à jour animations de score et d'eau (horloge de la simulation)
+    now = game.now - (1.0 - alpha) * TICK_MS
     # Score blink si négatif
-    if score < 0:
+    if game.score < 0:
         if now - score_blink_time > 500:
             score_blink = not score_blink
             score_blink_time = now
@@ -2363,220 +2114,140 @@ while running:
         hyper_inv_anim['active'] = False
 
     # Affichage du fond spatial procédural avec teinte de niveau
+    level_idx = game.level_idx
     bg = levels.levels[level_idx]['bg_tint']
     screen.fill(bg)
-    # Chronomètre mm:ss en haut-centre
-    if game_start_time is not None:
-        elapsed = (now - game_start_time - paused_time_accum) // 1000
-        mins, secs = divmod(elapsed, 60)
-        timer_surf = score_font.render(f"{mins:02d}:{secs:02d}", True, WHITE)
-        timer_rect = timer_surf.get_rect(midtop=(screen_width//2, 10))
-        screen.blit(timer_surf, timer_rect)
-    # Dessiner les étoiles
-    for star in star_list:
-        pygame.draw.circle(screen, WHITE, (int(star['x']), int(star['y'])), 1)
-    # Dessiner les planètes
-    for planet in planet_list:
-        pygame.draw.circle(screen, planet['color'], (int(planet['x']), int(planet['y'])), planet['size'])
-
-    # Mettre à jour et dessiner les OVNIs décoratifs
-    for ufo in ufo_list:
-        ufo.update()
+    background.draw(screen, alpha)
+    frame_profiler.mark("background")
+
+    # Dessiner les OVNIs décoratifs
     for ufo in ufo_list:
         ufo.draw()
 
-    # Dessiner les croquettes avec sprites
-    for croquette in croquette_list:
+    # Dessiner les croquettes avec sprites (pulsation des oxydées : tables pré-calculées)
+    croquette_blits = []
+    for croquette in game.croquette_list:
         rare = croquette.get('type') == "rare"
-        oxidized = is_croquette_oxidized(croquette, level_idx, now)
-        if rare:
-            sprite = gold_croquette_oxidized_sprite if oxidized else gold_croquette_sprite
+        croquette_x = croquette['x']
+        croquette_y = interpolate(croquette.get('py', croquette['y']), croquette['y'], alpha)
+        if is_croquette_oxidized(croquette, level_idx, now):
+            frame, offset_x, offset_y = oxidized_pulse_frames[rare][pulse_frame_index(now / 110 + croquette_x)]
+            croquette_blits.append((frame, (croquette_x + offset_x, croquette_y + offset_y)))
         else:
-            sprite = brown_croquette_oxidized_sprite if oxidized else brown_croquette_sprite
-
-        if oxidized:
-            pulse = 1.0 + 0.08 * math.sin(now / 110 + croquette['x'])
-            w = max(1, int(sprite.get_width() * pulse))
-            h = max(1, int(sprite.get_height() * pulse))
-            animated = pygame.transform.smoothscale(sprite, (w, h))
-            rect = animated.get_rect(
-                center=(
-                    croquette['x'] + sprite.get_width() // 2,
-                    croquette['y'] + sprite.get_height() // 2,
-                )
-            )
-            screen.blit(animated, rect.topleft)
-            pygame.draw.circle(
-                screen,
-                (150, 220, 80),
-                rect.center,
-                max(rect.width, rect.height) // 2 + 3,
-                1,
-            )
-        else:
-            screen.blit(sprite, (croquette['x'], croquette['y']))
+            sprite = gold_croquette_sprite if rare else brown_croquette_sprite
+            croquette_blits.append((sprite, (croquette_x, croquette_y)))
+    screen.blits(croquette_blits, doreturn=False)
     # Dessiner les réserves d'eau avec sprite
-    for item in water_item_list:
+    for item in game.water_item_list:
         screen.blit(water_sprite, (item['x'], item['y']))
     # Dessiner les pickups Hyperdrive avec un léger pulse
-    pulse_factor = 1.0 + 0.12 * math.sin(now / 120)
-    for item in hyper_item_list:
-        base_w, base_h = hyper_pickup_sprite.get_size()
-        w = max(1, int(base_w * pulse_factor))
-        h = max(1, int(base_h * pulse_factor))
-        sprite = pygame.transform.scale(hyper_pickup_sprite, (w, h))
-        rect = sprite.get_rect(center=(item['x'] + base_w // 2, item['y'] + base_h // 2))
-        screen.blit(sprite, rect.topleft)
+    frame, offset_x, offset_y = hyper_pulse_frames[pulse_frame_index(now / 120)]
+    for item in game.hyper_item_list:
+        screen.blit(frame, (item['x'] + offset_x, item['y'] + offset_y))
     # Dessiner les ennemis avec animation avancée
-    for enemy in enemy_list:
-        draw_enemy_animated(enemy, now)
+    frame_profiler.mark("draw")
+    for enemy in game.enemy_list:
+        draw_enemy_animated(enemy, now, alpha)
     # Dessiner le boss et ses projectiles
-    if boss_active and boss_data:
-        draw_boss(now)
-        for projectile in boss_projectiles:
-            pygame.draw.circle(
-                screen,
-                projectile['color'],
-                (int(projectile['x']), int(projectile['y'])),
-                projectile['radius'],
-            )
+    if game.boss_active and game.boss_data:
+        draw_boss(now, alpha)
+        game.boss_projectiles.draw(screen, alpha)
+    frame_profiler.mark("enemies")
     # Dessiner les particules d'explosion
-    for particle in explosion_list:
-        pygame.draw.circle(screen, particle['color'], (int(particle['x']), int(particle['y'])), 2)
+    particles.draw(screen, alpha)
+    frame_profiler.mark("particles")
     # Afficher les tirs (jet d'eau bleu)
-    for bullet in bullet_list:
-        pygame.draw.rect(screen, BLUE, bullet['rect'])
+    for bullet in game.bullet_list:
+        rect = bullet['rect']
+        pygame.draw.rect(
+            screen,
+            BLUE,
+            (
+                interpolate(bullet.get('px', rect.x), rect.x, alpha),
+                interpolate(bullet.get('py', rect.y), rect.y, alpha),
+                rect.width,
+                rect.height,
+            ),
+        )
     # Afficher AstroPaws avec animation dynamique
     astro_rect = draw_astro_animated(
         now_ms=now,
-        astro_pos_x=astro_x,
-        astro_pos_y=astro_y,
-        facing=astro_facing,
-        move_dx=astro_move_dx,
-        move_dy=astro_move_dy,
-        hyper_on=hyper_active,
-        hit_flash_until=astro_hit_flash_until,
+        astro_pos_x=interpolate(game.astro_px, game.astro_x, alpha),
+        astro_pos_y=interpolate(game.astro_py, game.astro_y, alpha),
+        facing=game.astro_facing,
+        move_dx=game.astro_move_dx,
+        move_dy=game.astro_move_dy,
+        hyper_on=game.hyper_active,
+        hit_flash_until=game.astro_hit_flash_until,
     )
     # Dessiner les auras de protection autour d'AstroPaws
     center_x, center_y = astro_rect.center
     base_radius = max(astro_rect.width, astro_rect.height) // 2 + 5
-    if shield_active:
+    if game.shield_active:
         pygame.draw.circle(screen, CYAN, (center_x, center_y), base_radius, 3)
-    if hyper_active:
+    if game.hyper_active:
         pulse = int(3 * math.sin(now / 70))
         pygame.draw.circle(screen, YELLOW, (center_x, center_y), base_radius + 6 + pulse, 3)
     
-    # Afficher Score (clignote en rouge si score négatif)
-    score_color = RED if (score < 0 and score_blink) else WHITE
-    score_surface = score_font.render(f"Score: {score}", True, score_color)
-    screen.blit(score_surface, (10, 10))
-    # Afficher eau (clignote en bleu lors de collecte)
-    water_color = BLUE if water_anim['active'] else WHITE
-    water_surface = score_font.render(f"Water: {water_ammo}", True, water_color)
-    screen.blit(water_surface, (10, 50))
-    if gravity_pull_strength > 0:
-        grav_pct = int(min(99, gravity_pull_strength * 550))
-        grav_surface = subtitle_font.render(f"Gravite locale: {grav_pct}%", True, CYAN)
-        screen.blit(grav_surface, (10, 92))
-    if now < oxidized_debuff_until:
-        corrosion_remaining = max(0.0, (oxidized_debuff_until - now) / 1000.0)
-        corrosion_surf = subtitle_font.render(
-            f"Corrosion: commandes perturbees ({corrosion_remaining:.1f}s)",
-            True,
-            (170, 230, 90),
-        )
-        screen.blit(corrosion_surf, (10, 124))
-    # Afficher les vies sous forme de cœurs en haut à droite
-    for i in range(lives):
-        x = screen_width - (heart_sprite.get_width() + 10) * (i + 1)
-        screen.blit(heart_sprite, (x, 10))
-    if boss_active and boss_data:
-        bw, bh = 320, 14
-        bx, by = screen_width//2 - bw//2, 36
-        ratio = max(0.0, boss_data['health']) / max(1, boss_data['max_health'])
-        pygame.draw.rect(screen, WHITE, (bx, by, bw, bh), 2)
-        pygame.draw.rect(screen, RED, (bx, by, int(bw * ratio), bh))
-        boss_label = subtitle_font.render(
-            f"{boss_data['name']} - Phase {boss_data['phase']}",
-            True,
-            WHITE,
-        )
-        label_rect = boss_label.get_rect(midbottom=(screen_width//2, by - 4))
-        screen.blit(boss_label, label_rect)
-    # Barre de bouclier si actif
-    if shield_active:
-        remaining = shield_duration - (now - shield_start_time)
-        ratio = max(0, remaining) / shield_duration
+    # Barre de bouclier si actif (l'expiration est gérée par la simulation)
+    if game.shield_active:
+        remaining = SHIELD_DURATION - (now - game.shield_start_time)
+        ratio = max(0, remaining) / SHIELD_DURATION
         bw, bh = 200, 10
         bx, by = screen_width//2 - bw//2, 70
         pygame.draw.rect(screen, WHITE, (bx, by, bw, bh), 2)
         pygame.draw.rect(screen, BLUE, (bx, by, int(bw * ratio), bh))
-        if remaining <= 0:
-            shield_active = False
-    if hyper_active and hyper_start_time is not None:
-        remaining = HYPER_DASH_DURATION - (now - hyper_start_time)
+    if game.hyper_active and game.hyper_start_time is not None:
+        remaining = HYPER_DASH_DURATION - (now - game.hyper_start_time)
         ratio = max(0, remaining) / HYPER_DASH_DURATION
         bw, bh = 200, 10
         bx, by = screen_width//2 - bw//2, 88
         pygame.draw.rect(screen, WHITE, (bx, by, bw, bh), 2)
         pygame.draw.rect(screen, YELLOW, (bx, by, int(bw * ratio), bh))
-        if remaining <= 0:
-            hyper_active = False
 
-    # Affichage de l'inventaire en bas à gauche (icônes + compteurs)
-    x0 = 10
-    # Positionner l'inventaire 10px au-dessus du bord inférieur, en fonction de la hauteur de l'icône
-    y0 = screen_height - shield_icon.get_height() - 10
-
-    # Bouclier
-    screen.blit(shield_icon, (x0, y0))
-    # Clignotement du compteur de bouclier
-    shield_color = CYAN if shield_inv_anim['active'] and ((now - shield_inv_anim['start']) // 250) % 2 == 0 else WHITE
-    shield_count = score_font.render(f"x{shield_charges}", True, shield_color)
-    # Position dynamique à droite de l'icône
-    screen.blit(shield_count, (x0 + shield_icon.get_width() + 10, y0 + 4))
-
-    # Hyperdrive
-    screen.blit(hyper_icon, (x0 + 100, y0))
-    hyper_color = YELLOW if hyper_active or (hyper_inv_anim['active'] and ((now - hyper_inv_anim['start']) // 250) % 2 == 0) else WHITE
-    hyper_count = score_font.render(f"x{hyper_charges}", True, hyper_color)
-    # Position dynamique à droite de l'icône
-    screen.blit(hyper_count, (x0 + 100 + hyper_icon.get_width() + 10, y0 + 4))
-
-    # Icône générique d'ingrédient (toujours présente)
-    inv_base_x = x0 + 200
-    screen.blit(ingredient_icon, (inv_base_x, y0))
-    # Afficher les ingrédients collectés à droite de cette icône
-    offset_x = inv_base_x + ingredient_icon.get_width() + 10
-    for idx, ing_key in enumerate(ingredients_collected):
-        ing_sprite = ingredient_sprites.get(ing_key, ingredient_icon)
-        draw_sprite = ing_sprite
-        # Animation de zoom pour le dernier ingrédient acquis
-        if ing_anim_active and idx == len(ingredients_collected) - 1:
-            t = now - ing_anim_start
-            if t <= ing_anim_duration:
-                factor = 1 + 1.0 * math.sin(math.pi * t / ing_anim_duration)
-                w = int(ing_sprite.get_width() * factor)
-                h = int(ing_sprite.get_height() * factor)
-                draw_sprite = pygame.transform.scale(ing_sprite, (w, h))
-            else:
-                ing_anim_active = False
-        # Calculer position centrée
+    # HUD : recomposé seulement quand une valeur affichée change
+    frame_profiler.mark("draw")
+    if ing_anim_active and now - ing_anim_start > ing_anim_duration:
+        ing_anim_active = False
+    hud_layer.update(get_playing_hud_key(now), draw_playing_hud)
+    hud_layer.draw(screen)
+    frame_profiler.mark("hud")
+    # Animation de zoom pour le dernier ingrédient acquis (hors HUD, change à chaque frame)
+    if ing_anim_active and game.ingredients_collected:
+        idx = len(game.ingredients_collected) - 1
+        ing_sprite = get_ingredient_sprite(game.ingredients_collected[idx])
+        factor = 1 + 1.0 * math.sin(math.pi * (now - ing_anim_start) / ing_anim_duration)
+        draw_sprite = transform_cache.scale_by(ing_sprite, factor)
+        y0 = screen_height - shield_icon.get_height() - 10
+        offset_x = 10 + 200 + ingredient_icon.get_width() + 10
         rect = draw_sprite.get_rect()
-        pos_x = offset_x + idx * (ing_sprite.get_width() + 10) + (ing_sprite.get_width() - rect.width) // 2
-        pos_y = y0 + (ing_sprite.get_height() - rect.height) // 2
-        rect.topleft = (pos_x, pos_y)
+        rect.topleft = (
+            offset_x + idx * (ing_sprite.get_width() + 10) + (ing_sprite.get_width() - rect.width) // 2,
+            y0 + (ing_sprite.get_height() - rect.height) // 2,
+        )
         screen.blit(draw_sprite, rect)
 
-    # Afficher le numéro de niveau en bas à droite
-    level_label = "BOSS FINAL" if boss_active else f"Level {level_idx+1}"
-    lvl_surf = score_font.render(level_label, True, WHITE)
-    lvl_rect = lvl_surf.get_rect(bottomright=(screen_width - 10, screen_height - 10))
-    screen.blit(lvl_surf, lvl_rect)
+    # Messages temporisés par-dessus le jeu
+    timed_overlays.draw(screen, pygame.time.get_ticks())
 
     # Actualiser l'affichage
     present_frame()
 
+# Statistiques des caches de rendu (ASTROPAWS_CACHE_STATS=1 pour les afficher).
+if os.environ.get("ASTROPAWS_CACHE_STATS"):
+    for cache_stats in render_cache_stats():
+        details = " ".join(
+            f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in cache_stats.items()
+            if key != "name"
+        )
+        print(f"[cache] {cache_stats['name']}: {details}")
+
 # Quitter Pygame proprement
+save_run_recording()
+if trace_recorder.active:
+    # Les dernières secondes de la session sont conservées à la fermeture.
+    dump_trace(background=False)
+intro_warmup.shutdown()
 pygame.quit()
 sys.exit()
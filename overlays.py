@@ -0,0 +1,86 @@
+"""Messages temporisés et hit-stop, sans jamais bloquer la boucle principale.
+
+`OverlayQueue` affiche des surfaces (« Vous avez perdu une vie ! »…) pendant
+une durée donnée, par-dessus le rendu normal. `HitStop` gèle ou ralentit la
+simulation pendant un instant : la boucle continue de tourner, d'écouter
+les événements et de présenter des frames, seule l'horloge de jeu avance
+moins vite. Les temps sont exprimés en ms d'horloge murale
+(`pygame.time.get_ticks()`), puisque celle de la simulation peut être figée.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+
+class TimedOverlay:
+    def __init__(
+        self,
+        surface: pygame.Surface,
+        center: tuple[int, int],
+        start_ms: int,
+        duration_ms: int,
+    ) -> None:
+        self.surface = surface
+        self.rect = surface.get_rect(center=center)
+        self.start_ms = start_ms
+        self.duration_ms = duration_ms
+
+    def expired(self, now_ms: int) -> bool:
+        return now_ms - self.start_ms >= self.duration_ms
+
+
+class OverlayQueue:
+    def __init__(self) -> None:
+        self.overlays: list[TimedOverlay] = []
+
+    def __len__(self) -> int:
+        return len(self.overlays)
+
+    def show(
+        self,
+        surface: pygame.Surface,
+        center: tuple[int, int],
+        now_ms: int,
+        duration_ms: int,
+    ) -> TimedOverlay:
+        overlay = TimedOverlay(surface, center, now_ms, duration_ms)
+        self.overlays.append(overlay)
+        return overlay
+
+    def clear(self) -> None:
+        self.overlays.clear()
+
+    def draw(self, target: pygame.Surface, now_ms: int) -> None:
+        if not self.overlays:
+            return
+        self.overlays = [overlay for overlay in self.overlays if not overlay.expired(now_ms)]
+        for overlay in self.overlays:
+            target.blit(overlay.surface, overlay.rect)
+
+
+class HitStop:
+    """Facteur de temps de la simulation : 0 = figée, 1 = vitesse normale."""
+
+    def __init__(self) -> None:
+        self.until_ms = 0
+        self.time_scale = 1.0
+
+    def trigger(self, now_ms: int, duration_ms: int, time_scale: float = 0.0) -> None:
+        # Deux hit-stops qui se chevauchent : on garde le plus long et le plus lent.
+        if self.active(now_ms):
+            self.time_scale = min(self.time_scale, time_scale)
+            self.until_ms = max(self.until_ms, now_ms + duration_ms)
+        else:
+            self.time_scale = time_scale
+            self.until_ms = now_ms + duration_ms
+
+    def active(self, now_ms: int) -> bool:
+        return now_ms < self.until_ms
+
+    def scale(self, now_ms: int) -> float:
+        return self.time_scale if self.active(now_ms) else 1.0
+
+    def clear(self) -> None:
+        self.until_ms = 0
+        self.time_scale = 1.0
@@ -0,0 +1,193 @@
+"""Moteur de particules d'explosion en structure de tableaux.
+
+Les particules vivent dans des tableaux NumPy préalloués (x, y, dx, dy,
+durée de vie, index de couleur). L'intégration et le compactage des
+particules mortes sont vectorisés, et le rendu passe par un seul
+`Surface.blits` de petits sprites de points pré-dessinés par couleur.
+Sans NumPy, `ListParticleSystem` offre la même interface en Python pur.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pygame
+
+try:
+    import numpy
+except ImportError:  # NumPy reste optionnel.
+    numpy = None
+
+DOT_RADIUS = 2
+DOT_COLORKEY = (0, 0, 0)
+DEFAULT_CAPACITY = 16384
+SPEED_RANGE = (1.0, 3.0)
+LIFETIME_RANGE = (20, 40)
+
+
+def make_dot_sprite(color: tuple[int, int, int], radius: int = DOT_RADIUS) -> pygame.Surface:
+    # Même motif qu'un pygame.draw.circle centré sur la particule.
+    size = radius * 2 + 1
+    sprite = pygame.Surface((size, size))
+    key = DOT_COLORKEY if tuple(color[:3]) != DOT_COLORKEY else (255, 0, 255)
+    sprite.fill(key)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    return sprite
+
+
+class ParticlePalette:
+    def __init__(self) -> None:
+        self.colors: list[tuple] = []
+        self.sprites: list[pygame.Surface] = []
+        self._index: dict[tuple, int] = {}
+
+    def index_of(self, color: tuple) -> int:
+        color = tuple(color)
+        idx = self._index.get(color)
+        if idx is None:
+            idx = len(self.colors)
+            self._index[color] = idx
+            self.colors.append(color)
+            self.sprites.append(make_dot_sprite(color))
+        return idx
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, seed: int | None = None) -> None:
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self.palette = ParticlePalette()
+        self.rng = numpy.random.default_rng(seed)
+        self.x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.y = numpy.zeros(capacity, dtype=numpy.float64)
+        self.dx = numpy.zeros(capacity, dtype=numpy.float64)
+        self.dy = numpy.zeros(capacity, dtype=numpy.float64)
+        self.lifetime = numpy.zeros(capacity, dtype=numpy.int32)
+        self.color = numpy.zeros(capacity, dtype=numpy.int32)
+        self._sprite_table = numpy.empty(0, dtype=object)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def reseed(self, seed: int) -> None:
+        self.rng = numpy.random.default_rng(seed)
+
+    def emit(self, x: float, y: float, color: tuple, num_particles: int) -> None:
+        start = self.count
+        amount = min(num_particles, self.capacity - start)
+        self.dropped += num_particles - amount
+        if amount <= 0:
+            return
+        end = start + amount
+        angle = self.rng.uniform(0.0, 2 * math.pi, amount)
+        speed = self.rng.uniform(SPEED_RANGE[0], SPEED_RANGE[1], amount)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.dx[start:end] = numpy.cos(angle) * speed
+        self.dy[start:end] = numpy.sin(angle) * speed
+        self.lifetime[start:end] = self.rng.integers(LIFETIME_RANGE[0], LIFETIME_RANGE[1] + 1, amount)
+        self.color[start:end] = self.palette.index_of(color)
+        self.count = end
+
+    def update(self) -> None:
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.dx[:n]
+        self.y[:n] += self.dy[:n]
+        self.lifetime[:n] -= 1
+        alive = self.lifetime[:n] > 0
+        kept = int(numpy.count_nonzero(alive))
+        if kept < n:
+            # Compactage : les survivantes sont regroupées en tête de tableau.
+            for array in (self.x, self.y, self.dx, self.dy, self.lifetime, self.color):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def draw(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        n = self.count
+        if n == 0:
+            return
+        if len(self._sprite_table) != len(self.palette.sprites):
+            self._sprite_table = numpy.empty(len(self.palette.sprites), dtype=object)
+            self._sprite_table[:] = self.palette.sprites
+        # alpha < 1 : position interpolée entre le pas précédent et le courant.
+        back = alpha - 1.0
+        if back:
+            px = (self.x[:n] + self.dx[:n] * back).astype(numpy.int32) - DOT_RADIUS
+            py = (self.y[:n] + self.dy[:n] * back).astype(numpy.int32) - DOT_RADIUS
+        else:
+            px = self.x[:n].astype(numpy.int32) - DOT_RADIUS
+            py = self.y[:n].astype(numpy.int32) - DOT_RADIUS
+        width, height = target.get_size()
+        size = DOT_RADIUS * 2 + 1
+        visible = (px > -size) & (px < width) & (py > -size) & (py < height)
+        sprites = self._sprite_table[self.color[:n][visible]]
+        positions = numpy.stack((px[visible], py[visible]), axis=1).tolist()
+        target.blits(zip(sprites, positions), doreturn=False)
+
+
+class ListParticleSystem:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, seed: int | None = None) -> None:
+        self.capacity = capacity
+        self.dropped = 0
+        self.palette = ParticlePalette()
+        self.rng = random.Random(seed)
+        self.particles: list[list] = []
+
+    def __len__(self) -> int:
+        return len(self.particles)
+
+    @property
+    def count(self) -> int:
+        return len(self.particles)
+
+    def clear(self) -> None:
+        self.particles.clear()
+
+    def reseed(self, seed: int) -> None:
+        self.rng.seed(seed)
+
+    def emit(self, x: float, y: float, color: tuple, num_particles: int) -> None:
+        amount = min(num_particles, self.capacity - len(self.particles))
+        self.dropped += num_particles - max(0, amount)
+        color_idx = self.palette.index_of(color)
+        rng = self.rng
+        for _ in range(max(0, amount)):
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(*SPEED_RANGE)
+            lifetime = rng.randint(*LIFETIME_RANGE)
+            self.particles.append([x, y, math.cos(angle) * speed, math.sin(angle) * speed, lifetime, color_idx])
+
+    def update(self) -> None:
+        alive = []
+        for particle in self.particles:
+            particle[0] += particle[2]
+            particle[1] += particle[3]
+            particle[4] -= 1
+            if particle[4] > 0:
+                alive.append(particle)
+        self.particles = alive
+
+    def draw(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        sprites = self.palette.sprites
+        back = alpha - 1.0
+        target.blits(
+            [
+                (sprites[p[5]], (int(p[0] + p[2] * back) - DOT_RADIUS, int(p[1] + p[3] * back) - DOT_RADIUS))
+                for p in self.particles
+            ],
+            doreturn=False,
+        )
+
+
+def create_particle_system(capacity: int = DEFAULT_CAPACITY, seed: int | None = None):
+    if numpy is not None:
+        return ParticleSystem(capacity, seed)
+    return ListParticleSystem(capacity, seed)
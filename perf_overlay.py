@@ -0,0 +1,130 @@
+"""Overlay de diagnostic des performances (touche G).
+
+Affiche les FPS, un graphe des derniers temps de frame et les millisecondes
+moyennes de chaque étape mesurée par `FrameProfiler` (voir profiling.py),
+ainsi que le nombre d'entités à l'écran. Le panneau n'est recomposé que
+toutes les `refresh_frames` frames ; masqué, l'overlay ne coûte rien et le
+profileur reste désactivé.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+from profiling import FrameProfiler
+
+# Ordre d'affichage et libellés des étapes connues ; les autres suivent.
+STAGE_LABELS = {
+    "events": "événements",
+    "physics": "physique",
+    "spawns": "spawns",
+    "collisions": "collisions",
+    "pickups": "bonus",
+    "effects": "effets sim",
+    "background": "fond",
+    "draw": "rendu divers",
+    "enemies": "ennemis/boss",
+    "particles": "particules",
+    "hud": "HUD",
+    "crt": "CRT",
+    "flip": "flip",
+    "overlay": "overlay",
+    "assets": "assets",
+    "wait": "attente",
+}
+
+PANEL_SIZE = (260, 340)
+PANEL_BG = (0, 0, 0, 180)
+GRAPH_HEIGHT = 60
+GRAPH_MAX_MS = 50.0
+TARGET_FRAME_MS = 1000 / 60
+# Marge pour la gigue de clock.tick : au-delà, la frame est comptée comme lente.
+SLOW_FRAME_MS = TARGET_FRAME_MS * 1.25
+AVERAGE_FRAMES = 30
+TEXT_COLOR = (220, 220, 220)
+GOOD_COLOR = (80, 220, 120)
+SLOW_COLOR = (240, 90, 70)
+TARGET_COLOR = (240, 200, 60)
+
+
+class PerfOverlay:
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        position: tuple[int, int] = (10, 110),
+        refresh_frames: int = 10,
+    ) -> None:
+        self.font = font
+        self.position = position
+        self.refresh_frames = refresh_frames
+        self.visible = False
+        self.panel = pygame.Surface(PANEL_SIZE, pygame.SRCALPHA)
+        self._frames_until_refresh = 0
+
+    def toggle(self, profiler: FrameProfiler) -> None:
+        self.visible = not self.visible
+        # Le profileur reste actif tant qu'une trace est enregistrée.
+        profiler.enabled = self.visible or profiler.tracer is not None
+        profiler.reset()
+        self._frames_until_refresh = 0
+
+    def draw(self, target: pygame.Surface, profiler: FrameProfiler, counts: dict[str, int]) -> None:
+        if not self.visible:
+            return
+        self._frames_until_refresh -= 1
+        if self._frames_until_refresh <= 0:
+            self._compose(profiler, counts)
+            self._frames_until_refresh = self.refresh_frames
+        target.blit(self.panel, self.position)
+
+    def _compose(self, profiler: FrameProfiler, counts: dict[str, int]) -> None:
+        panel = self.panel
+        panel.fill(PANEL_BG)
+        width = panel.get_width()
+        frames = list(profiler.frames)
+        recent = frames[-AVERAGE_FRAMES:]
+
+        mean_ms = sum(record.frame_ms for record in recent) / len(recent) if recent else 0.0
+        fps = 1000.0 / mean_ms if mean_ms > 0 else 0.0
+        y = 6
+        y = self._text(f"FPS {fps:5.1f}   frame {mean_ms:5.2f} ms", 8, y, GOOD_COLOR if mean_ms <= SLOW_FRAME_MS else SLOW_COLOR)
+
+        # Graphe des temps de frame, une barre par frame, ligne de l'objectif 60 FPS.
+        graph_top = y + 2
+        graph_frames = frames[-(width - 16):]
+        for idx, record in enumerate(graph_frames):
+            bar = min(GRAPH_HEIGHT, int(record.frame_ms / GRAPH_MAX_MS * GRAPH_HEIGHT))
+            color = GOOD_COLOR if record.frame_ms <= SLOW_FRAME_MS else SLOW_COLOR
+            x = 8 + idx
+            pygame.draw.line(panel, color, (x, graph_top + GRAPH_HEIGHT), (x, graph_top + GRAPH_HEIGHT - bar))
+        target_y = graph_top + GRAPH_HEIGHT - int(TARGET_FRAME_MS / GRAPH_MAX_MS * GRAPH_HEIGHT)
+        pygame.draw.line(panel, TARGET_COLOR, (8, target_y), (width - 8, target_y))
+        y = graph_top + GRAPH_HEIGHT + 4
+
+        totals: dict[str, float] = {}
+        for record in recent:
+            for stage, ms in record.stages.items():
+                totals[stage] = totals.get(stage, 0.0) + ms
+        ordered = [stage for stage in STAGE_LABELS if stage in totals]
+        ordered += sorted(stage for stage in totals if stage not in STAGE_LABELS)
+        for stage in ordered:
+            ms = totals[stage] / len(recent)
+            y = self._row(STAGE_LABELS.get(stage, stage), f"{ms:.2f} ms", y)
+
+        y += 4
+        items = [f"{label} {value}" for label, value in counts.items()]
+        for idx in range(0, len(items), 2):
+            y = self._text("   ".join(items[idx:idx + 2]), 8, y, TEXT_COLOR)
+
+    def _text(self, text: str, x: int, y: int, color: tuple) -> int:
+        surface = self.font.render(text, True, color)
+        self.panel.blit(surface, (x, y))
+        return y + surface.get_height()
+
+    def _row(self, label: str, value: str, y: int) -> int:
+        # Valeur alignée à droite : la police par défaut n'est pas à chasse fixe.
+        label_surface = self.font.render(label, True, TEXT_COLOR)
+        value_surface = self.font.render(value, True, TEXT_COLOR)
+        self.panel.blit(label_surface, (8, y))
+        self.panel.blit(value_surface, (self.panel.get_width() - 8 - value_surface.get_width(), y))
+        return y + label_surface.get_height()
@@ -8,10 +8,20 @@ import importlib
 import os
 import subprocess
 import sys
+import time
 from typing import Literal
 
 
-Scenario = Literal["final_win", "game_over"]
+Scenario = Literal["final_win", "game_over", "headless", "level_intro_idle", "boss_intro_idle"]
+
+HEADLESS_TICKS = 20000
+# Frames passées sur un écran d'intro avant de confirmer (pré-chauffage en cours).
+INTRO_IDLE_FRAMES = 12
+# Écrans d'intro sur lesquels chaque scénario s'attarde.
+IDLE_INTRO_STATES = {
+    "level_intro_idle": ("LEVEL_INTRO",),
+    "boss_intro_idle": ("BOSS_INTRO",),
+}
 
 
 def run_scenario(scenario: Scenario) -> str:
@@ -20,7 +30,8 @@ def run_scenario(scenario: Scenario) -> str:
     import pygame  # import local après config SDL
     import levels
 
-    if scenario == "final_win":
+    idle_states = IDLE_INTRO_STATES.get(scenario, ())
+    if scenario == "final_win" or idle_states:
         for conf in levels.levels:
             conf["target_score"] = 0
     else:
@@ -35,7 +46,10 @@ def run_scenario(scenario: Scenario) -> str:
         "start_sent": False,
         "quit_sent": False,
         "boss_shot_sent": False,
+        "intro_frames": 0,
+        "idle_pending": 0,
     }
+    wins = scenario == "final_win" or bool(idle_states)
 
     def scripted_events():
         state["frame"] += 1
@@ -49,18 +63,23 @@ def run_scenario(scenario: Scenario) -> str:
         if game_state == "MENU" and not state["start_sent"]:
             events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
             state["start_sent"] = True
-        elif game_state == "LEVEL_INTRO":
-            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c))
-        elif game_state == "BOSS_INTRO":
-            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c))
+        elif game_state in ("LEVEL_INTRO", "BOSS_INTRO"):
+            if game_state in idle_states and state["intro_frames"] < INTRO_IDLE_FRAMES:
+                # Reste sur l'écran pendant que les threads de pré-chauffage tournent.
+                state["intro_frames"] += 1
+                if not module.intro_warmup.finished:
+                    state["idle_pending"] += 1
+            else:
+                state["intro_frames"] = 0
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c))
         elif (
             game_state == "PLAYING"
-            and scenario == "final_win"
-            and getattr(module, "boss_active", False)
+            and wins
+            and module.game.boss_active
             and not state["boss_shot_sent"]
         ):
             # Injecte un tir directement sur le boss pour forcer la victoire finale.
-            boss = getattr(module, "boss_data", {})
+            boss = module.game.boss_data
             if boss:
                 boss_rect = pygame.Rect(
                     int(boss["x"] + boss["width"] // 2),
@@ -68,13 +87,13 @@ def run_scenario(scenario: Scenario) -> str:
                     4,
                     4,
                 )
-                module.boss_data["health"] = 1
-                module.bullet_list.append({"rect": boss_rect, "dx": 0, "dy": 0})
+                boss["health"] = 1
+                module.game.bullet_list.append({"rect": boss_rect, "dx": 0, "dy": 0})
                 state["boss_shot_sent"] = True
         elif game_state == "PLAYING" and scenario == "game_over":
             # Force la transition GAME_OVER pour vérifier le flux.
-            module.lives = 0
-        elif game_state == "FINAL_WIN" and scenario == "final_win" and not state["quit_sent"]:
+            module.game.lives = 0
+        elif game_state == "FINAL_WIN" and wins and not state["quit_sent"]:
             events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_q))
             state["quit_sent"] = True
         elif game_state == "GAME_OVER" and scenario == "game_over" and not state["quit_sent"]:
@@ -92,49 +111,100 @@ def run_scenario(scenario: Scenario) -> str:
     finally:
         sys.exit = original_exit
 
+    if idle_states:
+        print(f"INTRO_IDLE_PENDING_FRAMES={state['idle_pending']}")
     module = sys.modules.get("main")
     return getattr(module, "game_state", "UNKNOWN")
 
 
+def run_headless(ticks: int = HEADLESS_TICKS) -> str:
+    """Fait tourner la simulation seule (sans fenêtre ni rendu)."""
+    from simulation import TICK_MS, GameState, PlayerInputs
+
+    game = GameState(seed=1234)
+    inputs = PlayerInputs()
+    started = time.perf_counter()
+    for tick in range(ticks):
+        # Zigzag et tir continu : exerce déplacements, spawns et collisions.
+        inputs.move_x = 1 if (tick // 90) % 2 == 0 else -1
+        inputs.fire = tick % 7 == 0
+        game.step(inputs, TICK_MS)
+        for event in game.drain_events():
+            if event[0] == "game_over":
+                game.reset()
+    elapsed = time.perf_counter() - started
+    print(f"HEADLESS_TICKS={ticks}")
+    print(f"HEADLESS_TICKS_PER_SEC={ticks / elapsed:.0f}")
+    if not check_replay():
+        return "REPLAY_MISMATCH"
+    return "HEADLESS" if game.now > 0 else "UNKNOWN"
+
+
+def check_replay(ticks: int = 3000) -> bool:
+    """Enregistre une partie (fond et gravité compris) puis la rejoue au bit près."""
+    import random
+    import tempfile
+
+    from background import ParallaxBackground
+    from replay import InputRecorder, InputReplay, replay_headless, state_digest
+    from simulation import TICK_MS, GameState, PlayerInputs, RngStreams
+
+    streams = RngStreams(4321)
+    background = ParallaxBackground(800, 600, 50, 3, rng=streams.get("background"))
+    game = GameState(background=background, streams=streams)
+    game.reset(4321)
+    recorder = InputRecorder()
+    recorder.start(game, stars=50, planets=3)
+    script = random.Random(99)
+    inputs = PlayerInputs()
+    for tick in range(ticks):
+        if tick % 40 == 0:
+            inputs = PlayerInputs(move_x=script.choice((-1.0, 0.0, 1.0)), move_y=script.uniform(-1.0, 1.0))
+        inputs.fire = tick % 9 == 0
+        recorder.record(inputs)
+        game.step(inputs, TICK_MS)
+        game.drain_events()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = f"{tmp_dir}/run.json"
+        recorder.save(path)
+        replayed, _events = replay_headless(InputReplay.load(path))
+    ok = state_digest(replayed) == state_digest(game)
+    print(f"HEADLESS_REPLAY={'OK' if ok else 'MISMATCH'} ({len(recorder.runs)} plages pour {ticks} pas)")
+    return ok
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
-    parser.add_argument("--scenario", choices=["final_win", "game_over"])
+    parser.add_argument("--scenario", choices=["final_win", "game_over", "headless", *IDLE_INTRO_STATES])
     args = parser.parse_args()
 
     if args.scenario:
-        result = run_scenario(args.scenario)  # run dans ce process
+        if args.scenario == "headless":
+            result = run_headless()
+        else:
+            result = run_scenario(args.scenario)  # run dans ce process
         print(f"SCENARIO={args.scenario}")
         print(f"SCENARIO_RESULT={result}")
-        expected = "FINAL_WIN" if args.scenario == "final_win" else "GAME_OVER"
+        expected = {"game_over": "GAME_OVER", "headless": "HEADLESS"}.get(args.scenario, "FINAL_WIN")
         print("SCENARIO_PASS" if result == expected else "SCENARIO_FAIL")
         return 0 if result == expected else 1
 
     # Lance chaque scénario dans un sous-processus pour isoler main.py (qui fait sys.exit()).
-    final_proc = subprocess.run(
-        [sys.executable, __file__, "--scenario", "final_win"],
-        capture_output=True,
-        text=True,
-    )
-    gameover_proc = subprocess.run(
-        [sys.executable, __file__, "--scenario", "game_over"],
-        capture_output=True,
-        text=True,
-    )
-
-    final_ok = final_proc.returncode == 0
-    gameover_ok = gameover_proc.returncode == 0
-
-    print(final_proc.stdout.strip())
-    print(gameover_proc.stdout.strip())
-    if final_proc.stderr.strip():
-        print(final_proc.stderr.strip())
-    if gameover_proc.stderr.strip():
-        print(gameover_proc.stderr.strip())
-
-    ok = final_ok and gameover_ok
+    ok = True
+    for scenario in ("final_win", "game_over", "headless", *IDLE_INTRO_STATES):
+        proc = subprocess.run(
+            [sys.executable, __file__, "--scenario", scenario],
+            capture_output=True,
+            text=True,
+        )
+        ok = ok and proc.returncode == 0
+        print(proc.stdout.strip())
+        if proc.stderr.strip():
+            print(proc.stderr.strip())
+
     print("PHASE0_SMOKE=PASS" if ok else "PHASE0_SMOKE=FAIL")
     return 0 if ok else 1
 
-
 if __name__ == "__main__":
     raise SystemExit(main())
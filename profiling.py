@@ -0,0 +1,126 @@
+"""Chronométrage par étape de chaque frame (événements, simulation, rendu, CRT…).
+
+La boucle principale appelle `next_frame()` à chaque tour puis `mark(étape)`
+à la fin de chaque étape : le temps écoulé depuis la marque précédente est
+attribué à cette étape (les étapes de même nom s'additionnent). Les frames
+terminées sont gardées dans un historique borné, que lisent les benchmarks
+(bench/) et les outils de diagnostic.
+
+Désactivé, le profileur ne coûte qu'un test par appel. Si `tracemalloc` est
+actif, chaque frame note aussi le pic de mémoire allouée pendant la frame.
+Avec un `tracer` (tracing.TraceRecorder), frames et étapes sont aussi
+enregistrées comme tranches d'une timeline.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+DEFAULT_HISTORY = 600
+
+
+class FrameRecord:
+    __slots__ = ("index", "label", "start", "frame_ms", "stages", "alloc_peak_bytes", "alloc_blocks")
+
+    def __init__(self, index: int, start: float, label: str = "frame") -> None:
+        self.index = index
+        self.label = label
+        self.start = start
+        self.frame_ms = 0.0
+        self.stages: dict[str, float] = {}
+        self.alloc_peak_bytes: int | None = None
+        self.alloc_blocks = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "label": self.label,
+            "frame_ms": self.frame_ms,
+            "stages": self.stages,
+            "alloc_peak_bytes": self.alloc_peak_bytes,
+            "alloc_blocks": self.alloc_blocks,
+        }
+
+
+class FrameProfiler:
+    def __init__(self, history: int = DEFAULT_HISTORY, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.frames: deque[FrameRecord] = deque(maxlen=history)
+        self.frame_count = 0
+        self.tracer = None
+        self._current: FrameRecord | None = None
+        self._last_mark = 0.0
+        self._alloc_base = 0
+        self._blocks_base = 0
+
+    def reset(self, history: int | None = None) -> None:
+        if history is not None:
+            self.frames = deque(maxlen=history)
+        else:
+            self.frames.clear()
+        self.frame_count = 0
+        self._current = None
+
+    def next_frame(self, label: str = "frame") -> None:
+        """Clôt la frame en cours (s'il y en a une) et en ouvre une nouvelle, nommée `label`."""
+        if not self.enabled:
+            self._current = None
+            return
+        now = time.perf_counter()
+        current = self._current
+        if current is not None:
+            self._close(current, now)
+        self._current = FrameRecord(self.frame_count, now, label)
+        self.frame_count += 1
+        self._last_mark = now
+        if tracemalloc.is_tracing():
+            self._alloc_base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._blocks_base = sys.getallocatedblocks()
+
+    def mark(self, stage: str) -> None:
+        current = self._current
+        if current is None:
+            return
+        now = time.perf_counter()
+        stages = current.stages
+        stages[stage] = stages.get(stage, 0.0) + (now - self._last_mark) * 1000.0
+        if self.tracer is not None:
+            self.tracer.complete(stage, "stage", self._last_mark, now)
+        self._last_mark = now
+
+    def _close(self, record: FrameRecord, now: float) -> None:
+        # Le reste de la frame (après la dernière marque) n'est attribué à aucune étape.
+        record.frame_ms = (now - record.start) * 1000.0
+        if tracemalloc.is_tracing():
+            record.alloc_peak_bytes = tracemalloc.get_traced_memory()[1] - self._alloc_base
+        record.alloc_blocks = sys.getallocatedblocks() - self._blocks_base
+        self.frames.append(record)
+        if self.tracer is not None:
+            self.tracer.complete(record.label, "frame", record.start, now, {"index": record.index})
+
+    @property
+    def last_frame(self) -> FrameRecord | None:
+        return self.frames[-1] if self.frames else None
+
+    def stage_means(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for record in self.frames:
+            for stage, ms in record.stages.items():
+                totals[stage] = totals.get(stage, 0.0) + ms
+        count = max(1, len(self.frames))
+        return {stage: total / count for stage, total in totals.items()}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Percentile par interpolation linéaire (comme numpy.percentile)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
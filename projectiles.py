@@ -0,0 +1,249 @@
+"""Projectiles du boss en structure de tableaux.
+
+Comme les particules (voir particles.py), les projectiles vivent dans des
+tableaux NumPy préalloués : position, vitesse, durée de vie et style
+(rayon + couleur). Déplacement, expiration, sortie d'écran et collision
+cercle/rectangle avec AstroPaws sont vectorisés ; le rendu passe par un seul
+`Surface.blits` de sprites pré-dessinés par style. Des motifs de plusieurs
+milliers de projectiles restent ainsi dans le budget d'une frame.
+Sans NumPy, `ListProjectilePool` offre la même interface en Python pur.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import pygame
+
+from particles import make_dot_sprite
+
+try:
+    import numpy
+except ImportError:  # NumPy reste optionnel.
+    numpy = None
+
+DEFAULT_CAPACITY = 8192
+# Marge hors écran au-delà de laquelle un projectile est retiré.
+CULL_MARGIN = 30
+
+
+class ProjectileStyles:
+    """Sprites de projectile, un par couple (rayon, couleur)."""
+
+    def __init__(self) -> None:
+        self.styles: list[tuple[int, tuple]] = []
+        self.sprites: list[pygame.Surface] = []
+        self._index: dict[tuple, int] = {}
+
+    def index_of(self, radius: int, color: tuple) -> int:
+        key = (int(radius), tuple(color))
+        idx = self._index.get(key)
+        if idx is None:
+            idx = len(self.styles)
+            self._index[key] = idx
+            self.styles.append(key)
+            self.sprites.append(make_dot_sprite(key[1], key[0]))
+        return idx
+
+    def radius(self, idx: int) -> int:
+        return self.styles[idx][0]
+
+
+class ProjectilePool:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+        self.styles = ProjectileStyles()
+        self.x = numpy.zeros(capacity, dtype=numpy.float64)
+        self.y = numpy.zeros(capacity, dtype=numpy.float64)
+        self.dx = numpy.zeros(capacity, dtype=numpy.float64)
+        self.dy = numpy.zeros(capacity, dtype=numpy.float64)
+        self.radius = numpy.zeros(capacity, dtype=numpy.int32)
+        self.lifetime = numpy.zeros(capacity, dtype=numpy.int32)
+        self.style = numpy.zeros(capacity, dtype=numpy.int32)
+        self._sprite_table = numpy.empty(0, dtype=object)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def spawn_many(
+        self,
+        x: Sequence[float] | float,
+        y: Sequence[float] | float,
+        dx: Sequence[float],
+        dy: Sequence[float],
+        radius: int,
+        color: tuple,
+        lifetime: int,
+    ) -> int:
+        """Ajoute une salve de même style ; x/y peuvent être communs à toute la salve."""
+        start = self.count
+        amount = min(len(dx), self.capacity - start)
+        self.dropped += len(dx) - amount
+        if amount <= 0:
+            return 0
+        end = start + amount
+        self.x[start:end] = numpy.broadcast_to(numpy.asarray(x, dtype=numpy.float64), (len(dx),))[:amount]
+        self.y[start:end] = numpy.broadcast_to(numpy.asarray(y, dtype=numpy.float64), (len(dx),))[:amount]
+        self.dx[start:end] = numpy.asarray(dx, dtype=numpy.float64)[:amount]
+        self.dy[start:end] = numpy.asarray(dy, dtype=numpy.float64)[:amount]
+        self.radius[start:end] = radius
+        self.lifetime[start:end] = lifetime
+        self.style[start:end] = self.styles.index_of(radius, color)
+        self.count = end
+        return amount
+
+    def _compact(self, keep) -> None:
+        kept = int(numpy.count_nonzero(keep))
+        n = self.count
+        if kept == n:
+            return
+        # Les survivants sont regroupés en tête de tableau.
+        for array in (self.x, self.y, self.dx, self.dy, self.radius, self.lifetime, self.style):
+            array[:kept] = array[:n][keep]
+        self.count = kept
+
+    def update(self, width: int, height: int) -> None:
+        n = self.count
+        if n == 0:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.dx[:n]
+        y += self.dy[:n]
+        self.lifetime[:n] -= 1
+        keep = (
+            (self.lifetime[:n] > 0)
+            & (x >= -CULL_MARGIN) & (x <= width + CULL_MARGIN)
+            & (y >= -CULL_MARGIN) & (y <= height + CULL_MARGIN)
+        )
+        self._compact(keep)
+
+    def collide_rect(self, rect: pygame.Rect) -> list[int]:
+        """Indices des projectiles dont le disque touche `rect`."""
+        n = self.count
+        if n == 0:
+            return []
+        x = self.x[:n]
+        y = self.y[:n]
+        # Point du rectangle le plus proche du centre, comparé au rayon.
+        nearest_x = numpy.clip(x, rect.left, rect.right)
+        nearest_y = numpy.clip(y, rect.top, rect.bottom)
+        dist_sq = (x - nearest_x) ** 2 + (y - nearest_y) ** 2
+        radius = self.radius[:n]
+        return numpy.flatnonzero(dist_sq <= radius * radius).tolist()
+
+    def remove(self, indices: Sequence[int]) -> None:
+        if not len(indices):
+            return
+        keep = numpy.ones(self.count, dtype=bool)
+        keep[list(indices)] = False
+        self._compact(keep)
+
+    def position(self, idx: int) -> tuple[float, float]:
+        return float(self.x[idx]), float(self.y[idx])
+
+    def positions(self) -> list[tuple[float, float]]:
+        n = self.count
+        return list(zip(self.x[:n].tolist(), self.y[:n].tolist()))
+
+    def draw(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        n = self.count
+        if n == 0:
+            return
+        sprites = self.styles.sprites
+        if len(self._sprite_table) != len(sprites):
+            self._sprite_table = numpy.empty(len(sprites), dtype=object)
+            self._sprite_table[:] = sprites
+        # alpha < 1 : position interpolée entre le pas précédent et le courant.
+        back = alpha - 1.0
+        radius = self.radius[:n]
+        px = (self.x[:n] + self.dx[:n] * back).astype(numpy.int32) - radius
+        py = (self.y[:n] + self.dy[:n] * back).astype(numpy.int32) - radius
+        width, height = target.get_size()
+        size = radius * 2 + 1
+        visible = (px > -size) & (px < width) & (py > -size) & (py < height)
+        sprites = self._sprite_table[self.style[:n][visible]]
+        positions = numpy.stack((px[visible], py[visible]), axis=1).tolist()
+        target.blits(zip(sprites, positions), doreturn=False)
+
+
+class ListProjectilePool:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        self.dropped = 0
+        self.styles = ProjectileStyles()
+        # [x, y, dx, dy, rayon, durée de vie, style]
+        self.projectiles: list[list] = []
+
+    def __len__(self) -> int:
+        return len(self.projectiles)
+
+    @property
+    def count(self) -> int:
+        return len(self.projectiles)
+
+    def clear(self) -> None:
+        self.projectiles.clear()
+
+    def spawn_many(self, x, y, dx, dy, radius: int, color: tuple, lifetime: int) -> int:
+        amount = min(len(dx), self.capacity - len(self.projectiles))
+        self.dropped += len(dx) - max(0, amount)
+        style = self.styles.index_of(radius, color)
+        for i in range(max(0, amount)):
+            px = x[i] if isinstance(x, (list, tuple)) else x
+            py = y[i] if isinstance(y, (list, tuple)) else y
+            self.projectiles.append([px, py, dx[i], dy[i], radius, lifetime, style])
+        return max(0, amount)
+
+    def update(self, width: int, height: int) -> None:
+        alive = []
+        for p in self.projectiles:
+            p[0] += p[2]
+            p[1] += p[3]
+            p[5] -= 1
+            if p[5] > 0 and -CULL_MARGIN <= p[0] <= width + CULL_MARGIN and -CULL_MARGIN <= p[1] <= height + CULL_MARGIN:
+                alive.append(p)
+        self.projectiles = alive
+
+    def collide_rect(self, rect: pygame.Rect) -> list[int]:
+        hits = []
+        for idx, p in enumerate(self.projectiles):
+            nearest_x = min(max(p[0], rect.left), rect.right)
+            nearest_y = min(max(p[1], rect.top), rect.bottom)
+            if (p[0] - nearest_x) ** 2 + (p[1] - nearest_y) ** 2 <= p[4] * p[4]:
+                hits.append(idx)
+        return hits
+
+    def remove(self, indices: Sequence[int]) -> None:
+        removed = set(indices)
+        if removed:
+            self.projectiles = [p for idx, p in enumerate(self.projectiles) if idx not in removed]
+
+    def position(self, idx: int) -> tuple[float, float]:
+        p = self.projectiles[idx]
+        return p[0], p[1]
+
+    def positions(self) -> list[tuple[float, float]]:
+        return [(p[0], p[1]) for p in self.projectiles]
+
+    def draw(self, target: pygame.Surface, alpha: float = 1.0) -> None:
+        sprites = self.styles.sprites
+        back = alpha - 1.0
+        target.blits(
+            [
+                (sprites[p[6]], (int(p[0] + p[2] * back) - p[4], int(p[1] + p[3] * back) - p[4]))
+                for p in self.projectiles
+            ],
+            doreturn=False,
+        )
+
+
+def create_projectile_pool(capacity: int = DEFAULT_CAPACITY):
+    if numpy is not None:
+        return ProjectilePool(capacity)
+    return ListProjectilePool(capacity)
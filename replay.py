@@ -0,0 +1,171 @@
+"""Enregistrement et rejeu des commandes d'une partie.
+
+La simulation étant déterministe (graine + horloge logique, voir
+simulation.py), une partie se résume à sa graine et aux `PlayerInputs` de
+chacun de ses pas. `InputRecorder` les stocke en plages compressées
+(commandes identiques sur plusieurs pas = une seule entrée) et les écrit en
+JSON ; `InputReplay` les redistribue pas à pas, au jeu (rejeu affiché) comme
+à `replay_headless` (rejeu sans affichage, pour les benchmarks et la
+reproduction de bugs). `state_digest` résume l'état final pour comparer deux
+exécutions au bit près.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from background import ParallaxBackground
+from simulation import TICK_MS, GameState, PlayerInputs, RngStreams
+
+REPLAY_FORMAT_VERSION = 1
+
+FLAG_FIRE = 1
+FLAG_SHIELD = 2
+FLAG_HYPER = 4
+
+
+def encode_inputs(inputs: PlayerInputs) -> tuple:
+    flags = (
+        (FLAG_FIRE if inputs.fire else 0)
+        | (FLAG_SHIELD if inputs.shield else 0)
+        | (FLAG_HYPER if inputs.hyper else 0)
+    )
+    return (inputs.move_x, inputs.move_y, flags, inputs.fire_x, inputs.fire_y)
+
+
+def decode_inputs(encoded: tuple) -> PlayerInputs:
+    move_x, move_y, flags, fire_x, fire_y = encoded
+    return PlayerInputs(
+        move_x=move_x,
+        move_y=move_y,
+        fire=bool(flags & FLAG_FIRE),
+        fire_x=fire_x,
+        fire_y=fire_y,
+        shield=bool(flags & FLAG_SHIELD),
+        hyper=bool(flags & FLAG_HYPER),
+    )
+
+
+class InputRecorder:
+    def __init__(self) -> None:
+        self.header: dict = {}
+        # [nombre de pas, move_x, move_y, drapeaux, fire_x, fire_y]
+        self.runs: list[list] = []
+        self.ticks = 0
+
+    def start(self, game: GameState, **extra) -> None:
+        self.header = {
+            "version": REPLAY_FORMAT_VERSION,
+            "seed": game.seed,
+            "tick_ms": TICK_MS,
+            "width": game.width,
+            "height": game.height,
+            "croquette_rain": game.croquette_rain,
+            **extra,
+        }
+        self.runs = []
+        self.ticks = 0
+
+    def record(self, inputs: PlayerInputs) -> None:
+        encoded = encode_inputs(inputs)
+        last = self.runs[-1] if self.runs else None
+        if last is not None and tuple(last[1:]) == encoded:
+            last[0] += 1
+        else:
+            self.runs.append([1, *encoded])
+        self.ticks += 1
+
+    def to_dict(self) -> dict:
+        return {**self.header, "ticks": self.ticks, "inputs": self.runs}
+
+    def save(self, path: str | os.PathLike) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Écriture atomique : un rejeu n'est jamais tronqué par un arrêt brutal.
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+
+class InputReplay:
+    def __init__(self, data: dict) -> None:
+        if data.get("version") != REPLAY_FORMAT_VERSION:
+            raise ValueError(f"format de rejeu non pris en charge : {data.get('version')!r}")
+        self.data = data
+        self.seed: int = data["seed"]
+        self.tick_ms: float = data["tick_ms"]
+        self.ticks: int = data["ticks"]
+        self.rewind()
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> InputReplay:
+        with open(path, encoding="utf-8") as handle:
+            return cls(json.load(handle))
+
+    def rewind(self) -> None:
+        self.position = 0
+        self._run_idx = 0
+        self._run_left = self.data["inputs"][0][0] if self.data["inputs"] else 0
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= self.ticks
+
+    def next_inputs(self) -> PlayerInputs | None:
+        """Commandes du pas suivant, ou None une fois le rejeu épuisé."""
+        if self.finished:
+            return None
+        runs = self.data["inputs"]
+        while self._run_left == 0:
+            self._run_idx += 1
+            self._run_left = runs[self._run_idx][0]
+        self._run_left -= 1
+        self.position += 1
+        return decode_inputs(tuple(runs[self._run_idx][1:]))
+
+
+def state_digest(game: GameState) -> str:
+    """Empreinte de l'état de jeu : deux rejeux identiques donnent la même."""
+    state = (
+        game.ticks, game.now, game.score, game.lives, game.water_ammo, game.level_idx,
+        game.astro_x, game.astro_y, game.astro_vx, game.astro_vy,
+        game.shield_charges, game.hyper_charges, game.boss_active,
+        sorted(game.boss_data.items()),
+        [(e['type'], e['x'], e['y'], e['health']) for e in game.enemy_list],
+        [(c['x'], c['y'], c['type']) for c in game.croquette_list],
+        [tuple(b['rect']) for b in game.bullet_list],
+        game.boss_projectiles.positions(),
+        [(i['x'], i['y']) for i in game.water_item_list + game.hyper_item_list],
+        game.ingredients_collected,
+    )
+    return hashlib.sha1(repr(state).encode("utf-8")).hexdigest()
+
+
+def replay_headless(replay: InputReplay) -> tuple[GameState, list[tuple]]:
+    """Rejoue une partie sans affichage ; renvoie l'état final et ses événements."""
+    data = replay.data
+    streams = RngStreams(replay.seed)
+    background = None
+    if "planets" in data:
+        # Fond reconstruit à l'identique : la gravité des planètes est rejouée aussi.
+        background = ParallaxBackground(
+            data["width"], data["height"], data["stars"], data["planets"], rng=streams.get("background"),
+        )
+    game = GameState(
+        data["width"], data["height"], background=background, streams=streams,
+        croquette_rain=data.get("croquette_rain", False),
+    )
+    game.reset(replay.seed)
+    replay.rewind()
+    events: list[tuple] = []
+    while True:
+        inputs = replay.next_inputs()
+        if inputs is None:
+            break
+        game.step(inputs, replay.tick_ms)
+        events.extend(game.drain_events())
+    return game, events
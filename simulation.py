@@ -0,0 +1,1093 @@
+"""Cœur de simulation d'une partie, sans affichage.
+
+`GameState` regroupe tout l'état d'une partie (AstroPaws, ennemis, tirs, boss,
+bonus, score) et l'avance d'un pas avec `step(inputs, dt)`. Aucune surface
+n'est dessinée ici : les effets visuels et sonores sont publiés sous forme
+d'événements (`("explosion", x, y, couleur, n)`, `("sound", nom)`,
+`("level_complete", niveau)`…) que le rendu consomme avec `drain_events()`.
+Le même objet sert au jeu, aux tests et aux réglages en mode headless.
+
+Les vitesses sont exprimées par pas de `TICK_MS` : `FixedTimestep` découpe
+le temps réel en pas fixes, et chaque entité mobile garde sa position du pas
+précédent (`px`/`py`) pour que le rendu interpole entre deux pas.
+
+Une partie est déterministe : l'horloge `now` ne compte que les pas simulés
+et chaque sous-système tire ses nombres d'un flux `RngStreams` dérivé de la
+graine de la partie. Mêmes graine et commandes, même partie (voir replay.py).
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pygame
+
+import levels
+from projectiles import create_projectile_pool
+from spatial_grid import SpatialHashGrid
+
+YELLOW = (255, 255, 0)
+ORANGE = (255, 165, 0)
+BLUE = (0, 0, 255)
+RED = (255, 0, 0)
+CYAN = (0, 255, 255)
+
+# Pas fixe de simulation (60 pas/s, quelle que soit la fréquence d'affichage).
+TICK_MS = 1000 / 60
+# Au-delà (fenêtre déplacée, chargement…), le retard est abandonné.
+MAX_FRAME_MS = 100
+# Un saut plus grand qu'un pas normal (wrap-around, remise à zéro) n'est pas interpolé.
+MAX_INTERPOLATION_JUMP = 120
+
+INITIAL_LIVES = 9
+INITIAL_WATER_AMMO = 50
+INITIAL_CROQUETTES = 5
+ASTRO_SPEED = 5
+ASTRO_SPRITE_SIZE = 80
+ASTRO_HITBOX_SIZE = 50
+ASTRO_ACCEL = 0.85
+ASTRO_FRICTION = 0.82
+ASTRO_DRAG = 0.98
+ASTRO_HIT_FLASH_DURATION = 220
+HYPER_DASH_MULTIPLIER = 3
+HYPER_DASH_DURATION = 450
+HYPER_PICKUP_LIFETIME = 7000
+HYPER_PICKUP_SPAWN_CHANCE = 0.003
+HYPER_PICKUP_SIZE = 30
+SHIELD_DURATION = 5000
+SHIELD_COOLDOWN = 30000
+REWARD_DELAY = 30000
+
+BULLET_SPEED = 10
+BULLET_WIDTH = 10
+BULLET_HEIGHT = 4
+
+CROQUETTE_SIZE = 10
+CROQUETTE_LIFETIME = 5000
+CROQUETTE_SPRITE_SIZES = {"normal": (30, 30), "rare": (40, 40)}
+# Mode bonus « pluie de croquettes » : des centaines de croquettes tombent du haut.
+CROQUETTE_RAIN_PER_TICK = 1.5
+CROQUETTE_RAIN_MAX = 500
+CROQUETTE_RAIN_SPEED = (2.0, 3.0)
+WATER_ITEM_SIZE = 30
+
+GRAVITY_RADIUS = 220
+GRAVITY_LEVEL_STRENGTH = {
+    0: 0.0,
+    1: 0.12,
+    2: 0.18,
+}
+
+OXIDIZED_FROM_LEVEL = 1
+OXIDIZED_DELAY_MS = 3200
+OXIDIZED_BONUS_SCORE = 12
+OXIDIZED_WATER_PENALTY = 4
+OXIDIZED_DEBUFF_DURATION = 1800
+
+BOSS_MAX_HEALTH = 72
+BOSS_SPRITE_SIZE = (180, 120)
+
+BALANCE_BASE_SPAWN = {0: 0.018, 1: 0.022, 2: 0.027}
+BALANCE_WATER_PICKUP_BASE = {0: 0.0055, 1: 0.0062, 2: 0.0068}
+BALANCE_COOLDOWN_BASE = {0: 290, 1: 270, 2: 250}
+
+# Le cooldown est récupéré depuis la config de niveau si disponible.
+hyper_level_cfg = next(
+    (cfg for cfg in levels.levels if cfg.get("item", {}).get("type") == "hyperdrive"),
+    None
+)
+HYPER_COOLDOWN = (
+    hyper_level_cfg.get("item", {}).get("cooldown", 60000) if hyper_level_cfg else 60000
+)
+
+ENEMY_STATS = {
+    # largeur, hauteur, vitesse, santé
+    "dog": (50, 50, 2, 3),
+    "rat": (30, 30, 3, 1),  # rat tué en 1 jet
+    "mouse": (20, 20, 4, 1),
+}
+ENEMY_KILL_REWARDS = {
+    # points, couleur d'explosion
+    "rat": (20, (200, 0, 0)),
+    "mouse": (10, (255, 100, 100)),
+    "dog": (30, (255, 0, 0)),
+}
+
+
+def get_level_gravity_strength(level_index: int) -> float:
+    return GRAVITY_LEVEL_STRENGTH.get(level_index, 0.0)
+
+
+def is_croquette_oxidized(croquette: dict, level_index: int, now_ms: float) -> bool:
+    if level_index < OXIDIZED_FROM_LEVEL:
+        return False
+    return (now_ms - croquette['spawn_time']) >= OXIDIZED_DELAY_MS
+
+
+def get_level_spawn_chance(level_index: int, score_value: int, lives_value: int, boss_on: bool) -> float:
+    if boss_on:
+        return 0.0
+    base = BALANCE_BASE_SPAWN.get(level_index, 0.03)
+    score_pressure = min(0.018, max(0, score_value) * 0.00009)
+    survival_relief = -0.006 if lives_value <= 2 else 0.0
+    return max(0.010, min(0.055, base + score_pressure + survival_relief))
+
+
+def get_water_pickup_spawn_chance(level_index: int, boss_on: bool, water_value: int) -> float:
+    if boss_on:
+        return 0.011
+    base = BALANCE_WATER_PICKUP_BASE.get(level_index, 0.0065)
+    low_water_bonus = 0.0035 if water_value <= 20 else 0.0
+    return min(0.018, base + low_water_bonus)
+
+
+def get_shot_cooldown(level_index: int, boss_on: bool) -> int:
+    if boss_on:
+        return 220
+    return BALANCE_COOLDOWN_BASE.get(level_index, 250)
+
+
+def facing_to_vector(facing_value: str) -> tuple[float, float]:
+    if facing_value == "left":
+        return -1.0, 0.0
+    if facing_value == "right":
+        return 1.0, 0.0
+    if facing_value == "up":
+        return 0.0, -1.0
+    return 0.0, 1.0
+
+
+class PlayerInputs:
+    """Commandes d'un pas : axes de déplacement et actions déclenchées."""
+
+    def __init__(
+        self,
+        move_x: float = 0.0,
+        move_y: float = 0.0,
+        fire: bool = False,
+        fire_x: float = 0.0,
+        fire_y: float = 0.0,
+        shield: bool = False,
+        hyper: bool = False,
+    ) -> None:
+        self.move_x = move_x
+        self.move_y = move_y
+        self.fire = fire
+        # Direction du tir ; (0, 0) = orientation courante d'AstroPaws.
+        self.fire_x = fire_x
+        self.fire_y = fire_y
+        self.shield = shield
+        self.hyper = hyper
+
+
+def interpolate(previous: float, current: float, alpha: float) -> float:
+    """Position de rendu entre le pas précédent et le pas courant."""
+    if abs(current - previous) > MAX_INTERPOLATION_JUMP:
+        return current
+    return previous + (current - previous) * alpha
+
+
+class RngStreams:
+    """Flux aléatoires indépendants par sous-système, dérivés d'une graine unique.
+
+    Un tirage de plus dans un sous-système (une explosion décorative, un OVNI)
+    ne décale pas les tirages des autres : seuls les flux de gameplay
+    conditionnent la partie.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed = new_seed() if seed is None else seed
+        self._streams: dict[str, random.Random] = {}
+
+    def get(self, name: str) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(self.derive_seed(name))
+            self._streams[name] = stream
+        return stream
+
+    def derive_seed(self, name: str) -> int:
+        # Les chaînes sont hachées (SHA-512) par random.seed : stable d'un lancement à l'autre.
+        return random.Random(f"{self.seed}:{name}").getrandbits(64)
+
+    def reseed(self, seed: int) -> None:
+        # Les flux déjà distribués (fond, OVNIs…) sont réensemencés sur place.
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(self.derive_seed(name))
+
+
+def new_seed() -> int:
+    return random.SystemRandom().getrandbits(32)
+
+
+def _ignore_stage(_stage: str) -> None:
+    pass
+
+
+class FixedTimestep:
+    """Accumulateur : convertit le temps réel d'une frame en pas fixes."""
+
+    def __init__(self, tick_ms: float = TICK_MS, max_frame_ms: float = MAX_FRAME_MS) -> None:
+        self.tick_ms = tick_ms
+        self.max_frame_ms = max_frame_ms
+        self.accumulator = 0.0
+
+    def reset(self) -> None:
+        self.accumulator = 0.0
+
+    def advance(self, frame_ms: float) -> int:
+        """Ajoute `frame_ms` et renvoie le nombre de pas à simuler."""
+        self.accumulator += min(frame_ms, self.max_frame_ms)
+        ticks = int(self.accumulator // self.tick_ms)
+        self.accumulator -= ticks * self.tick_ms
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        # Fraction du pas suivant déjà écoulée : poids d'interpolation du rendu.
+        return self.accumulator / self.tick_ms
+
+
+class GameState:
+    def __init__(
+        self,
+        width: int = 800,
+        height: int = 600,
+        background=None,
+        seed: int | None = None,
+        streams: RngStreams | None = None,
+        profiler=None,
+        croquette_rain: bool = False,
+    ) -> None:
+        self.width = width
+        self.height = height
+        # Objet optionnel exposant update(), reset() et planets (gravité des planètes).
+        self.background = background
+        self.streams = streams if streams is not None else RngStreams(seed)
+        self.croquette_rng = self.streams.get("croquettes")
+        self.enemy_rng = self.streams.get("enemies")
+        self.boss_rng = self.streams.get("boss")
+        self.pickup_rng = self.streams.get("pickups")
+        self.croquette_rain = croquette_rain
+        self.grid = SpatialHashGrid()
+        # Tableaux préalloués, réutilisés d'une partie à l'autre.
+        self.boss_projectiles = create_projectile_pool()
+        self.events: list[tuple] = []
+        # Profileur optionnel (FrameProfiler) : step() y découpe physique, spawns, collisions.
+        self.mark_stage = profiler.mark if profiler is not None else _ignore_stage
+        self.reset(seed)
+
+    # --- Cycle de vie -----------------------------------------------------
+
+    @property
+    def seed(self) -> int:
+        return self.streams.seed
+
+    def reset(self, seed: int | None = None) -> None:
+        """Nouvelle partie ; avec `seed`, tous les flux aléatoires repartent de cette graine."""
+        if seed is not None:
+            self.streams.reseed(seed)
+        # Horloge logique : temps simulé depuis le début de la partie.
+        self.now = 0.0
+        self.ticks = 0
+        if self.background is not None and hasattr(self.background, "reset"):
+            # Les planètes (et leur gravité) font partie de l'état de jeu.
+            self.background.reset()
+        self.astro_x = self.width // 2
+        self.astro_y = self.height // 2
+        self.astro_px = self.astro_x
+        self.astro_py = self.astro_y
+        self.astro_facing = "right"
+        self.astro_vx = 0.0
+        self.astro_vy = 0.0
+        self.astro_move_dx = 0.0
+        self.astro_move_dy = 0.0
+        self.astro_hit_flash_until = 0
+
+        self.score = 0
+        self.lives = INITIAL_LIVES
+        self.water_ammo = INITIAL_WATER_AMMO
+        self.level_idx = 0
+        self.next_shot_allowed_time = 0
+        self.cooldown_time = get_shot_cooldown(0, False)
+
+        self.game_start_time = None
+        self.reward_shown = False
+        self.shield_charges = 0
+        self.shield_active = False
+        self.shield_start_time = None
+        self.shield_last_granted_time = None
+        self.hyper_charges = 0
+        self.hyper_active = False
+        self.hyper_start_time = None
+        self.hyper_last_granted_time = None
+        self.hyper_unlocked = False
+        self.hyper_last_fx_time = 0
+        self.oxidized_debuff_until = 0
+        self.gravity_pull_strength = 0.0
+        self.gravity_pull_planet = None
+        self.boss_active = False
+        self.boss_defeated = False
+        self.boss_data = {}
+        self.boss_projectiles.clear()
+        self.boss_contact_cooldown_until = 0
+        self.ingredients_collected = []
+
+        self.enemy_list = []
+        self.bullet_list = []
+        self.water_item_list = []
+        self.hyper_item_list = []
+        self.croquette_list = [self.spawn_croquette() for _ in range(INITIAL_CROQUETTES)]
+        self.events.clear()
+
+    def elapsed_ms(self) -> float | None:
+        """Temps de jeu du niveau en cours (None avant le premier pas)."""
+        if self.game_start_time is None:
+            return None
+        return self.now - self.game_start_time
+
+    # --- Événements -------------------------------------------------------
+
+    def emit(self, kind: str, *args) -> None:
+        self.events.append((kind, *args))
+
+    def drain_events(self) -> list[tuple]:
+        events = self.events
+        self.events = []
+        return events
+
+    def explode(self, x: float, y: float, color: tuple = YELLOW, num_particles: int = 20) -> None:
+        self.emit("explosion", x, y, color, num_particles)
+
+    def add_ingredient(self, ingredient: str) -> None:
+        self.ingredients_collected.append(ingredient)
+        self.emit("ingredient", ingredient)
+
+    # --- Fabriques --------------------------------------------------------
+
+    def spawn_croquette(self) -> dict:
+        rng = self.croquette_rng
+        x = rng.randint(0, self.width - CROQUETTE_SIZE)
+        y = rng.randint(0, self.height - CROQUETTE_SIZE)
+        croquette_type = "rare" if rng.random() < 0.1 else "normal"
+        return {'x': x, 'y': y, 'spawn_time': self.now, 'type': croquette_type}
+
+    def spawn_rain_croquette(self) -> dict:
+        rng = self.croquette_rng
+        size = CROQUETTE_SPRITE_SIZES["rare"][1]
+        croquette = self.spawn_croquette()
+        croquette['y'] = croquette['py'] = -size
+        croquette['vy'] = rng.uniform(*CROQUETTE_RAIN_SPEED)
+        return croquette
+
+    def spawn_enemy(self) -> None:
+        rng = self.enemy_rng
+        # Choisir le type en fonction des poids du niveau
+        spawn_weights = levels.levels[self.level_idx]['spawn_weights']
+        enemy_type = rng.choices(
+            population=list(spawn_weights.keys()),
+            weights=list(spawn_weights.values())
+        )[0]
+        enemy_width, enemy_height, enemy_speed, enemy_health = ENEMY_STATS.get(enemy_type, ENEMY_STATS["mouse"])
+        # Déterminer le côté d'apparition
+        side = rng.choice(['left', 'right', 'top', 'bottom'])
+        if side == 'left':
+            x, y, dx, dy = -enemy_width, rng.randint(0, self.height - enemy_height), enemy_speed, 0
+        elif side == 'right':
+            x, y, dx, dy = self.width, rng.randint(0, self.height - enemy_height), -enemy_speed, 0
+        elif side == 'top':
+            x, y, dx, dy = rng.randint(0, self.width - enemy_width), -enemy_height, 0, enemy_speed
+        else:  # 'bottom'
+            x, y, dx, dy = rng.randint(0, self.width - enemy_width), self.height, 0, -enemy_speed
+        self.enemy_list.append({
+            'x': x, 'y': y, 'width': enemy_width, 'height': enemy_height,
+            'type': enemy_type, 'dx': dx, 'dy': dy,
+            'speed': enemy_speed, 'health': enemy_health,
+            'bob_phase': rng.uniform(0, 2 * math.pi),
+            'anim_phase': rng.uniform(0, 2 * math.pi),
+            'spawn_time': self.now
+        })
+
+    def fire_player_bullet(self, direction_x: float, direction_y: float) -> bool:
+        if self.now < self.next_shot_allowed_time or self.water_ammo <= 0:
+            return False
+        magnitude = math.hypot(direction_x, direction_y)
+        if magnitude <= 0:
+            direction_x, direction_y = facing_to_vector(self.astro_facing)
+            magnitude = math.hypot(direction_x, direction_y)
+        direction_x = direction_x / magnitude * BULLET_SPEED
+        direction_y = direction_y / magnitude * BULLET_SPEED
+        bullet_rect = pygame.Rect(
+            self.astro_x + 25 - BULLET_WIDTH // 2,
+            self.astro_y + 25 - BULLET_HEIGHT // 2,
+            BULLET_WIDTH,
+            BULLET_HEIGHT,
+        )
+        self.bullet_list.append({'rect': bullet_rect, 'dx': direction_x, 'dy': direction_y})
+        self.next_shot_allowed_time = self.now + self.cooldown_time
+        self.water_ammo -= 1
+        self.emit("sound", "shoot")
+        return True
+
+    def activate_shield(self) -> None:
+        if self.shield_charges <= 0 or self.shield_active:
+            return
+        self.shield_active = True
+        self.shield_start_time = self.now
+        self.shield_charges -= 1
+        self.explode(self.astro_x + 40, self.astro_y + 40, color=BLUE, num_particles=20)
+
+    def activate_hyper(self) -> None:
+        if self.hyper_charges <= 0 or self.hyper_active:
+            return
+        now = self.now
+        self.hyper_active = True
+        self.hyper_start_time = now
+        self.hyper_last_fx_time = now
+        self.hyper_charges -= 1
+        self.hyper_last_granted_time = now
+        self.emit("hyper_inventory")
+        self.explode(self.astro_x + 40, self.astro_y + 40, color=YELLOW, num_particles=35)
+        dash_impulse = ASTRO_SPEED * 1.8
+        if self.astro_facing == "left":
+            self.astro_vx -= dash_impulse
+        elif self.astro_facing == "right":
+            self.astro_vx += dash_impulse
+        elif self.astro_facing == "up":
+            self.astro_vy -= dash_impulse
+        else:
+            self.astro_vy += dash_impulse
+        self.emit("sound", "hyper_dash")
+
+    # --- Boss -------------------------------------------------------------
+
+    def start_boss_fight(self) -> None:
+        self.boss_active = True
+        self.boss_data = {
+            'name': "Imperatrice Zibeline",
+            'x': self.width // 2 - 90,
+            'y': 90,
+            'width': BOSS_SPRITE_SIZE[0],
+            'height': BOSS_SPRITE_SIZE[1],
+            'health': BOSS_MAX_HEALTH,
+            'max_health': BOSS_MAX_HEALTH,
+            'phase': 1,
+            'vx': 1,
+            'last_shot': self.now,
+            'seed': self.boss_rng.uniform(0, math.pi * 2),
+        }
+        self.boss_projectiles.clear()
+        self.boss_contact_cooldown_until = 0
+        self.emit("boss_intro")
+
+    def spawn_boss_projectiles(self, player_center: tuple[float, float]) -> None:
+        boss_data = self.boss_data
+        if not self.boss_active or not boss_data:
+            return
+
+        phase = boss_data['phase']
+        base_x = boss_data['x'] + boss_data['width'] // 2
+        base_y = boss_data['y'] + boss_data['height'] - 8
+        target_angle = math.atan2(player_center[1] - base_y, player_center[0] - base_x)
+
+        spread_by_phase = {
+            1: [0.0],
+            2: [-0.20, 0.0, 0.20],
+            3: [-0.40, -0.20, 0.0, 0.20, 0.40],
+        }
+        speed_by_phase = {1: 4.2, 2: 4.8, 3: 5.4}
+        radius_by_phase = {1: 5, 2: 6, 3: 7}
+        color_by_phase = {1: ORANGE, 2: RED, 3: (255, 60, 120)}
+
+        speed = speed_by_phase[phase]
+        angles = [target_angle + spread for spread in spread_by_phase[phase]]
+        self.boss_projectiles.spawn_many(
+            base_x,
+            base_y,
+            [math.cos(angle) * speed for angle in angles],
+            [math.sin(angle) * speed for angle in angles],
+            radius_by_phase[phase],
+            color_by_phase[phase],
+            220,
+        )
+
+        if phase == 3:
+            # Rafale latérale pour mettre la pression en phase finale.
+            self.boss_projectiles.spawn_many(
+                [40, self.width - 40],
+                boss_data['y'] + boss_data['height'] // 2,
+                [1.6, -1.6],
+                [4.4, 4.4],
+                6,
+                (255, 80, 140),
+                190,
+            )
+
+        boss_data['last_shot'] = self.now
+
+    def compute_planet_gravity_pull(self, player_cx: float, player_cy: float) -> tuple:
+        gravity_strength = get_level_gravity_strength(self.level_idx)
+        if gravity_strength <= 0 or self.background is None:
+            return 0.0, 0.0, None, 0.0
+
+        best_dx = 0.0
+        best_dy = 0.0
+        best_planet = None
+        best_pull = 0.0
+        for planet in self.background.planets:
+            dx = planet['x'] - player_cx
+            dy = planet['y'] - player_cy
+            dist = math.hypot(dx, dy)
+            if dist <= 2 or dist >= GRAVITY_RADIUS:
+                continue
+            influence = 1.0 - (dist / GRAVITY_RADIUS)
+            pull_strength = gravity_strength * influence * (0.8 + planet['size'] / 22)
+            if pull_strength > best_pull:
+                best_pull = pull_strength
+                best_dx = (dx / dist) * pull_strength
+                best_dy = (dy / dist) * pull_strength
+                best_planet = planet
+
+        return best_dx, best_dy, best_planet, best_pull
+
+    # --- Pas de simulation ------------------------------------------------
+
+    def step(self, inputs: PlayerInputs | None, dt: float) -> None:
+        """Avance la partie d'un pas de `dt` millisecondes (normalement `TICK_MS`)."""
+        self.now += dt
+        self.ticks += 1
+        if inputs is None:
+            inputs = PlayerInputs()
+        if not self._update_timers():
+            return
+        if inputs.shield:
+            self.activate_shield()
+        if inputs.hyper:
+            self.activate_hyper()
+        if inputs.fire:
+            self.fire_player_bullet(inputs.fire_x, inputs.fire_y)
+        self._update_player(inputs.move_x, inputs.move_y)
+        self._update_bullets()
+        if self.background is not None:
+            # Défilement du fond : les planètes (et leur gravité) bougent avec lui.
+            self.background.update()
+        self._update_enemies()
+        self._update_boss()
+        self.mark_stage("physics")
+        dead_enemies = set()
+        if self._collide_bullets(dead_enemies):
+            return
+        self._collide_player(dead_enemies)
+        self.mark_stage("collisions")
+        # Vérifier Game Over: si les vies tombent à 0
+        if self.lives <= 0:
+            self.emit("game_over")
+            return
+        self._update_croquettes()
+        if self._check_level_target():
+            return
+        self._update_pickups()
+        self.mark_stage("pickups")
+
+    def _update_timers(self) -> bool:
+        now = self.now
+        self.cooldown_time = get_shot_cooldown(self.level_idx, self.boss_active)
+        # Initialiser le chronomètre au début du niveau
+        if self.game_start_time is None:
+            self.game_start_time = now
+        # Récompense à 30 secondes : le bouclier est octroyé, le rendu affiche l'écran dédié
+        if not self.boss_active and not self.reward_shown and now - self.game_start_time >= REWARD_DELAY:
+            self.shield_charges = 1
+            self.shield_last_granted_time = now
+            self.reward_shown = True
+            self.emit("reward")
+            return False
+        # Recharge automatique du bouclier toutes les SHIELD_COOLDOWN ms
+        if self.reward_shown and self.shield_last_granted_time is not None and now - self.shield_last_granted_time >= SHIELD_COOLDOWN:
+            self.shield_charges += 1
+            self.shield_last_granted_time = now
+            self.emit("shield_inventory")
+        if self.shield_active and now - self.shield_start_time >= SHIELD_DURATION:
+            self.shield_active = False
+        # Fin du dash Hyperdrive
+        if self.hyper_active and self.hyper_start_time is not None and now - self.hyper_start_time >= HYPER_DASH_DURATION:
+            self.hyper_active = False
+        # Recharge automatique de l'Hyperdrive après déblocage
+        if self.hyper_unlocked and self.hyper_last_granted_time is not None and now - self.hyper_last_granted_time >= HYPER_COOLDOWN:
+            self.hyper_charges += 1
+            self.hyper_last_granted_time = now
+            self.emit("hyper_inventory")
+        return True
+
+    def _update_player(self, input_x: float, input_y: float) -> None:
+        now = self.now
+        # Déplacement inertiel : accélération, friction, glisse spatiale.
+        input_x = max(-1.0, min(1.0, input_x))
+        input_y = max(-1.0, min(1.0, input_y))
+        if input_x != 0 and input_y != 0:
+            input_x *= 0.7071
+            input_y *= 0.7071
+
+        if input_x < 0:
+            self.astro_facing = "left"
+        elif input_x > 0:
+            self.astro_facing = "right"
+        elif input_y < 0:
+            self.astro_facing = "up"
+        elif input_y > 0:
+            self.astro_facing = "down"
+        elif abs(self.astro_vx) + abs(self.astro_vy) > 0.35:
+            if abs(self.astro_vx) >= abs(self.astro_vy):
+                self.astro_facing = "right" if self.astro_vx > 0 else "left"
+            else:
+                self.astro_facing = "down" if self.astro_vy > 0 else "up"
+
+        max_speed = ASTRO_SPEED * (HYPER_DASH_MULTIPLIER if self.hyper_active else 1)
+        accel = ASTRO_ACCEL * (1.35 if self.hyper_active else 1.0)
+        if now < self.oxidized_debuff_until:
+            accel *= 0.72
+            max_speed *= 0.82
+
+        vx, vy = self.astro_vx, self.astro_vy
+        if input_x != 0:
+            vx += input_x * accel
+        else:
+            vx *= ASTRO_FRICTION
+        if input_y != 0:
+            vy += input_y * accel
+        else:
+            vy *= ASTRO_FRICTION
+
+        center_x = self.astro_x + ASTRO_SPRITE_SIZE // 2
+        center_y = self.astro_y + ASTRO_SPRITE_SIZE // 2
+        grav_dx, grav_dy, self.gravity_pull_planet, self.gravity_pull_strength = (
+            self.compute_planet_gravity_pull(center_x, center_y)
+        )
+        vx += grav_dx
+        vy += grav_dy
+
+        vx *= ASTRO_DRAG
+        vy *= ASTRO_DRAG
+        velocity_mag = math.hypot(vx, vy)
+        if velocity_mag > max_speed:
+            scale = max_speed / velocity_mag
+            vx *= scale
+            vy *= scale
+        if abs(vx) < 0.01:
+            vx = 0.0
+        if abs(vy) < 0.01:
+            vy = 0.0
+
+        self.astro_vx, self.astro_vy = vx, vy
+        self.astro_move_dx = vx
+        self.astro_move_dy = vy
+        self.astro_px = self.astro_x
+        self.astro_py = self.astro_y
+        self.astro_x += vx
+        self.astro_y += vy
+
+        if self.hyper_active and now - self.hyper_last_fx_time >= 40:
+            self.explode(self.astro_x + 40, self.astro_y + 40, color=YELLOW, num_particles=8)
+            self.hyper_last_fx_time = now
+
+        # Wrap-around : traverser d'un bord à l'autre
+        if self.astro_x > self.width:
+            self.astro_x = -ASTRO_SPRITE_SIZE
+        elif self.astro_x < -ASTRO_SPRITE_SIZE:
+            self.astro_x = self.width
+        if self.astro_y > self.height:
+            self.astro_y = -ASTRO_SPRITE_SIZE
+        elif self.astro_y < -ASTRO_SPRITE_SIZE:
+            self.astro_y = self.height
+
+    def _update_bullets(self) -> None:
+        width, height = self.width, self.height
+        for bullet in self.bullet_list:
+            bullet['px'] = bullet['rect'].x
+            bullet['py'] = bullet['rect'].y
+            bullet['rect'].x += bullet['dx']
+            bullet['rect'].y += bullet['dy']
+        self.bullet_list = [
+            bullet for bullet in self.bullet_list
+            if bullet['rect'].right > 0 and bullet['rect'].left < width
+            and bullet['rect'].bottom > 0 and bullet['rect'].top < height
+        ]
+
+    def _update_enemies(self) -> None:
+        self.mark_stage("physics")
+        # Spawn d'ennemis selon configuration du niveau
+        spawn_chance = get_level_spawn_chance(self.level_idx, self.score, self.lives, self.boss_active)
+        if not self.boss_active and self.enemy_rng.random() < spawn_chance:
+            self.spawn_enemy()
+        self.mark_stage("spawns")
+        width, height = self.width, self.height
+        new_enemy_list = []
+        for enemy in self.enemy_list:
+            enemy['px'] = enemy['x']
+            enemy['py'] = enemy['y']
+            enemy['x'] += enemy['dx']
+            enemy['y'] += enemy['dy']
+            if enemy['x'] + enemy['width'] > 0 and enemy['x'] < width and enemy['y'] + enemy['height'] > 0 and enemy['y'] < height:
+                new_enemy_list.append(enemy)
+        self.enemy_list = new_enemy_list
+
+    def _update_boss(self) -> None:
+        boss_data = self.boss_data
+        if not self.boss_active or not boss_data:
+            return
+        now = self.now
+        # Mise à jour du boss final (mouvement, phases, tirs).
+        health_ratio = boss_data['health'] / max(1, boss_data['max_health'])
+        previous_phase = boss_data['phase']
+        if health_ratio > 0.66:
+            boss_data['phase'] = 1
+        elif health_ratio > 0.33:
+            boss_data['phase'] = 2
+        else:
+            boss_data['phase'] = 3
+        if boss_data['phase'] != previous_phase:
+            self.emit("boss_phase", boss_data['phase'])
+
+        phase_speed = {1: 1.8, 2: 2.7, 3: 3.6}[boss_data['phase']]
+        boss_data['px'] = boss_data['x']
+        boss_data['py'] = boss_data['y']
+        boss_data['x'] += boss_data['vx'] * phase_speed
+        if boss_data['x'] <= 40:
+            boss_data['x'] = 40
+            boss_data['vx'] = 1
+        elif boss_data['x'] + boss_data['width'] >= self.width - 40:
+            boss_data['x'] = self.width - 40 - boss_data['width']
+            boss_data['vx'] = -1
+        boss_data['y'] = 90 + int(24 * math.sin(now / 380 + boss_data.get('seed', 0.0)))
+
+        shot_cooldown = {1: 1200, 2: 850, 3: 620}[boss_data['phase']]
+        if now - boss_data['last_shot'] >= shot_cooldown:
+            self.spawn_boss_projectiles((self.astro_x + 25, self.astro_y + 25))
+
+        # Déplacement, durée de vie et sortie d'écran, vectorisés (projectiles.py).
+        self.boss_projectiles.update(self.width, self.height)
+
+    def boss_rect(self) -> pygame.Rect:
+        boss_data = self.boss_data
+        return pygame.Rect(boss_data['x'], boss_data['y'], boss_data['width'], boss_data['height'])
+
+    def player_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.astro_x, self.astro_y, ASTRO_HITBOX_SIZE, ASTRO_HITBOX_SIZE)
+
+    def _collide_bullets(self, dead_enemies: set[int]) -> bool:
+        grid = self.grid
+        enemy_list = self.enemy_list
+        # Collision entre les tirs (jet d'eau) et les ennemis
+        grid.build(
+            "enemy",
+            (pygame.Rect(enemy['x'], enemy['y'], enemy['width'], enemy['height']) for enemy in enemy_list),
+        )
+        boss_rect = self.boss_rect() if self.boss_active and self.boss_data else None
+        new_bullet_list = []
+        boss_defeated_this_frame = False
+        for bullet in self.bullet_list:
+            bullet_rect = bullet['rect']
+            hit_enemy = False
+            # Candidats triés dans l'ordre de enemy_list : le premier touché consomme le tir
+            for enemy_idx in grid.collisions("enemy", bullet_rect, dead_enemies):
+                enemy = enemy_list[enemy_idx]
+                # Décrémenter la santé de l'ennemi à chaque tir
+                enemy['health'] -= 1
+                # Si la santé tombe à zéro, l'ennemi est détruit
+                if enemy['health'] <= 0:
+                    points, enemy_color = ENEMY_KILL_REWARDS.get(enemy['type'], (0, YELLOW))
+                    self.score += points
+                    self.explode(enemy['x'] + enemy['width'] // 2, enemy['y'] + enemy['height'] // 2, color=enemy_color)
+                    self.emit("sound", "explosion")
+                    dead_enemies.add(enemy_idx)
+                hit_enemy = True
+                break
+            if not hit_enemy and boss_rect is not None and bullet_rect.colliderect(boss_rect):
+                self.boss_data['health'] -= 1
+                self.explode(
+                    bullet_rect.centerx,
+                    bullet_rect.centery,
+                    color=(255, 110, 140),
+                    num_particles=10,
+                )
+                if self.boss_data['health'] <= 0:
+                    boss_defeated_this_frame = True
+                hit_enemy = True
+            if not hit_enemy:
+                new_bullet_list.append(bullet)
+        self.bullet_list = new_bullet_list
+
+        if not boss_defeated_this_frame:
+            return False
+        boss_data = self.boss_data
+        self.boss_active = False
+        self.boss_defeated = True
+        self.boss_projectiles.clear()
+        self.explode(
+            boss_data['x'] + boss_data['width'] // 2,
+            boss_data['y'] + boss_data['height'] // 2,
+            color=RED,
+            num_particles=120,
+        )
+        self.emit("sound", "explosion")
+        if "ingredient_fragment_croquette" not in self.ingredients_collected:
+            self.add_ingredient("ingredient_fragment_croquette")
+        self.clear_entities()
+        self.emit("final_win")
+        return True
+
+    def _collide_player(self, dead_enemies: set[int]) -> None:
+        now = self.now
+        grid = self.grid
+        player_rect = self.player_rect()
+        enemy_list = self.enemy_list
+        invulnerable = self.shield_active or self.hyper_active
+
+        # Collision entre AstroPaws et les ennemis (même grille, ennemis détruits ignorés)
+        for enemy_idx in grid.collisions("enemy", player_rect, dead_enemies):
+            enemy = enemy_list[enemy_idx]
+            dead_enemies.add(enemy_idx)
+            # Bouclier ou Hyperdrive actif : invincibilité temporaire
+            if invulnerable:
+                self.explode(
+                    enemy['x'] + enemy['width'] // 2,
+                    enemy['y'] + enemy['height'] // 2,
+                    color=CYAN if self.shield_active else YELLOW,
+                    num_particles=20 if self.shield_active else 30,
+                )
+                self.emit("sound", "explosion")
+                continue
+            self.astro_hit_flash_until = now + ASTRO_HIT_FLASH_DURATION
+            if enemy['type'] == "dog":
+                self.lives -= 1
+                self.explode(self.astro_x + 25, self.astro_y + 25, color=(255, 0, 0), num_particles=50)
+                self.emit("sound", "explosion")
+                # Index du cœur retiré, pour l'animation du HUD
+                self.emit("life_lost", self.lives)
+            elif enemy['type'] == "rat":
+                self.score -= 10
+                self.explode(self.astro_x + 25, self.astro_y + 25)
+                self.emit("sound", "explosion")
+            else:  # mouse
+                self.score -= 5
+                self.explode(self.astro_x + 25, self.astro_y + 25)
+                self.emit("sound", "explosion")
+        if dead_enemies:
+            self.enemy_list = [enemy for idx, enemy in enumerate(enemy_list) if idx not in dead_enemies]
+
+        if not self.boss_active or not self.boss_data:
+            return
+        # Collision entre AstroPaws et les attaques du boss final.
+        boss_rect = self.boss_rect()
+        if player_rect.colliderect(boss_rect):
+            if invulnerable:
+                self.explode(
+                    boss_rect.centerx,
+                    boss_rect.centery,
+                    color=YELLOW if self.hyper_active else CYAN,
+                    num_particles=20,
+                )
+            elif now >= self.boss_contact_cooldown_until:
+                self.lives -= 1
+                self.boss_contact_cooldown_until = now + 900
+                self.astro_hit_flash_until = now + ASTRO_HIT_FLASH_DURATION
+                self.explode(self.astro_x + 25, self.astro_y + 25, color=RED, num_particles=45)
+                self.emit("sound", "explosion")
+
+        # Collision disque/rectangle vectorisée, sans passer par la grille.
+        projectiles = self.boss_projectiles
+        hit_projectiles = projectiles.collide_rect(player_rect)
+        for proj_idx in hit_projectiles:
+            if invulnerable:
+                proj_x, proj_y = projectiles.position(proj_idx)
+                self.explode(
+                    proj_x,
+                    proj_y,
+                    color=CYAN if self.shield_active else YELLOW,
+                    num_particles=12,
+                )
+            elif now >= self.boss_contact_cooldown_until:
+                self.lives -= 1
+                self.boss_contact_cooldown_until = now + 900
+                self.astro_hit_flash_until = now + ASTRO_HIT_FLASH_DURATION
+                self.explode(self.astro_x + 25, self.astro_y + 25, color=(255, 70, 90), num_particles=30)
+                self.emit("sound", "explosion")
+        projectiles.remove(hit_projectiles)
+
+    def _update_croquettes(self) -> None:
+        if self.boss_active:
+            self.croquette_list.clear()
+            return
+        now = self.now
+        self.croquette_list = [
+            croquette
+            for croquette in self.croquette_list
+            if now - croquette['spawn_time'] < CROQUETTE_LIFETIME
+        ]
+        # Apparition de nouvelles croquettes
+        if self.croquette_rng.random() < 0.01:  # environ 1% de chance par frame
+            self.croquette_list.append(self.spawn_croquette())
+        if self.croquette_rain:
+            self._rain_croquettes()
+        self.mark_stage("spawns")
+
+        # Collision entre AstroPaws et les croquettes
+        croquette_rects = self.grid.build(
+            "croquette",
+            (
+                pygame.Rect((croquette['x'], croquette['y']), CROQUETTE_SPRITE_SIZES.get(croquette.get('type'), CROQUETTE_SPRITE_SIZES["normal"]))
+                for croquette in self.croquette_list
+            ),
+        )
+        eaten_croquettes = set(self.grid.collisions("croquette", self.player_rect()))
+        for croq_idx in sorted(eaten_croquettes):
+            croquette = self.croquette_list[croq_idx]
+            croquette_rect = croquette_rects[croq_idx]
+            self.emit("sound", "pickup")
+            if is_croquette_oxidized(croquette, self.level_idx, now):
+                self.score += OXIDIZED_BONUS_SCORE
+                self.water_ammo = max(0, self.water_ammo - OXIDIZED_WATER_PENALTY)
+                self.oxidized_debuff_until = now + OXIDIZED_DEBUFF_DURATION
+                self.explode(
+                    croquette_rect.centerx,
+                    croquette_rect.centery,
+                    color=(160, 220, 90),
+                    num_particles=18,
+                )
+            elif croquette.get('type') == "rare":
+                self.score += 10  # croquette rare désormais 10 points
+            else:
+                self.score += 3   # croquette normale désormais 3 points
+        if eaten_croquettes:
+            self.croquette_list = [
+                croquette for idx, croquette in enumerate(self.croquette_list) if idx not in eaten_croquettes
+            ]
+        self.mark_stage("collisions")
+
+    def _rain_croquettes(self) -> None:
+        height = self.height
+        falling = []
+        for croquette in self.croquette_list:
+            if 'vy' in croquette:
+                croquette['py'] = croquette['y']
+                croquette['y'] += croquette['vy']
+                if croquette['y'] > height:
+                    continue
+            falling.append(croquette)
+        self.croquette_list = falling
+        rng = self.croquette_rng
+        count = int(CROQUETTE_RAIN_PER_TICK)
+        if rng.random() < CROQUETTE_RAIN_PER_TICK - count:
+            count += 1
+        for _ in range(min(count, CROQUETTE_RAIN_MAX - len(self.croquette_list))):
+            self.croquette_list.append(self.spawn_rain_croquette())
+
+    def clear_entities(self) -> None:
+        self.enemy_list.clear()
+        self.bullet_list.clear()
+        self.croquette_list.clear()
+        self.water_item_list.clear()
+        self.hyper_item_list.clear()
+        self.astro_vx = 0.0
+        self.astro_vy = 0.0
+        self.astro_move_dx = 0.0
+        self.astro_move_dy = 0.0
+
+    def _check_level_target(self) -> bool:
+        # Vérifier si on atteint le score cible du niveau
+        level_conf = levels.levels[self.level_idx]
+        if self.score < level_conf['target_score'] or self.boss_active:
+            return False
+        is_last_level = self.level_idx == len(levels.levels) - 1
+        if is_last_level and self.boss_defeated:
+            return False
+        if is_last_level:
+            if level_conf['end_item'] not in self.ingredients_collected:
+                self.add_ingredient(level_conf['end_item'])
+            self.clear_entities()
+            self.astro_hit_flash_until = 0
+            self.start_boss_fight()
+            return True
+
+        # Niveau terminé : ingrédient gagné puis passage au niveau suivant.
+        finished_level = self.level_idx
+        self.add_ingredient(level_conf['end_item'])
+        self.level_idx += 1
+        self.clear_entities()
+        self.croquette_list = [self.spawn_croquette() for _ in range(INITIAL_CROQUETTES)]
+        self.game_start_time = None
+        self.hyper_active = False
+        self.hyper_start_time = None
+        self.astro_hit_flash_until = 0
+        self.emit("level_complete", finished_level)
+        return True
+
+    def _update_pickups(self) -> None:
+        now = self.now
+        rng = self.pickup_rng
+        player_rect = self.player_rect()
+        # Mise à jour des réserves d'eau (water items)
+        water_item_lifetime = 9000 if self.boss_active else 7000
+        self.water_item_list = [
+            item for item in self.water_item_list
+            if now - item['spawn_time'] < water_item_lifetime
+        ]
+        if self.boss_active:
+            self.hyper_item_list.clear()
+        else:
+            self.hyper_item_list = [
+                item for item in self.hyper_item_list
+                if now - item['spawn_time'] < HYPER_PICKUP_LIFETIME
+            ]
+
+        # Collision entre AstroPaws et les réserves d'eau
+        self.grid.build(
+            "water",
+            (pygame.Rect(item['x'], item['y'], WATER_ITEM_SIZE, WATER_ITEM_SIZE) for item in self.water_item_list),
+        )
+        picked_water = set(self.grid.collisions("water", player_rect))
+        for _ in picked_water:
+            self.water_ammo += 10
+            self.emit("water_pickup")
+            self.emit("sound", "pickup")
+        if picked_water:
+            self.water_item_list = [item for idx, item in enumerate(self.water_item_list) if idx not in picked_water]
+
+        # Apparition de nouvelles réserves d'eau
+        water_spawn_chance = get_water_pickup_spawn_chance(self.level_idx, self.boss_active, self.water_ammo)
+        if rng.random() < water_spawn_chance:
+            x = rng.randint(0, self.width - 10)
+            y = rng.randint(0, self.height - 10)
+            self.water_item_list.append({'x': x, 'y': y, 'spawn_time': now})
+
+        # Collision entre AstroPaws et les pickups Hyperdrive
+        size = HYPER_PICKUP_SIZE
+        self.grid.build(
+            "hyper",
+            (pygame.Rect(item['x'], item['y'], size, size) for item in self.hyper_item_list),
+        )
+        picked_hyper = set(self.grid.collisions("hyper", player_rect))
+        for item_idx in sorted(picked_hyper):
+            item = self.hyper_item_list[item_idx]
+            self.hyper_charges += 1
+            self.hyper_unlocked = True
+            self.hyper_last_granted_time = now
+            self.emit("hyper_inventory")
+            self.explode(item['x'] + size // 2, item['y'] + size // 2, color=YELLOW, num_particles=25)
+            self.emit("sound", "hyper_pickup")
+        if picked_hyper:
+            self.hyper_item_list = [item for idx, item in enumerate(self.hyper_item_list) if idx not in picked_hyper]
+
+        # Apparition des pickups Hyperdrive (niveau qui porte l'item Hyperdrive)
+        level_conf = levels.levels[self.level_idx]
+        if (
+            not self.boss_active
+            and level_conf.get('item', {}).get('type') == 'hyperdrive'
+            and len(self.hyper_item_list) < 1
+            and rng.random() < HYPER_PICKUP_SPAWN_CHANCE
+        ):
+            x = rng.randint(0, self.width - size)
+            y = rng.randint(0, self.height - size)
+            self.hyper_item_list.append({'x': x, 'y': y, 'spawn_time': now})
@@ -0,0 +1,126 @@
+"""Grille spatiale uniforme (spatial hash) pour la phase large des collisions.
+
+Chaque frame, les entités d'une couche ("enemy", "projectile", "croquette"…)
+sont rangées dans les cellules qu'elles recouvrent. Une requête ne renvoie que
+les indices présents dans les cellules touchées par le rectangle demandé,
+triés dans l'ordre des listes d'origine : l'appelant garde la même sémantique
+qu'un parcours linéaire (« le premier ennemi touché consomme le tir »), avec un
+coût qui croît linéairement avec le nombre d'entités.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+import pygame
+
+DEFAULT_CELL_SIZE = 64
+# En dessous de ce nombre d'entités, le hachage coûte plus qu'un parcours direct.
+LINEAR_LAYER_MAX = 8
+
+
+class SpatialHashGrid:
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._layers: dict[str, dict[tuple[int, int], list[int]] | None] = {}
+        self._rects: dict[str, list[pygame.Rect]] = {}
+        self.queries = 0
+        self.candidates = 0
+
+    def clear(self, layer: str | None = None) -> None:
+        if layer is None:
+            self._layers.clear()
+            self._rects.clear()
+        else:
+            self._layers.pop(layer, None)
+            self._rects.pop(layer, None)
+
+    def _cell_span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        # right/bottom exclus : un rectangle collé au bord d'une cellule n'y entre pas.
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def build(self, layer: str, rects: Iterable[pygame.Rect]) -> list[pygame.Rect]:
+        """Reconstruit `layer` : l'indice de chaque rectangle est sa position."""
+        rects = list(rects)
+        self._rects[layer] = rects
+        if len(rects) <= LINEAR_LAYER_MAX:
+            # Petite couche : pas de cellules, la requête renvoie tous les indices.
+            self._layers[layer] = None
+            return rects
+        cells: dict[tuple[int, int], list[int]] = {}
+        size = self.cell_size
+        for index, rect in enumerate(rects):
+            left, top, w, h = rect
+            if w <= 0 or h <= 0:
+                continue
+            x0 = left // size
+            y0 = top // size
+            x1 = (left + w - 1) // size
+            y1 = (top + h - 1) // size
+            if x0 == x1 and y0 == y1:
+                # Cas courant : le rectangle tient dans une seule cellule.
+                bucket = cells.get((x0, y0))
+                if bucket is None:
+                    cells[(x0, y0)] = [index]
+                else:
+                    bucket.append(index)
+                continue
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [index]
+                    else:
+                        bucket.append(index)
+        self._layers[layer] = cells
+        return rects
+
+    def rects(self, layer: str) -> list[pygame.Rect]:
+        return self._rects.get(layer, [])
+
+    def query(self, layer: str, rect: pygame.Rect) -> list[int]:
+        """Indices candidats de `layer` proches de `rect`, par ordre croissant."""
+        self.queries += 1
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        cells = self._layers.get(layer)
+        if cells is None:
+            count = len(self._rects.get(layer, ()))
+            self.candidates += count
+            return list(range(count))
+        if not cells:
+            return []
+        x0, y0, x1, y1 = self._cell_span(rect)
+        if x0 == x1 and y0 == y1:
+            found = cells.get((x0, y0), ())
+            self.candidates += len(found)
+            return list(found)
+        seen: set[int] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    seen.update(bucket)
+        self.candidates += len(seen)
+        return sorted(seen)
+
+    def collisions(self, layer: str, rect: pygame.Rect, skip: set[int] | None = None) -> Iterator[int]:
+        """Indices de `layer` dont le rectangle chevauche réellement `rect`."""
+        rects = self._rects.get(layer, [])
+        for index in self.query(layer, rect):
+            if skip is not None and index in skip:
+                continue
+            if rect.colliderect(rects[index]):
+                yield index
+
+    def candidate_pairs(self, layer: str, query_rects: Iterable[pygame.Rect]) -> Iterator[tuple[int, int]]:
+        """Paires (requête, entité) en collision, dans l'ordre des deux listes."""
+        for query_index, rect in enumerate(query_rects):
+            for index in self.collisions(layer, rect):
+                yield query_index, index
@@ -0,0 +1,95 @@
+"""Cache LRU de surfaces pré-calculées (poses animées, variantes de sprites).
+
+Les surfaces sont indexées par une clé hashable (type, paramètres quantifiés…)
+et évincées dans l'ordre LRU dès que le budget mémoire est dépassé.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+
+def quantize(value: float, step: float) -> float:
+    """Arrondit `value` au multiple de `step` le plus proche."""
+    if step <= 0:
+        return value
+    return round(value / step) * step
+
+
+def surface_nbytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SurfaceCache:
+    def __init__(self, max_bytes: int, name: str = "cache") -> None:
+        self.name = name
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> pygame.Surface | None:
+        surface = self._entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface) -> pygame.Surface:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes_used -= surface_nbytes(previous)
+        self._entries[key] = surface
+        self.bytes_used += surface_nbytes(surface)
+        self._evict()
+        return surface
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], pygame.Surface]) -> pygame.Surface:
+        surface = self.get(key)
+        if surface is None:
+            surface = self.put(key, builder())
+        return surface
+
+    def warm(self, key: Hashable, builder: Callable[[], pygame.Surface]) -> bool:
+        # Pré-remplissage : ne compte ni hit ni miss.
+        if key in self._entries:
+            return False
+        self.put(key, builder())
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def _evict(self) -> None:
+        # On garde toujours au moins l'entrée la plus récente.
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _key, surface = self._entries.popitem(last=False)
+            self.bytes_used -= surface_nbytes(surface)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
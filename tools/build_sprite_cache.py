@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Pré-construit le cache des sprites d'AstroPaws (`.cache/sprites/`).
+
+Chaque sprite déclaré dans `assets.py` est décodé une fois, mis à sa taille
+en jeu puis stocké en RGBA brut, variantes dérivées comprises. Le jeu
+reconstruit seul les entrées manquantes ; cet outil évite simplement de
+payer ce coût au premier lancement (build, packaging, CI).
+
+    python3 tools/build_sprite_cache.py [--clean]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from assets import SpriteAssetCache  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clean", action="store_true", help="supprime le cache avant de le reconstruire")
+    args = parser.parse_args()
+
+    cache_dir = REPO_ROOT / ".cache" / "sprites"
+    if args.clean and cache_dir.exists():
+        shutil.rmtree(cache_dir)
+
+    pygame.init()
+    started = time.perf_counter()
+    cache = SpriteAssetCache(REPO_ROOT / "images", cache_dir)
+    count = cache.build_all()
+    cache.save_manifest()
+    elapsed = time.perf_counter() - started
+
+    stats = cache.stats()
+    print(f"Sprites: {count} ({stats['builds']} construits, {stats['cache_hits']} déjà à jour)")
+    print(f"Sources décodées: {stats['decoded_source_bytes'] / 1e6:.1f} Mo en {elapsed:.2f} s")
+    print(f"Cache: {cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,113 @@
+"""Enregistrement de la timeline des frames au format Trace Event (Chrome / Perfetto).
+
+`TraceRecorder` garde les derniers événements dans un tampon circulaire :
+une session de plusieurs heures occupe une mémoire bornée. `FrameProfiler`
+y écrit une tranche par frame (nommée d'après l'état de jeu) et une par
+étape ; le jeu y ajoute des événements ponctuels (changement de phase du
+boss, musique, fin de partie, sauvegarde des scores). `dump()` écrit les
+dernières secondes dans un fichier JSON lisible par chrome://tracing ou
+ui.perfetto.dev ; la sérialisation se fait hors de la boucle principale.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+# ~16 événements par frame à 60 FPS : environ deux minutes de timeline.
+DEFAULT_MAX_EVENTS = 120_000
+DEFAULT_DUMP_SECONDS = 60.0
+TRACE_PID = 1
+TRACE_TID = 1
+
+
+class TraceRecorder:
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        # (ph, nom, catégorie, ts µs, durée µs, args) : tuples compacts plutôt que dicts.
+        self.events: deque[tuple] = deque(maxlen=max_events)
+        self.active = False
+        self.recorded = 0
+        self.dumps = 0
+        self._origin = time.perf_counter()
+
+    def start(self) -> None:
+        self.active = True
+
+    def stop(self) -> None:
+        self.active = False
+
+    def clear(self) -> None:
+        self.events.clear()
+
+    def _us(self, seconds: float) -> float:
+        return (seconds - self._origin) * 1_000_000.0
+
+    def complete(self, name: str, category: str, start: float, end: float, args: dict | None = None) -> None:
+        """Tranche [start, end] (secondes perf_counter)."""
+        if not self.active:
+            return
+        self.events.append(("X", name, category, self._us(start), (end - start) * 1_000_000.0, args))
+        self.recorded += 1
+
+    def instant(self, name: str, category: str = "game", args: dict | None = None) -> None:
+        if not self.active:
+            return
+        self.events.append(("i", name, category, self._us(time.perf_counter()), 0.0, args))
+        self.recorded += 1
+
+    def snapshot(self, last_seconds: float = DEFAULT_DUMP_SECONDS) -> list[tuple]:
+        cutoff = self._us(time.perf_counter() - last_seconds)
+        return [event for event in self.events if event[3] >= cutoff]
+
+    def dump(self, path: str | os.PathLike, last_seconds: float = DEFAULT_DUMP_SECONDS, background: bool = True) -> Path:
+        """Écrit les `last_seconds` dernières secondes ; copie immédiate, écriture en thread."""
+        path = Path(path)
+        events = self.snapshot(last_seconds)
+        self.dumps += 1
+        if background:
+            threading.Thread(target=write_trace, args=(path, events), name="trace-dump", daemon=True).start()
+        else:
+            write_trace(path, events)
+        return path
+
+    def stats(self) -> dict:
+        return {
+            "name": "trace",
+            "active": self.active,
+            "buffered": len(self.events),
+            "capacity": self.events.maxlen,
+            "recorded": self.recorded,
+            "dumps": self.dumps,
+        }
+
+
+def to_trace_event(event: tuple) -> dict:
+    ph, name, category, ts, dur, args = event
+    trace_event = {"name": name, "cat": category, "ph": ph, "ts": round(ts, 1), "pid": TRACE_PID, "tid": TRACE_TID}
+    if ph == "X":
+        trace_event["dur"] = round(dur, 1)
+    else:
+        trace_event["s"] = "g"  # instantané global : trait vertical sur toute la timeline
+    if args:
+        trace_event["args"] = args
+    return trace_event
+
+
+def write_trace(path: Path, events: list[tuple]) -> None:
+    trace_events = [
+        {"name": "process_name", "ph": "M", "pid": TRACE_PID, "args": {"name": "AstroPaws"}},
+        {"name": "thread_name", "ph": "M", "pid": TRACE_PID, "tid": TRACE_TID, "args": {"name": "boucle principale"}},
+    ]
+    trace_events.extend(to_trace_event(event) for event in events)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, handle, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
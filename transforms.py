@@ -0,0 +1,83 @@
+"""Service de transformations mémoïsées (scale, smoothscale, rotate, rotozoom).
+
+Les écrans animés (INFO, intros, zoom d'ingrédient, récompense) dessinent
+chaque frame une version tournée ou redimensionnée du même sprite. Ici, chaque
+résultat est mis en cache sous la clé (opération, surface source, paramètres
+quantifiés) : les angles et facteurs sont arrondis à un pas imperceptible,
+si bien qu'une oscillation ne produit qu'une poignée de variantes, calculées
+une fois. La surface source fait partie de la clé (identité) : elle reste en
+vie tant qu'une de ses variantes est en cache, et un sprite rechargé ne
+réutilise jamais les variantes d'un autre.
+
+Toutes les variantes partagent un même budget en octets, évincé en LRU
+(voir sprite_cache.SurfaceCache). Les surfaces renvoyées sont partagées :
+l'appelant ne doit pas les modifier.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import pygame
+
+from sprite_cache import SurfaceCache, quantize
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+# Pas de quantification : en dessous, la différence ne se voit pas à l'écran.
+ANGLE_STEP_DEG = 0.5
+ZOOM_STEP = 0.01
+
+
+class TransformCache:
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        angle_step: float = ANGLE_STEP_DEG,
+        zoom_step: float = ZOOM_STEP,
+        name: str = "transforms",
+    ) -> None:
+        self.cache = SurfaceCache(max_bytes, name=name)
+        self.angle_step = angle_step
+        self.zoom_step = zoom_step
+        self.builds: dict[str, int] = {}
+
+    def _get(self, key: tuple, builder: Callable[[], pygame.Surface]) -> pygame.Surface:
+        surface = self.cache.get(key)
+        if surface is None:
+            surface = self.cache.put(key, builder())
+            self.builds[key[0]] = self.builds.get(key[0], 0) + 1
+        return surface
+
+    def scale(self, source: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        return self._get(("scale", source, size), lambda: pygame.transform.scale(source, size))
+
+    def smoothscale(self, source: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        return self._get(("smoothscale", source, size), lambda: pygame.transform.smoothscale(source, size))
+
+    def scale_by(self, source: pygame.Surface, factor: float) -> pygame.Surface:
+        """`scale` d'un facteur (quantifié), comme pour un pulse ou un zoom."""
+        factor = quantize(factor, self.zoom_step)
+        width, height = source.get_size()
+        return self.scale(source, (width * factor, height * factor))
+
+    def rotate(self, source: pygame.Surface, angle: float) -> pygame.Surface:
+        angle = quantize(angle, self.angle_step)
+        return self._get(("rotate", source, angle), lambda: pygame.transform.rotate(source, angle))
+
+    def rotozoom(self, source: pygame.Surface, angle: float, zoom: float) -> pygame.Surface:
+        angle = quantize(angle, self.angle_step)
+        zoom = quantize(zoom, self.zoom_step)
+        return self._get(("rotozoom", source, angle, zoom), lambda: pygame.transform.rotozoom(source, angle, zoom))
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self.cache
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> dict:
+        stats = self.cache.stats()
+        stats["builds"] = dict(self.builds)
+        return stats
@@ -0,0 +1,131 @@
+"""Pré-chauffage des caches de rendu en tâche de fond.
+
+Pendant les écrans d'intro (LEVEL_INTRO, BOSS_INTRO), le jeu attend que le
+joueur appuie sur C. `BackgroundWarmup` profite de ce temps mort : un petit
+pool de threads construit les surfaces dont les premières frames de jeu
+auront besoin (poses des ennemis du niveau, sprite du boss…). Les
+transformations de pygame (rotozoom, smoothscale) relâchent le GIL pendant
+le calcul des pixels, l'écran d'intro reste donc fluide.
+
+Les threads ne font que construire : les surfaces sont remises aux caches
+par `pump()`, depuis la boucle principale, seule à modifier les caches.
+`wait()` ne bloque que si le joueur confirme avant la fin du travail.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+# (construction exécutée dans un thread, publication dans la boucle principale)
+WarmupTask = tuple[Callable[[], Any], Callable[[Any], None]]
+
+DEFAULT_MAX_WORKERS = 2
+
+
+class BackgroundWarmup:
+    """Pool de pré-chauffage : un travail nommé à la fois.
+
+    Une surface lue par une tâche ne doit jamais être blittée par la boucle
+    principale tant que le travail tourne : les transformations verrouillent
+    leur source, et un blit de surface verrouillée lève `pygame.error`. Les
+    tâches reçoivent donc une copie privée (`Surface.copy()`, faite dans la
+    boucle principale) des sprites et des résultats mémoïsés partagés.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        if max_workers is None:
+            max_workers = max(1, min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1))
+        self.max_workers = max_workers
+        self.job_name: str | None = None
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.jobs_started = 0
+        self.waits = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[tuple[Future, Callable[[Any], None]]] = []
+
+    def start(self, job_name: str, tasks: Iterable[WarmupTask]) -> bool:
+        """Lance `job_name` s'il n'est pas déjà le travail en cours."""
+        if job_name == self.job_name:
+            return False
+        self.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="warmup")
+        self.job_name = job_name
+        self.jobs_started += 1
+        for build, commit in tasks:
+            self._pending.append((self._executor.submit(build), commit))
+        self.total = len(self._pending)
+        self.completed = 0
+        self.failed = 0
+        return True
+
+    def _commit(self, future: Future, commit: Callable[[Any], None]) -> None:
+        try:
+            result = future.result()
+        except Exception:  # une pose ratée sera simplement construite en jeu
+            self.failed += 1
+        else:
+            commit(result)
+        self.completed += 1
+
+    def pump(self) -> int:
+        """Publie les résultats déjà prêts ; renvoie leur nombre."""
+        if not self._pending:
+            return 0
+        still_running = []
+        published = 0
+        for future, commit in self._pending:
+            if future.done():
+                self._commit(future, commit)
+                published += 1
+            else:
+                still_running.append((future, commit))
+        self._pending = still_running
+        return published
+
+    def wait(self) -> None:
+        """Attend la fin du travail en cours (le joueur a confirmé trop tôt)."""
+        if self._pending:
+            self.waits += 1
+        for future, commit in self._pending:
+            self._commit(future, commit)
+        self._pending = []
+
+    def cancel(self) -> None:
+        for future, _commit in self._pending:
+            future.cancel()
+        self._pending = []
+        self.job_name = None
+        self.total = 0
+        self.completed = 0
+
+    def shutdown(self) -> None:
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def finished(self) -> bool:
+        return not self._pending
+
+    @property
+    def progress(self) -> float:
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    def stats(self) -> dict:
+        return {
+            "name": "warmup",
+            "job": self.job_name,
+            "progress": round(self.progress, 3),
+            "tasks": self.total,
+            "failed": self.failed,
+            "jobs_started": self.jobs_started,
+            "blocking_waits": self.waits,
+        }